@@ -3,10 +3,11 @@
 The Raster GIS module contains functions for attributing and manipulating
 raster attribute tables.
 """
+import contextlib
 import os
 import shutil
 import sys
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
 
 import numpy
 from osgeo import gdal
@@ -16,6 +17,12 @@ import rsgislib
 # import the C++ extension into this level
 from ._rastergis import *
 
+TQDM_AVAIL = True
+try:
+    import tqdm
+except ImportError:
+    TQDM_AVAIL = False
+
 
 class BandAttStats:
     """This is passed to the populate_rat_with_stats function"""
@@ -92,7 +99,9 @@ def export_cols_to_gdal_img(
 ):
     """
     Exports columns of the raster attribute table as bands in a GDAL image.
-    Utility function, exports each column individually then stacks them.
+    Utility function, the columns are read from the RAT as look up tables and
+    written to the bands of the output image in a single pass through the clumps
+    image.
 
     :param clumps_img: is a string containing the name of the input image file with RAT
     :param output_img: is a string containing the name of the output gdal file
@@ -102,6 +111,8 @@ def export_cols_to_gdal_img(
     :param field: is a list of strings, providing the names of the column to be exported
     :param rat_band: is an optional (default = 1) integer parameter specifying the
                      image band to which the RAT is associated.
+    :param tmp_dir: no longer used as no intermediate files are created. The
+                    parameter is retained for backwards compatibility.
 
     Example:
 
@@ -117,49 +128,90 @@ def export_cols_to_gdal_img(
                                            datatype, fields)
 
     """
-    import os
+    from rios import applier, rat
 
     import rsgislib.imageutils
-    import rsgislib.tools.filetools
 
-    if tmp_dir is None:
-        tmp_dir = os.path.split(output_img)[0]
-
-    out_ext = os.path.splitext(output_img)[-1]
-    tmp_file_list = []
+    if TQDM_AVAIL:
+        progress_bar = rsgislib.TQDMProgressBar()
+    else:
+        import rios.cuiprogress
 
-    # Export each field
-    for field in fields:
-        print("Exporting: " + field)
-        out_temp_file = os.path.join(tmp_dir, field + out_ext)
-        export_col_to_gdal_img(
-            clumps_img, out_temp_file, gdalformat, datatype, field, rat_band
-        )
-        tmp_file_list.append(out_temp_file)
+        progress_bar = rios.cuiprogress.GDALProgressBar()
 
-    # Stack Bands
-    print("Stacking Bands")
-    rsgislib.imageutils.stack_img_bands(
-        tmp_file_list, fields, output_img, None, 0, gdalformat, datatype
+    clumps_img_ds, clumps_img_band, clumps_img_rat = _open_clumps_rat(
+        clumps_img, rat_band
     )
+    rat_columns = [
+        clumps_img_rat.GetNameOfCol(col_idx)
+        for col_idx in range(clumps_img_rat.GetColumnCount())
+    ]
+    n_rows = clumps_img_rat.GetRowCount()
+    clumps_img_ds = None
 
-    # Remove temp files
-    print("Removing temp files")
-    for tmp_file in tmp_file_list:
-        rsgislib.tools.filetools.delete_file_with_basename(tmp_file)
-
+    for field in fields:
+        if field not in rat_columns:
+            raise rsgislib.RSGISPyException(
+                "Column '{}' is not within the RAT.".format(field)
+            )
 
-def get_rat_length(clumps_img: str, rat_band: int = 1) -> int:
+    # Read the columns as look up tables, indexed using the clump ID.
+    col_luts = numpy.zeros(
+        (len(fields), n_rows), dtype=rsgislib.get_numpy_datatype(datatype)
+    )
+    for i, field in enumerate(fields):
+        print("Reading: " + field)
+        col_luts[i] = rat.readColumn(clumps_img, field, rat_band)
+
+    infiles = applier.FilenameAssociations()
+    infiles.clumps = clumps_img
+    outfiles = applier.FilenameAssociations()
+    outfiles.out_image = output_img
+    otherargs = applier.OtherInputs()
+    otherargs.col_luts = col_luts
+    aControls = applier.ApplierControls()
+    aControls.progress = progress_bar
+    aControls.creationoptions = rsgislib.imageutils.get_rios_img_creation_opts(
+        gdalformat
+    )
+    aControls.drivername = gdalformat
+    aControls.omitPyramids = True
+    aControls.calcStats = False
+    aControls.selectInputImageLayers([rat_band], imagename="clumps")
+
+    def _export_cols(info, inputs, outputs, otherargs):
+        """
+        This is an internal rios function for export_cols_to_gdal_img()
+        """
+        clump_ids = inputs.clumps[0]
+        # Clumps with a value of zero or outside the RAT are given a value of zero.
+        n_rows = otherargs.col_luts.shape[1]
+        valid_msk = (clump_ids > 0) & (clump_ids < n_rows)
+        clump_ids = numpy.where(valid_msk, clump_ids, 0).astype(numpy.intp)
+        out_arr = otherargs.col_luts[:, clump_ids]
+        out_arr[:, ~valid_msk] = 0
+        outputs.out_image = out_arr
+
+    print("Exporting Columns")
+    applier.apply(_export_cols, infiles, outfiles, otherargs, controls=aControls)
+    rsgislib.imageutils.set_img_no_data_value(output_img, 0)
+    rsgislib.imageutils.set_band_names(output_img, fields)
+
+
+def _open_clumps_rat(clumps_img: str, rat_band: int = 1):
     """
-    A function which returns the length (i.e., number of rows) within the RAT.
+    A function which opens (read-only) an image file and gets the RAT for the
+    specified band. The dataset and band are also returned as the RAT is only
+    valid while the dataset remains open.
 
     :param clumps_img: path to the image file with the RAT
     :param rat_band: the band within the image file for which the RAT is to read.
-    :returns: an int with the number of rows.
+    :returns: tuple (gdal.Dataset, gdal.Band, gdal.RasterAttributeTable)
 
     """
-    # Open input image file
-    clumps_img_ds = gdal.Open(clumps_img, gdal.GA_ReadOnly)
+    # Open input image file, only raster drivers need to be probed. Note, the
+    # PAM (.aux.xml) files are not disabled as they can contain the RAT.
+    clumps_img_ds = gdal.OpenEx(clumps_img, gdal.OF_READONLY | gdal.OF_RASTER)
     if clumps_img_ds is None:
         raise rsgislib.RSGISPyException("Could not open the inputted clumps image.")
 
@@ -174,6 +226,21 @@ def get_rat_length(clumps_img: str, rat_band: int = 1) -> int:
         raise rsgislib.RSGISPyException(
             "Could not open the inputted clumps image band RAT."
         )
+    return clumps_img_ds, clumps_img_band, clumps_img_rat
+
+
+def get_rat_length(clumps_img: str, rat_band: int = 1) -> int:
+    """
+    A function which returns the length (i.e., number of rows) within the RAT.
+
+    :param clumps_img: path to the image file with the RAT
+    :param rat_band: the band within the image file for which the RAT is to read.
+    :returns: an int with the number of rows.
+
+    """
+    clumps_img_ds, clumps_img_band, clumps_img_rat = _open_clumps_rat(
+        clumps_img, rat_band
+    )
 
     nrows = clumps_img_rat.GetRowCount()
 
@@ -190,22 +257,9 @@ def get_rat_columns(clumps_img: str, rat_band: int = 1) -> List[str]:
     :returns: list of column names.
 
     """
-    # Open input image file
-    clumps_img_ds = gdal.Open(clumps_img, gdal.GA_ReadOnly)
-    if clumps_img_ds is None:
-        raise rsgislib.RSGISPyException("Could not open the inputted clumps image.")
-
-    clumps_img_band = clumps_img_ds.GetRasterBand(rat_band)
-    if clumps_img_band is None:
-        raise rsgislib.RSGISPyException(
-            "Could not open the inputted clumps image band."
-        )
-
-    clumps_img_rat = clumps_img_band.GetDefaultRAT()
-    if clumps_img_rat is None:
-        raise rsgislib.RSGISPyException(
-            "Could not open the inputted clumps image band RAT."
-        )
+    clumps_img_ds, clumps_img_band, clumps_img_rat = _open_clumps_rat(
+        clumps_img, rat_band
+    )
 
     ncols = clumps_img_rat.GetColumnCount()
     col_names = []
@@ -227,32 +281,18 @@ def get_rat_columns_info(clumps_img: str, rat_band: int = 1):
     :returns: dict of column information.
 
     """
-    # Open input image file
-    clumps_img_ds = gdal.Open(clumps_img, gdal.GA_ReadOnly)
-    if clumps_img_ds is None:
-        raise rsgislib.RSGISPyException("Could not open the inputted clumps image.")
-
-    clumps_img_band = clumps_img_ds.GetRasterBand(rat_band)
-    if clumps_img_band is None:
-        raise rsgislib.RSGISPyException(
-            "Could not open the inputted clumps image band."
-        )
-
-    clumps_img_rat = clumps_img_band.GetDefaultRAT()
-    if clumps_img_rat is None:
-        raise rsgislib.RSGISPyException(
-            "Could not open the inputted clumps image band RAT."
-        )
+    clumps_img_ds, clumps_img_band, clumps_img_rat = _open_clumps_rat(
+        clumps_img, rat_band
+    )
 
     ncols = clumps_img_rat.GetColumnCount()
-    col_info = dict()
-    for col_idx in range(ncols):
-        col_name = clumps_img_rat.GetNameOfCol(col_idx)
-        col_type = clumps_img_rat.GetTypeOfCol(col_idx)
-        col_usage = clumps_img_rat.GetUsageOfCol(col_idx)
-        col_info[col_name] = dict()
-        col_info[col_name]["type"] = col_type
-        col_info[col_name]["usage"] = col_usage
+    col_names = [clumps_img_rat.GetNameOfCol(col_idx) for col_idx in range(ncols)]
+    col_types = [clumps_img_rat.GetTypeOfCol(col_idx) for col_idx in range(ncols)]
+    col_usages = [clumps_img_rat.GetUsageOfCol(col_idx) for col_idx in range(ncols)]
+    col_info = {
+        col_name: {"type": col_type, "usage": col_usage}
+        for col_name, col_type, col_usage in zip(col_names, col_types, col_usages)
+    }
 
     clumps_img_ds = None
     return col_info
@@ -401,9 +441,47 @@ def get_column_data(clumps_img: str, col_name: str) -> numpy.array:
     return col_data
 
 
+@contextlib.contextmanager
+def open_rat_neighbours(clumps_img: str, rat_band: int = 1):
+    """
+    A context manager which opens (read-only) the neighbours dataset within a KEA
+    RAT. This allows subsets of the neighbours to be read (see read_rat_neighbours)
+    without reopening the file for each subset. The file is opened with a large
+    chunk cache so consecutive reads don't decompress the same chunks again.
+
+    :param clumps_img: path to the image file with the RAT
+    :param rat_band: the band within the image file for which the RAT is to read.
+    :returns: the h5py.Dataset for the neighbours, which is only valid within
+              the with block.
+
+    Example:
+
+    .. code:: python
+
+       import rsgislib.rastergis
+       clumps_img = "clumps.kea"
+       n_rows = rsgislib.rastergis.get_rat_length(clumps_img)
+       with rsgislib.rastergis.open_rat_neighbours(clumps_img) as neighbours:
+           for start_row in range(0, n_rows, 10000):
+               neighbours_data = neighbours[start_row : start_row + 10000]
+
+    """
+    import h5py
+
+    with h5py.File(
+        clumps_img, "r", rdcc_nbytes=128 * 1024 * 1024, rdcc_nslots=1000003
+    ) as clumps_h5_file:
+        neighbours_path = "BAND{}/ATT/NEIGHBOURS/NEIGHBOURS".format(rat_band)
+        yield clumps_h5_file[neighbours_path]
+
+
 def read_rat_neighbours(
-    clumps_img: str, start_row: int = None, end_row: int = None, rat_band: int = 1
-) -> List[List[int]]:
+    clumps_img: str,
+    start_row: int = None,
+    end_row: int = None,
+    rat_band: int = 1,
+    concat: bool = False,
+) -> Union[List[List[int]], Tuple[numpy.array, numpy.array]]:
     """
     A function which returns a list of clumps neighbours from a KEA RAT. Note, the
     neighbours are popualted using the function rsgislib.rastergis.findNeighbours.
@@ -416,34 +494,103 @@ def read_rat_neighbours(
     :param end_row: the row within the RAT to end reading, if None will end at n_rows
                     within the RAT. (Default: None)
     :param rat_band: the band within the image file for which the RAT is to read.
-    :returns: list of lists with neighbour indexes.
+    :param concat: If True then the neighbours are returned as two flat arrays
+                   (i.e., compressed sparse row format): an array of all the
+                   neighbour indexes and an array of offsets, where the neighbours
+                   of row i are flat_idxs[offsets[i]:offsets[i+1]]. (Default: False)
+    :returns: list of lists with neighbour indexes or if concat is True a tuple
+              of numpy arrays (flat_idxs, offsets).
     """
-    import h5py
+    # Open the RAT once to check the columns and get the number of rows.
+    clumps_img_ds, clumps_img_band, clumps_img_rat = _open_clumps_rat(
+        clumps_img, rat_band
+    )
+    rat_columns = [
+        clumps_img_rat.GetNameOfCol(col_idx)
+        for col_idx in range(clumps_img_rat.GetColumnCount())
+    ]
+    n_rows = clumps_img_rat.GetRowCount()
+    clumps_img_ds = None
 
     # Check that 'NumNeighbours' column exists
-    rat_columns = get_rat_columns(clumps_img, rat_band)
     if "NumNeighbours" not in rat_columns:
         raise rsgislib.RSGISPyException(
             "Clumps image RAT does not contain 'NumNeighbours' "
             "column - have you populated neightbours?"
         )
 
-    n_rows = get_rat_length(clumps_img)
-
     if start_row is None:
         start_row = 0
 
     if end_row is None:
         end_row = n_rows
 
-    clumps_h5_file = h5py.File(clumps_img)
-    neighbours_path = "BAND{}/ATT/NEIGHBOURS/NEIGHBOURS".format(rat_band)
-    neighbours = clumps_h5_file[neighbours_path]
-    neighbours_data = neighbours[start_row:end_row]
-    clumps_h5_file = None
+    with open_rat_neighbours(clumps_img, rat_band) as neighbours:
+        # Clamp the rows to the dataset, as a slice would, so an end_row beyond
+        # the dataset or an inverted range reads what is available (or nothing).
+        end_row = min(end_row, neighbours.shape[0])
+        start_row = min(start_row, end_row)
+        neighbours_data = numpy.empty(end_row - start_row, dtype=neighbours.dtype)
+        if end_row > start_row:
+            neighbours.read_direct(
+                neighbours_data,
+                source_sel=numpy.s_[start_row:end_row],
+                dest_sel=numpy.s_[:],
+            )
+
+    if concat:
+        n_neighbours = numpy.fromiter(
+            (len(row_neighbours) for row_neighbours in neighbours_data),
+            dtype=numpy.int64,
+            count=len(neighbours_data),
+        )
+        offsets = numpy.zeros(len(neighbours_data) + 1, dtype=numpy.int64)
+        numpy.cumsum(n_neighbours, out=offsets[1:])
+        if len(neighbours_data) > 0:
+            flat_idxs = numpy.concatenate(neighbours_data).astype(numpy.int32)
+        else:
+            flat_idxs = numpy.zeros(0, dtype=numpy.int32)
+        return flat_idxs, offsets
     return neighbours_data
 
 
+def _clean_str_bytes(
+    in_bytes: numpy.array,
+    byte_lut: numpy.array,
+    collapse_unders: bool,
+    out_bytes: numpy.array,
+):
+    """
+    An internal function used by check_string_col_valid (compiled with numba)
+    which maps the bytes of each string (row) using a look up table, where a value
+    of -1 removes the byte, optionally collapsing repeated underscores.
+
+    :param in_bytes: 2D uint8 array (n_strs, str_width) of null padded strings.
+    :param byte_lut: int16 array of 256 values mapping the input to output bytes.
+    :param collapse_unders: If True repeated underscores are collapsed to one.
+    :param out_bytes: zeroed 2D uint8 array, same shape as in_bytes, for the output.
+
+    """
+    for i in range(in_bytes.shape[0]):
+        k = 0
+        prev_under = False
+        for j in range(in_bytes.shape[1]):
+            in_byte = in_bytes[i, j]
+            if in_byte == 0:
+                break
+            out_byte = byte_lut[in_byte]
+            if out_byte < 0:
+                continue
+            if out_byte == 95:
+                if collapse_unders and prev_under:
+                    continue
+                prev_under = True
+            else:
+                prev_under = False
+            out_bytes[i, k] = out_byte
+            k += 1
+
+
 def check_string_col_valid(
     clumps_img: str,
     str_col: str,
@@ -466,30 +613,97 @@ def check_string_col_valid(
     :param rm_dashs: If True then dashs are removed from the column name.
 
     """
+    import re
+    import string
+
     import numpy
     from rios import ratapplier
 
-    import rsgislib.tools.utils
+    def _decode_str_val(str_val):
+        try:
+            return str_val.decode("utf-8")
+        except:
+            return ""
 
     def _ratapplier_check_string_col_valid(info, inputs, outputs, otherargs):
         str_col_vals = getattr(inputs.inrat, otherargs.str_col)
-        out_col_vals = numpy.empty_like(str_col_vals)
-        for i in range(str_col_vals.shape[0]):
-            try:
-                str_val_tmp = str_col_vals[i].decode("utf-8")
-            except:
-                str_val_tmp = ""
-            str_val_tmp = str_val_tmp.strip()
-            str_val_tmp = rsgislib.tools.utils.check_str(
-                str_val_tmp,
-                rm_non_ascii=rm_non_ascii,
-                rm_dashs=rm_dashs,
-                rm_spaces=rm_spaces,
-                rm_punc=rm_punc,
+        try:
+            str_vals = numpy.char.decode(str_col_vals, "utf-8")
+        except UnicodeDecodeError:
+            # Values which cannot be decoded are replaced with an empty string.
+            str_vals = numpy.array(
+                [_decode_str_val(str_val) for str_val in str_col_vals], dtype=str
+            )
+        str_vals = numpy.char.strip(str_vals)
+        if otherargs.clean_str_bytes_func is not None:
+            # Process the utf-8 bytes of the fixed width strings as a 2D array.
+            str_bytes = numpy.char.encode(str_vals, "utf-8")
+            in_bytes = str_bytes.view(numpy.uint8).reshape(
+                str_bytes.shape[0], str_bytes.dtype.itemsize
             )
-            out_col_vals[i] = str_val_tmp
+            out_bytes = numpy.zeros_like(in_bytes)
+            otherargs.clean_str_bytes_func(
+                in_bytes, otherargs.byte_lut, otherargs.collapse_unders, out_bytes
+            )
+            out_col_vals = out_bytes.view(str_bytes.dtype).reshape(str_bytes.shape[0])
+        else:
+            if otherargs.rm_non_ascii:
+                str_vals = numpy.char.decode(
+                    numpy.char.encode(str_vals, "ascii", "ignore"), "ascii"
+                )
+            if otherargs.trans_table is not None:
+                str_vals = numpy.char.translate(str_vals, otherargs.trans_table)
+            if otherargs.collapse_func is not None:
+                str_vals = otherargs.collapse_func(str_vals).astype(str)
+            out_col_vals = numpy.char.encode(str_vals, "utf-8")
         setattr(outputs.outrat, otherargs.str_col, out_col_vals)
 
+    # Each of the checks (see rsgislib.tools.utils.check_str) maps a single
+    # character to either nothing or an underscore so they can be combined into
+    # a single translation table, with non-ascii characters removed by encoding.
+    del_chars = ""
+    if rm_non_ascii:
+        # Also remove the non-printable ascii characters (e.g., tabs).
+        valid_chars = string.ascii_letters + string.digits + string.punctuation + " "
+        del_chars += "".join(chr(i) for i in range(128) if chr(i) not in valid_chars)
+    if rm_punc:
+        del_chars += string.punctuation.replace("_", "").replace("-", "")
+    under_chars = ""
+    if rm_dashs:
+        under_chars += "-"
+    if rm_spaces:
+        under_chars += " "
+    trans_table = None
+    if (del_chars != "") or (under_chars != ""):
+        trans_table = str.maketrans(under_chars, "_" * len(under_chars), del_chars)
+
+    collapse_func = None
+    if rm_dashs or rm_spaces or rm_punc:
+        under_pat = re.compile("_{2,}")
+
+        def _collapse_unders(str_val):
+            return under_pat.sub("_", str_val)
+
+        collapse_func = numpy.frompyfunc(_collapse_unders, 1, 1)
+
+    # If numba is available the translation is applied to the utf-8 bytes using a
+    # compiled function with a byte look up table (-1 removes the byte).
+    try:
+        import numba
+
+        clean_str_bytes_func = numba.njit(cache=True)(_clean_str_bytes)
+    except ImportError:
+        clean_str_bytes_func = None
+
+    byte_lut = numpy.arange(256, dtype=numpy.int16)
+    if rm_non_ascii:
+        # Non-ascii characters are encoded as multiple bytes all >= 128.
+        byte_lut[128:] = -1
+    for del_char in del_chars:
+        byte_lut[ord(del_char)] = -1
+    for under_char in under_chars:
+        byte_lut[ord(under_char)] = ord("_")
+
     in_rats = ratapplier.RatAssociations()
     out_rats = ratapplier.RatAssociations()
 
@@ -498,6 +712,12 @@ def check_string_col_valid(
 
     otherargs = ratapplier.OtherArguments()
     otherargs.str_col = str_col
+    otherargs.rm_non_ascii = rm_non_ascii
+    otherargs.trans_table = trans_table
+    otherargs.collapse_func = collapse_func
+    otherargs.clean_str_bytes_func = clean_str_bytes_func
+    otherargs.byte_lut = byte_lut
+    otherargs.collapse_unders = collapse_func is not None
 
     ratapplier.apply(_ratapplier_check_string_col_valid, in_rats, out_rats, otherargs)
 
@@ -800,12 +1020,10 @@ def _computeProximityArrArgsFunc(arg_vals: list):
     )
     dist_img_ds = gdal.Open(arg_vals[1], gdal.GA_Update)
     dist_img_band = dist_img_ds.GetRasterBand(1)
-    try:
-        import tqdm
-
+    if TQDM_AVAIL:
         pbar = tqdm.tqdm(total=100)
         callback = lambda *args, **kw: pbar.update()
-    except:
+    else:
         callback = gdal.TermProgress
     gdal.ComputeProximity(class_img_band, dist_img_band, arg_vals[2], callback=callback)
     dist_img_band = None
@@ -3,16 +3,25 @@
 The tools.httptools
 """
 import json
+import math
 import os
-from typing import Dict
+import shutil
+from typing import Dict, List
 
 import requests
 import tqdm
+from requests.adapters import HTTPAdapter
 
 import rsgislib
 import rsgislib.tools.filetools
 import rsgislib.tools.utils
 
+ORJSON_AVAIL = True
+try:
+    import orjson
+except ImportError:
+    ORJSON_AVAIL = False
+
 
 class RSGISPyResponseException(rsgislib.RSGISPyException):
     def __init__(self, value, response=None):
@@ -31,6 +40,13 @@ class RSGISPyResponseException(rsgislib.RSGISPyException):
         )
 
 
+# A session is shared between calls to check_url_exists so connections
+# (and TLS sessions) to the same host are reused.
+_URL_CHECK_SESSION = requests.Session()
+_URL_CHECK_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_URL_CHECK_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+
 def check_url_exists(url: str) -> bool:
     """
     A function which checks whether a url exists on a remote server (i.e., does
@@ -40,10 +56,28 @@ def check_url_exists(url: str) -> bool:
     :return: boolean, true is url exists
 
     """
-    r = requests.head(url)
+    r = _URL_CHECK_SESSION.head(url, allow_redirects=False)
     return r.status_code == requests.codes.ok
 
 
+def check_urls_exist(urls: List[str], n_workers: int = 16) -> List[bool]:
+    """
+    A function which checks whether a list of urls exist on remote servers
+    (i.e., do not return a 404 or similar error code). The urls are checked
+    concurrently.
+
+    :param urls: list of URLs on the remote server(s).
+    :param n_workers: the number of URLs to check concurrently. (Default: 16)
+    :return: list of booleans, true if the url exists, in the same order as urls.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(n_workers, 1)) as executor:
+        urls_exist = list(executor.map(check_url_exists, urls))
+    return urls_exist
+
+
 def check_http_response(response: requests.Response, url: str) -> bool:
     """
     Check the HTTP response and raise an exception with appropriate error message
@@ -127,7 +161,14 @@ def send_http_json_request(
         elif http_status_code == 400:
             raise rsgislib.RSGISPyException(f"Error Code: {http_status_code}")
 
-        output = json.loads(response.text)
+        if ORJSON_AVAIL:
+            try:
+                output = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json (e.g., NaN and Infinity).
+                output = json.loads(response.content)
+        else:
+            output = response.json()
     except Exception as e:
         response.close()
         raise rsgislib.RSGISPyException(f"{e}")
@@ -142,6 +183,7 @@ def download_file_http(
     username: str = None,
     password: str = None,
     no_except: bool = True,
+    input_url_md5: str = None,
 ):
     """
     A function which downloads a file from an URL and saves it to a local file.
@@ -153,8 +195,14 @@ def download_file_http(
     :param username: optionally provided a username (Default: None)
     :param password: optionally provided a password (Default: None)
     :param no_except: If True (Default) then expections are not outputted.
+    :param input_url_md5: optionally the MD5 hash string for the file. If provided
+                          the MD5 is calculated as the file is downloaded and if
+                          it does not match the download is considered to have
+                          failed. (Default: None)
 
     """
+    import hashlib
+
     session_http = requests.Session()
     if (username is not None) and (password is not None):
         session_http.auth = (username, password)
@@ -171,15 +219,34 @@ def download_file_http(
         ) as r:
             if check_http_response(r, input_url):
                 total = int(r.headers.get("content-length", 0))
-                chunk_size = 2**20
-                n_chunks = int(total / chunk_size) + 1
-
+                # The content-length is the encoded size but the progress is
+                # counted on the decoded (e.g., gunzipped) data.
+                if (total == 0) or (r.headers.get("content-encoding") is not None):
+                    total = None
+                chunk_size = 2**23
+
+                # Copy directly from the raw stream to reduce the per chunk overhead.
+                r.raw.decode_content = True
                 with open(tmp_dwnld_path, "wb") as f:
-                    for chunk in tqdm.tqdm(
-                        r.iter_content(chunk_size=chunk_size), total=n_chunks
-                    ):
-                        if chunk:  # filter out keep-alive new chunks
-                            f.write(chunk)
+                    with tqdm.tqdm.wrapattr(
+                        r.raw,
+                        "read",
+                        total=total,
+                        desc=os.path.basename(out_file_path),
+                    ) as r_raw:
+                        if input_url_md5 is None:
+                            shutil.copyfileobj(r_raw, f, length=chunk_size)
+                        else:
+                            # Hash the data as it is written to avoid re-reading
+                            # the file once downloaded.
+                            md5_hash = hashlib.md5()
+                            for chunk in iter(lambda: r_raw.read(chunk_size), b""):
+                                md5_hash.update(chunk)
+                                f.write(chunk)
+                            if md5_hash.hexdigest() != input_url_md5:
+                                raise rsgislib.RSGISPyException(
+                                    f"Downloaded file MD5 did not match: {input_url}"
+                                )
         if os.path.exists(tmp_dwnld_path):
             os.rename(tmp_dwnld_path, out_file_path)
             print(f"Download Complete: {out_file_path}")
@@ -193,6 +260,130 @@ def download_file_http(
     return True
 
 
+def download_files_http_async(
+    file_urls: Dict[str, str],
+    out_dir_path: str,
+    username: str = None,
+    password: str = None,
+    max_connections: int = 32,
+    time_out: int = 60,
+    no_except: bool = True,
+) -> Dict[str, bool]:
+    """
+    A function which downloads a set of files concurrently using a single
+    asynchronous httpx client, using HTTP/2 where supported by the server (requires
+    the h2 module). If httpx is not available then the files are downloaded one
+    at a time using download_file_http. Note, the files are downloaded with
+    '.incomplete' extension before being renamed to the output file path.
+
+    :param file_urls: a dictionary of URLs using the output filename as the keys
+    :param out_dir_path: the output path where data should be downloaded to.
+    :param username: optionally provided a username (Default: None)
+    :param password: optionally provided a password (Default: None)
+    :param max_connections: the maximum number of concurrent connections.
+                            (Default: 32)
+    :param time_out: number of seconds to time out. (Default: 60)
+    :param no_except: If True (Default) then expections are not outputted.
+    :return: a dictionary using the filename as the keys with a boolean value
+             specifying whether the file was successfully downloaded.
+
+    """
+    if not os.path.exists(out_dir_path):
+        os.mkdir(out_dir_path)
+
+    try:
+        import httpx
+    except ImportError:
+        dwnlded = dict()
+        for c_file in file_urls:
+            dwnlded[c_file] = download_file_http(
+                file_urls[c_file],
+                os.path.join(out_dir_path, c_file),
+                username=username,
+                password=password,
+                no_except=no_except,
+            )
+        return dwnlded
+
+    import asyncio
+    import importlib.util
+
+    use_http2 = importlib.util.find_spec("h2") is not None
+
+    async def _download_file(client, dwnld_sem, input_url, out_file_path):
+        tmp_dwnld_path = out_file_path + ".incomplete"
+        try:
+            # Only start as many downloads as there are connections so the
+            # waiting requests do not time out acquiring a connection.
+            async with dwnld_sem:
+                async with client.stream("GET", input_url) as r:
+                    r.raise_for_status()
+                    with open(tmp_dwnld_path, "wb") as f:
+                        async for chunk in r.aiter_bytes(2**23):
+                            # Write in a thread so other downloads are not blocked.
+                            await asyncio.to_thread(f.write, chunk)
+            os.rename(tmp_dwnld_path, out_file_path)
+            print(f"Download Complete: {out_file_path}")
+        except Exception as e:
+            # Remove the partial download so a retry starts from a clean state.
+            if os.path.exists(tmp_dwnld_path):
+                os.remove(tmp_dwnld_path)
+            if no_except:
+                print(e)
+            else:
+                raise rsgislib.RSGISPyException(f"{e}")
+            return False
+        return True
+
+    async def _download_files():
+        auth = None
+        if (username is not None) and (password is not None):
+            auth = (username, password)
+        user_agent = "rsgislib/{}".format(rsgislib.get_rsgislib_version())
+        dwnld_sem = asyncio.Semaphore(max_connections)
+        transport = httpx.AsyncHTTPTransport(
+            http2=use_http2,
+            retries=3,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+        async with httpx.AsyncClient(
+            transport=transport,
+            auth=auth,
+            headers={"User-Agent": user_agent},
+            follow_redirects=True,
+            timeout=time_out,
+        ) as client:
+            return await asyncio.gather(
+                *[
+                    _download_file(
+                        client,
+                        dwnld_sem,
+                        file_urls[c_file],
+                        os.path.join(out_dir_path, c_file),
+                    )
+                    for c_file in file_urls
+                ]
+            )
+
+    try:
+        asyncio.get_running_loop()
+        loop_running = True
+    except RuntimeError:
+        loop_running = False
+
+    if loop_running:
+        # asyncio.run cannot be called from a running event loop (e.g., within
+        # Jupyter) so run the downloads within their own loop on a worker thread.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dwnld_results = executor.submit(asyncio.run, _download_files()).result()
+    else:
+        dwnld_results = asyncio.run(_download_files())
+
+    return dict(zip(file_urls.keys(), dwnld_results))
+
+
 def wget_download_file(
     input_url: str,
     out_file_path: str,
@@ -270,6 +461,144 @@ def wget_download_file(
     return success, out_message
 
 
+def download_file_http_ranges(
+    input_url: str,
+    out_file_path: str,
+    username: str = None,
+    password: str = None,
+    n_ranges: int = 8,
+    time_out: int = 60,
+    input_url_md5: str = None,
+) -> (bool, str):
+    """
+    A function which downloads a file from a url in-process, splitting the file
+    into byte ranges which are downloaded concurrently. This can be significantly
+    faster than using a single connection (e.g., wget_download_file) for large
+    files where the server limits the speed of each connection. If the server
+    does not support range requests then the file is downloaded using a single
+    connection (i.e., download_file_http). Note, the file is downloaded with
+    '.incomplete' extension before being renamed to the output file path.
+
+    :param input_url: string with the URL to be downloaded.
+    :param out_file_path: output file name and path.
+    :param username: username for the download, if required. Default is None meaning
+                     it will be ignored.
+    :param password: password for the download, if required. Default is None meaning
+                     it will be ignored.
+    :param n_ranges: the number of byte ranges to download concurrently.
+                     Default is 8.
+    :param time_out: number of seconds to time out Default is 60.
+    :param input_url_md5: optionally the MD5 hash string for the file which will
+                          be checked against the downloaded file.
+    :return: boolean specifying whether the file had been successfully downloaded
+             and a string with user feedback (e.g., error message)
+
+    """
+    import mmap
+    from concurrent.futures import ThreadPoolExecutor
+
+    session_http = requests.Session()
+    session_http.mount(
+        "http://", HTTPAdapter(pool_connections=n_ranges, pool_maxsize=n_ranges)
+    )
+    session_http.mount(
+        "https://", HTTPAdapter(pool_connections=n_ranges, pool_maxsize=n_ranges)
+    )
+    if (username is not None) and (password is not None):
+        session_http.auth = (username, password)
+    user_agent = "rsgislib/{}".format(rsgislib.get_rsgislib_version())
+    session_http.headers["User-Agent"] = user_agent
+    # Ranges refer to the encoded bytes so ask for the file without compression.
+    session_http.headers["Accept-Encoding"] = "identity"
+
+    tmp_dwnld_path = out_file_path + ".incomplete"
+
+    try:
+        r = session_http.head(input_url, allow_redirects=True, timeout=time_out)
+        check_http_response(r, input_url)
+        total = int(r.headers.get("content-length", 0))
+        accept_ranges = r.headers.get("accept-ranges", "none").lower() == "bytes"
+    except Exception as e:
+        return False, f"Download of file ({out_file_path}) failed.: Exception:\n{e}"
+
+    if (total == 0) or (not accept_ranges) or (n_ranges < 2):
+        # The MD5 is checked while the file is downloaded.
+        dwnlded = download_file_http(
+            input_url,
+            out_file_path,
+            username=username,
+            password=password,
+            input_url_md5=input_url_md5,
+        )
+        if not dwnlded:
+            return False, "File did not successfully download."
+        if input_url_md5 is not None:
+            return True, "File Downloaded and MD5 to checked."
+        return True, "File Downloaded but no MD5 to check against."
+    else:
+        range_size = int(math.ceil(total / n_ranges))
+        byte_ranges = [
+            (start, min(start + range_size, total) - 1)
+            for start in range(0, total, range_size)
+        ]
+
+        def _download_byte_range(byte_range):
+            start, end = byte_range
+            with session_http.get(
+                input_url,
+                headers={"Range": f"bytes={start}-{end}"},
+                stream=True,
+                timeout=time_out,
+            ) as r_range:
+                check_http_response(r_range, input_url)
+                if r_range.status_code != requests.codes.partial_content:
+                    raise rsgislib.RSGISPyException(
+                        "Server did not return the requested byte range."
+                    )
+                offset = start
+                for chunk in r_range.iter_content(chunk_size=2**20):
+                    out_mmap[offset : offset + len(chunk)] = chunk
+                    offset += len(chunk)
+            if offset != (end + 1):
+                raise rsgislib.RSGISPyException(
+                    f"Byte range {start}-{end} was not completely downloaded."
+                )
+
+        try:
+            with open(tmp_dwnld_path, "wb") as f:
+                f.truncate(total)
+            with open(tmp_dwnld_path, "r+b") as f:
+                with mmap.mmap(f.fileno(), total) as out_mmap:
+                    with ThreadPoolExecutor(max_workers=n_ranges) as executor:
+                        for _ in tqdm.tqdm(
+                            executor.map(_download_byte_range, byte_ranges),
+                            total=len(byte_ranges),
+                            desc=os.path.basename(out_file_path),
+                        ):
+                            pass
+                    out_mmap.flush()
+            os.rename(tmp_dwnld_path, out_file_path)
+        except Exception as e:
+            return (
+                False,
+                f"Download of file ({out_file_path}) failed.: Exception:\n{e}",
+            )
+
+    if input_url_md5 is not None:
+        dwnld_file_md5 = rsgislib.tools.filetools.create_md5_hash(out_file_path)
+        if dwnld_file_md5 == input_url_md5:
+            success = True
+            out_message = "File Downloaded and MD5 to checked."
+        else:
+            success = False
+            out_message = "File Downloaded but MD5 did not match."
+    else:
+        success = True
+        out_message = "File Downloaded but no MD5 to check against."
+
+    return success, out_message
+
+
 def create_file_listings_db(
     db_json: str,
     file_urls: dict[str, str],
@@ -283,19 +612,17 @@ def create_file_listings_db(
 
     """
     import pysondb
-    import tqdm
 
     lst_db = pysondb.getDb(db_json)
-    db_data = []
-    for c_file in tqdm.tqdm(file_urls):
-        db_data.append(
-            {
-                "http_url": file_urls[c_file],
-                "file_name": c_file,
-                "lcl_path": "",
-                "downloaded": False,
-            }
-        )
+    db_data = [
+        {
+            "http_url": file_url,
+            "file_name": c_file,
+            "lcl_path": "",
+            "downloaded": False,
+        }
+        for c_file, file_url in file_urls.items()
+    ]
 
     if len(db_data) > 0:
         lst_db.addMany(db_data)
@@ -309,6 +636,7 @@ def download_http_files_use_lst_db(
     use_wget: bool = False,
     wget_time_out: int = 60,
     check_file_exists: bool = False,
+    n_workers: int = 8,
 ):
     """
     A function which uses the pysondb JSON database to download all the files
@@ -324,8 +652,13 @@ def download_http_files_use_lst_db(
     :param wget_time_out: number of seconds to time out when using wget. (Default: 60)
     :param check_file_exists: check if the output file already exists and only
                               download if not present.
+    :param n_workers: the number of files to be downloaded concurrently.
+                      (Default: 8)
 
     """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     import pysondb
 
     lst_db = pysondb.getDb(db_json)
@@ -335,35 +668,53 @@ def download_http_files_use_lst_db(
     if not os.path.exists(out_dir_path):
         os.mkdir(out_dir_path)
 
+    # pysondb is not thread safe so updates to the database are serialised.
+    lst_db_lock = threading.Lock()
+
+    def _update_lst_db(dwn_file_id, lcl_path):
+        with lst_db_lock:
+            lst_db.updateById(dwn_file_id, {"lcl_path": lcl_path, "downloaded": True})
+
+    def _download_file(dwn_file, lcl_path):
+        print(dwn_file["file_name"])
+        if use_wget:
+            dwnlded, out_message = wget_download_file(
+                input_url=dwn_file["http_url"],
+                out_file_path=lcl_path,
+                username=http_user,
+                password=http_pass,
+                try_number=10,
+                time_out=wget_time_out,
+                input_url_md5=None,
+            )
+        else:
+            dwnlded = download_file_http(
+                input_url=dwn_file["http_url"],
+                out_file_path=lcl_path,
+                username=http_user,
+                password=http_pass,
+                no_except=True,
+            )
+        return dwn_file["id"], lcl_path, dwnlded
+
+    dwld_tasks = []
     for dwn_file in dwld_files:
         basename = dwn_file["file_name"]
-        print(basename)
         lcl_path = os.path.join(out_dir_path, basename)
         file_exists = False
         if check_file_exists:
             file_exists = os.path.exists(lcl_path)
-        if not file_exists:
-            if use_wget:
-                dwnlded, out_message = wget_download_file(
-                    input_url=dwn_file["http_url"],
-                    out_file_path=lcl_path,
-                    username=http_user,
-                    password=http_pass,
-                    try_number=10,
-                    time_out=wget_time_out,
-                    input_url_md5=None,
-                )
-            else:
-                dwnlded = download_file_http(
-                    input_url=dwn_file["http_url"],
-                    out_file_path=lcl_path,
-                    username=http_user,
-                    password=http_pass,
-                    no_except=True,
-                )
+        if file_exists:
+            _update_lst_db(dwn_file["id"], lcl_path)
         else:
-            dwnlded = True
-        if dwnlded:
-            lst_db.updateById(
-                dwn_file["id"], {"lcl_path": lcl_path, "downloaded": True}
-            )
+            dwld_tasks.append((dwn_file, lcl_path))
+
+    with ThreadPoolExecutor(max_workers=max(n_workers, 1)) as executor:
+        futures = [
+            executor.submit(_download_file, dwn_file, lcl_path)
+            for dwn_file, lcl_path in dwld_tasks
+        ]
+        for future in as_completed(futures):
+            dwn_file_id, lcl_path, dwnlded = future.result()
+            if dwnlded:
+                _update_lst_db(dwn_file_id, lcl_path)
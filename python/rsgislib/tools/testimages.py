@@ -4,7 +4,6 @@ The tools.test_images module contains some functions to create images which can
 used for testing other functions or generate example datasets
 
 """
-import os
 from typing import List
 import rsgislib
 
@@ -12,8 +11,6 @@ TQDM_AVAIL = True
 try:
     import tqdm
 except ImportError:
-    import rios.cuiprogress
-
     TQDM_AVAIL = False
 
 
@@ -40,72 +37,54 @@ def create_random_int_img(
     :param gdalformat: the output image file format (Default: KEA)
     :param datatype: the output image data type (Default: rsgislib.TYPE_8UINT)
     :param calc_stats: calculate image statistics and pyramids
-    :param tmp_path: Can optionally provide a temporary path where a reference
-                     image will be created and then removed.
+    :param tmp_path: no longer used as a reference image is no longer created.
+                     The parameter is retained for backwards compatibility.
 
     """
-    import numpy.random
-    from rios import applier
+    import numpy
+    from osgeo import gdal
 
     import rsgislib.imageutils
-    import rsgislib.tools.utils
-
-    uid_str = rsgislib.tools.utils.uid_generator()
-
-    if tmp_path is None:
-        tmp_path = ""
 
-    tmp_ref_img = os.path.join(tmp_path, f"tmp_ref_img_{uid_str}.kea")
+    out_vals_arr = numpy.asarray(out_vals, dtype=rsgislib.get_numpy_datatype(datatype))
+    rng = numpy.random.default_rng()
 
-    rsgislib.imageutils.create_blank_img_py(
-        tmp_ref_img,
-        n_bands,
+    gdal_driver = gdal.GetDriverByName(gdalformat)
+    out_img_ds_obj = gdal_driver.Create(
+        output_img,
         x_size,
         y_size,
-        100000,
-        500000,
-        1,
-        1,
-        "",
-        "KEA",
-        datatype,
-        options=[],
-        no_data_val=0,
+        n_bands,
+        rsgislib.get_gdal_datatype(datatype),
+        options=rsgislib.imageutils.get_rios_img_creation_opts(gdalformat),
     )
-
+    if out_img_ds_obj is None:
+        raise rsgislib.RSGISPyException("Could not create the output image.")
+    out_img_ds_obj.SetGeoTransform((100000, 1, 0, 500000, 0, 1))
+    out_img_ds_obj.SetProjection("")
+    out_img_bands = [out_img_ds_obj.GetRasterBand(band + 1) for band in range(n_bands)]
+
+    # Write the image in blocks of rows, sampling indexes into the typed values
+    # array and gathering the values.
+    block_y_size = 256
+    block_y_offs = range(0, y_size, block_y_size)
     if TQDM_AVAIL:
-        progress_bar = rsgislib.TQDMProgressBar()
-    else:
-        progress_bar = rios.cuiprogress.GDALProgressBar()
-
-    infiles = applier.FilenameAssociations()
-    infiles.image = tmp_ref_img
-    outfiles = applier.FilenameAssociations()
-    outfiles.out_image = output_img
-    otherargs = applier.OtherInputs()
-    otherargs.out_vals = out_vals
-    aControls = applier.ApplierControls()
-    aControls.progress = progress_bar
-    aControls.creationoptions = rsgislib.imageutils.get_rios_img_creation_opts(
-        gdalformat
-    )
-    aControls.drivername = gdalformat
-    aControls.omitPyramids = True
-    aControls.calcStats = False
-
-    def _applyPopVals(info, inputs, outputs, otherargs):
-        """
-        This is an internal rios function
-        """
-        in_img_shp = inputs.image.shape
-        outputs.out_image = numpy.random.choice(otherargs.out_vals, in_img_shp).astype(
-            rsgislib.get_numpy_datatype(datatype)
+        block_y_offs = tqdm.tqdm(block_y_offs)
+    for y_off in block_y_offs:
+        block_height = min(block_y_size, y_size - y_off)
+        idxs = rng.integers(
+            0,
+            out_vals_arr.size,
+            size=(n_bands, block_height, x_size),
+            dtype=numpy.intp,
         )
+        block_arr = out_vals_arr[idxs]
+        for band in range(n_bands):
+            out_img_bands[band].WriteArray(block_arr[band], 0, y_off)
+    out_img_bands = None
+    out_img_ds_obj = None
 
-    applier.apply(_applyPopVals, infiles, outfiles, otherargs, controls=aControls)
     if calc_stats:
         import rsgislib.rastergis
 
         rsgislib.rastergis.pop_rat_img_stats(output_img, True, True, True)
-
-    rsgislib.imageutils.delete_gdal_layer(tmp_ref_img)
@@ -1627,6 +1627,7 @@ def create_quicklook_overview_imgs_vec_overlay(
             att_column=None,
             thematic=True,
             no_data_val=0,
+            calc_stats=False,
         )
         # Merge the overlay and base image
         tmp_final_img = os.path.join(
@@ -1690,6 +1691,7 @@ def create_quicklook_overview_imgs_vec_overlay(
                 att_column=None,
                 thematic=True,
                 no_data_val=0,
+                calc_stats=False,
             )
             # Merge the overlay and base image
             tmp_final_img = os.path.join(
@@ -2044,6 +2046,7 @@ def overlay_vec_on_img(
         att_column=None,
         thematic=True,
         no_data_val=0,
+        calc_stats=False,
     )
 
     # Merge the overlay and base image
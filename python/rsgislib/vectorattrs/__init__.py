@@ -3,7 +3,6 @@
 The vector attributes module performs attribute table operations on vectors.
 """
 
-import math
 from typing import Dict, List, Union, Tuple
 
 import numpy
@@ -147,11 +146,20 @@ def write_vec_column_to_layer(
                 "be found.".format(att_column)
             )
 
+    lyrDefn = out_vec_lyr_obj.GetLayerDefn()
+    att_col_idx = lyrDefn.GetFieldIndex(att_column)
+
+    # Only the FIDs are needed so don't read the geometries or attributes.
+    out_vec_lyr_obj.SetIgnoredFields(
+        ["OGR_GEOMETRY"]
+        + [lyrDefn.GetFieldDefn(i).GetName() for i in range(lyrDefn.GetFieldCount())]
+    )
     out_vec_lyr_obj.ResetReading()
     # WORK AROUND AS SQLITE GETS STUCK IN LOOP ON FIRST FEATURE WHEN USE SETFEATURE.
     fids = []
     for feat in out_vec_lyr_obj:
         fids.append(feat.GetFID())
+    out_vec_lyr_obj.SetIgnoredFields([])
 
     openTransaction = False
     out_vec_lyr_obj.ResetReading()
@@ -163,7 +171,7 @@ def write_vec_column_to_layer(
             openTransaction = True
         feat = out_vec_lyr_obj.GetFeature(fid)
         if feat is not None:
-            feat.SetField(att_column, att_col_data[i])
+            feat.SetField(att_col_idx, att_col_data[i])
             out_vec_lyr_obj.SetFeature(feat)
         if ((i % 20000) == 0) and openTransaction:
             out_vec_lyr_obj.CommitTransaction()
@@ -192,24 +200,31 @@ def read_vec_column(vec_file: str, vec_lyr: str, att_column: str) -> List:
     if lyr is None:
         raise rsgislib.RSGISPyException("Could not find layer '{}'".format(vec_lyr))
 
-    colExists = False
+    col_idx = -1
+    other_cols = ["OGR_GEOMETRY"]
     lyrDefn = lyr.GetLayerDefn()
     for i in range(lyrDefn.GetFieldCount()):
         if lyrDefn.GetFieldDefn(i).GetName() == att_column:
-            colExists = True
-            break
+            if col_idx < 0:
+                col_idx = i
+        else:
+            other_cols.append(lyrDefn.GetFieldDefn(i).GetName())
 
-    if not colExists:
+    if col_idx < 0:
         ds = None
         raise rsgislib.RSGISPyException(
             "The specified column does not exist in the input layer; "
             "check case as some drivers are case sensitive."
         )
 
+    # Only the one column is needed so the driver can skip reading
+    # the geometries and the other attributes.
+    lyr.SetIgnoredFields(other_cols)
     outVal = list()
     lyr.ResetReading()
     for feat in lyr:
-        outVal.append(feat.GetField(att_column))
+        outVal.append(feat.GetField(col_idx))
+    lyr.SetIgnoredFields([])
     ds = None
 
     return outVal
@@ -294,6 +309,8 @@ def pop_bbox_cols(
     :param y_max_col: output column name.
 
     """
+    import tqdm
+
     dsVecFile = gdal.OpenEx(vec_file, gdal.OF_UPDATE)
     if dsVecFile is None:
         raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_file))
@@ -352,20 +369,11 @@ def pop_bbox_cols(
         fids.append(feat.GetFID())
 
     openTransaction = False
-    nFeats = vec_lyr_obj.GetFeatureCount(True)
-    step = math.floor(nFeats / 10)
-    feedback = 10
-    feedback_next = step
     counter = 0
-    print("Started .0.", end="", flush=True)
     vec_lyr_obj.ResetReading()
-    for fid in fids:
+    for fid in tqdm.tqdm(fids):
         # WORK AROUND AS SQLITE GETS STUCK IN LOOP ON FIRST FEATURE WHEN USE SETFEATURE.
         feat = vec_lyr_obj.GetFeature(fid)
-        if (nFeats > 10) and (counter == feedback_next):
-            print(".{}.".format(feedback), end="", flush=True)
-            feedback_next = feedback_next + step
-            feedback = feedback + 10
 
         if not openTransaction:
             vec_lyr_obj.StartTransaction()
@@ -397,7 +405,6 @@ def pop_bbox_cols(
         openTransaction = False
     vec_lyr_obj.SyncToDisk()
     dsVecFile = None
-    print(" Completed")
 
 
 def add_geom_bbox_cols(
@@ -3,8 +3,11 @@
 The vector geometries module performs geometric operations on vectors.
 """
 
-import math
+import array
+import collections
+import functools
 import os
+from math import atan2, ceil, cos, hypot, radians, sin
 from typing import List, Tuple, Union
 
 import tqdm
@@ -15,6 +18,9 @@ import rsgislib.vectorutils
 
 gdal.UseExceptions()
 
+# The number of features written within each transaction by the OGR write loops.
+_TXN_SIZE = 100000
+
 
 def convert_polygon_to_polyline(
     vec_poly_file: str,
@@ -25,7 +31,9 @@ def convert_polygon_to_polyline(
     del_exist_vec: bool = False,
 ):
     """
-    A function to convert a polygon vector file to a polyline file.
+    A function to convert a polygon vector file to a polyline file. The
+    exterior ring of each polygon (multi-polygons are split into their
+    parts) is outputted as a line. This function uses geopandas and shapely.
 
     :param vec_poly_file: Input polygon vector file
     :param vec_poly_lyr: The name of the vector layer
@@ -35,6 +43,9 @@ def convert_polygon_to_polyline(
     :param del_exist_vec: remove output file if it exists.
 
     """
+    import geopandas
+    import numpy
+    import shapely
 
     if os.path.exists(vec_line_file):
         if del_exist_vec:
@@ -48,54 +59,16 @@ def convert_polygon_to_polyline(
     if vec_line_lyr is None:
         vec_line_lyr = os.path.splitext(os.path.basename(vec_line_file))[0]
 
-    vec_poly_ds_obj = gdal.OpenEx(vec_poly_file, gdal.OF_VECTOR)
-    vec_poly_lyr_obj = vec_poly_ds_obj.GetLayer(vec_poly_lyr)
-    vec_poly_spat_ref = vec_poly_lyr_obj.GetSpatialRef()
-
-    out_vec_drv = gdal.GetDriverByName(out_format)
-    if out_vec_drv is None:
-        raise rsgislib.RSGISPyException(
-            "Driver ('{}') has not be recognised.".format(out_format)
-        )
-
-    out_ds_obj = out_vec_drv.Create(vec_line_file, 0, 0, 0, gdal.GDT_Unknown)
-    out_lyr_obj = out_ds_obj.CreateLayer(
-        vec_line_lyr, vec_poly_spat_ref, geom_type=ogr.wkbLineString
-    )
-    feat_defn = out_lyr_obj.GetLayerDefn()
-
-    n_feats = vec_poly_lyr_obj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    open_transaction = False
-    counter = 0
-    in_feature = vec_poly_lyr_obj.GetNextFeature()
-    while in_feature:
-        if not open_transaction:
-            out_lyr_obj.StartTransaction()
-            open_transaction = True
-
-        geom = in_feature.GetGeometryRef()
-        if geom is not None:
-            ring = geom.GetGeometryRef(0)
-            out_feat = ogr.Feature(feat_defn)
-            out_feat.SetGeometry(ring)
-            out_lyr_obj.CreateFeature(out_feat)
-            out_feat = None
-
-        if ((counter % 20000) == 0) and open_transaction:
-            out_lyr_obj.CommitTransaction()
-            open_transaction = False
-
-        in_feature = vec_poly_lyr_obj.GetNextFeature()
-        counter = counter + 1
-        pbar.update(1)
+    data_gdf = geopandas.read_file(vec_poly_file, layer=vec_poly_lyr)
+    geoms = numpy.asarray(data_gdf.geometry.values)
+    polys = shapely.get_parts(geoms[~shapely.is_missing(geoms)])
+    rings = shapely.get_exterior_ring(polys)
+    lines_gdf = geopandas.GeoDataFrame(geometry=rings, crs=data_gdf.crs)
 
-    if open_transaction:
-        out_lyr_obj.CommitTransaction()
-        open_transaction = False
-    pbar.close()
-    out_lyr_obj.SyncToDisk()
-    out_ds_obj = None
+    if out_format == "GPKG":
+        lines_gdf.to_file(vec_line_file, layer=vec_line_lyr, driver=out_format)
+    else:
+        lines_gdf.to_file(vec_line_file, driver=out_format)
 
 
 def convert_polys_to_lines_gp(
@@ -160,45 +133,39 @@ def get_pt_on_line(pt1: ogr.Geometry, pt2: ogr.Geometry, dist: float) -> (float,
     :return: The created point; returned as a set of floats: (x, y)
 
     """
-    out_pt_x = 0.0
-    out_pt_y = 0.0
+    pt1_x = pt1.GetX()
+    pt1_y = pt1.GetY()
     if dist == 0:
-        out_pt_x = pt1.GetX()
-        out_pt_y = pt1.GetY()
-    else:
-        dx = pt2.GetX() - pt1.GetX()
-        dy = pt2.GetY() - pt1.GetY()
-
-        if (abs(dx) > 0) and (abs(dy) > 0):
-            theta = math.atan(dy / dx)
-            y1 = dist * math.sin(theta)
-            x1 = dist * math.cos(theta)
-
-            if (dx >= 0) and (dy > 0):
-                out_pt_x = pt1.GetX() + x1
-                out_pt_y = pt1.GetY() + y1
-            elif (dx >= 0) and (dy <= 0):
-                out_pt_x = pt1.GetX() + x1
-                out_pt_y = pt1.GetY() + y1
-            elif (dx < 0) & (dy > 0):
-                out_pt_x = pt1.GetX() - x1
-                out_pt_y = pt1.GetY() - y1
-            elif (dx < 0) & (dy <= 0):
-                out_pt_x = pt1.GetX() - x1
-                out_pt_y = pt1.GetY() - y1
-        elif dx == 0:
-            out_pt_x = pt1.GetX()
-            if dy > 0:
-                out_pt_y = pt1.GetY() + dist
-            else:
-                out_pt_y = pt1.GetY() - dist
-        elif dy == 0:
-            out_pt_y = pt1.GetY()
-            if dx > 0:
-                out_pt_x = pt1.GetX() + dist
-            else:
-                out_pt_x = pt1.GetX() - dist
+        return pt1_x, pt1_y
+
+    theta = atan2(pt2.GetY() - pt1_y, pt2.GetX() - pt1_x)
+    out_pt_x = pt1_x + dist * cos(theta)
+    out_pt_y = pt1_y + dist * sin(theta)
+    return out_pt_x, out_pt_y
+
 
+def get_pt_on_line_vec(x1, y1, x2, y2, dist):
+    """
+    A function that calculates points on the vectors defined by (x1, y1) and
+    (x2, y2). This is an array version of get_pt_on_line where the inputs are
+    numpy arrays (or scalars) which are broadcast against one another so, for
+    example, a set of distances can be calculated along a single vector.
+
+    :param x1: The X coordinate(s) of the start of the vector(s).
+    :param y1: The Y coordinate(s) of the start of the vector(s).
+    :param x2: The X coordinate(s) of the end of the vector(s).
+    :param y2: The Y coordinate(s) of the end of the vector(s).
+    :param dist: The distance(s) from (x1, y1) the new point(s) are to be created.
+    :return: The created points; returned as a pair of numpy arrays: (x, y)
+
+    """
+    import numpy
+
+    theta = numpy.arctan2(
+        numpy.subtract(y2, y1, dtype=float), numpy.subtract(x2, x1, dtype=float)
+    )
+    out_pt_x = x1 + dist * numpy.cos(theta)
+    out_pt_y = y1 + dist * numpy.sin(theta)
     return out_pt_x, out_pt_y
 
 
@@ -225,47 +192,130 @@ def find_pt_to_side(
     :return: The created point; returned as a set of floats: (x, y)
 
     """
-    if left_hand:
-        tmp_pt = pt_end
-        pt_end = pt_start
-        pt_start = tmp_pt
-
     dx = pt_end.GetX() - pt_start.GetX()
     dy = pt_end.GetY() - pt_start.GetY()
-
-    if (abs(dx) > 0) and (abs(dy) > 0):
-        beta = math.atan(dy / dx)
-        distanceP1P2 = pt_start.Distance(pt)
-        distanceP1P3 = math.sqrt((line_len * line_len) + (distanceP1P2 * distanceP1P2))
-        theta = math.atan(line_len / distanceP1P2)
-        alpha = math.pi - (theta - beta)
-
-        localX = distanceP1P3 * math.cos(alpha)
-        localY = distanceP1P3 * math.sin(alpha)
-    elif dx == 0:
-        localX = line_len
-        localY = 0
-    elif dy == 0:
-        localX = 0
-        localY = line_len
-
-    if (dx >= 0) and (dy > 0):
-        out_pt_x = pt_start.GetX() - localX
-        out_pt_y = pt_start.GetY() - localY
-    elif (dx >= 0) and (dy <= 0):
-        out_pt_x = pt_start.GetX() - localX
-        out_pt_y = pt_start.GetY() - localY
-    elif (dx < 0) and (dy > 0):
-        out_pt_x = pt_start.GetX() + localX
-        out_pt_y = pt_start.GetY() + localY
-    elif (dx < 0) and (dy <= 0):
-        out_pt_x = pt_start.GetX() + localX
-        out_pt_y = pt_start.GetY() + localY
-    else:
+    vec_len = hypot(dx, dy)
+    if vec_len == 0:
         raise rsgislib.RSGISPyException("Could not resolve find_pt_to_side...")
+
+    # Unit vector perpendicular (to the right) of the vector.
+    norm_x = dy / vec_len
+    norm_y = -dx / vec_len
+    if left_hand:
+        norm_x = -norm_x
+        norm_y = -norm_y
+
+    out_pt_x = pt.GetX() + line_len * norm_x
+    out_pt_y = pt.GetY() + line_len * norm_y
     return out_pt_x, out_pt_y
 
 
+def _calc_orthg_lines(pts_xy, pt_step, line_len, side_sign, out_lines):
+    """
+    An internal function used by create_orthg_lines (compiled with numba) which
+    steps along a polyline at regular intervals calculating the start and end
+    points of the lines orthogonal to the polyline.
+
+    :param pts_xy: 2D float64 array (n_pts, 2) of the polyline vertices.
+    :param pt_step: The steps along the polyline at which lines are created.
+    :param line_len: The length of the lines created.
+    :param side_sign: 1.0 for lines on the right-hand side of the polyline
+                      and -1.0 for lines on the left-hand side.
+    :param out_lines: 2D float64 array (n_lines, 4) which is populated with the
+                      start_x, start_y, end_x, end_y of the orthogonal lines.
+                      Must be large enough for the length of the polyline
+                      divided by pt_step.
+    :return: The number of lines populated within out_lines.
+
+    """
+    n_lines = 0
+    c_dist = 0.0
+    for i in range(1, pts_xy.shape[0]):
+        p_x = pts_xy[i - 1, 0]
+        p_y = pts_xy[i - 1, 1]
+        dx = pts_xy[i, 0] - p_x
+        dy = pts_xy[i, 1] - p_y
+        seg_len = hypot(dx, dy)
+        # The number of lines along the segment, the lines are created at
+        # pt_step intervals from the end of the last line on the previous segment.
+        n_seg_lines = max(int(ceil((seg_len + c_dist) / pt_step)) - 1, 0)
+        if n_seg_lines > 0:
+            unit_x = dx / seg_len
+            unit_y = dy / seg_len
+            side_x = side_sign * line_len * unit_y
+            side_y = -side_sign * line_len * unit_x
+            for n_step in range(n_seg_lines):
+                pt_at_dist = ((pt_step * n_step) + pt_step) - c_dist
+                pt_x = p_x + (pt_at_dist * unit_x)
+                pt_y = p_y + (pt_at_dist * unit_y)
+                out_lines[n_lines, 0] = pt_x
+                out_lines[n_lines, 1] = pt_y
+                out_lines[n_lines, 2] = pt_x + side_x
+                out_lines[n_lines, 3] = pt_y + side_y
+                n_lines += 1
+        c_dist = (seg_len + c_dist) - (pt_step * n_seg_lines)
+    return n_lines
+
+
+def _write_lines_gdf(
+    lines_xy,
+    lines_attrs: dict,
+    spat_ref,
+    out_vec_file: str,
+    out_vec_lyr: str,
+    out_format: str,
+):
+    """
+    An internal function which writes a set of straight lines, defined by their
+    start and end coordinates, to a vector layer in a single write using
+    geopandas. The layer schema matches the one previously created with OGR:
+    a LineString geometry (also for an empty layer), the uid column as a
+    32 bit integer and all other columns as reals.
+
+    :param lines_xy: 2D numpy array (n_lines, 4) with the start_x, start_y, end_x
+                     and end_y of each line.
+    :param lines_attrs: dict of the output column names and numpy arrays
+                        (n_lines) of the attribute values.
+    :param spat_ref: the osr.SpatialReference of the output layer (can be None).
+    :param out_vec_file: The output vector file path.
+    :param out_vec_lyr: The output vector layer name.
+    :param out_format: The output file format of the vector file.
+
+    """
+    import importlib.util
+
+    import geopandas
+    import numpy
+    import shapely
+
+    lines = shapely.linestrings(lines_xy.reshape(-1, 2, 2))
+    crs = None
+    if spat_ref is not None:
+        crs = spat_ref.ExportToWkt()
+    col_types = dict()
+    col_data = dict()
+    for col_name, col_vals in lines_attrs.items():
+        if col_name == "uid":
+            col_types[col_name] = "int32"
+            col_data[col_name] = numpy.asarray(col_vals, dtype=numpy.int32)
+        else:
+            col_types[col_name] = "float"
+            col_data[col_name] = numpy.asarray(col_vals, dtype=numpy.float64)
+    lines_gdf = geopandas.GeoDataFrame(col_data, geometry=lines, crs=crs)
+
+    write_args = dict(driver=out_format)
+    if out_format == "GPKG":
+        write_args["layer"] = out_vec_lyr
+    if importlib.util.find_spec("pyogrio") is not None:
+        # pyogrio takes the column types from the numpy dtypes.
+        write_args["engine"] = "pyogrio"
+        write_args["geometry_type"] = "LineString"
+    else:
+        write_args["engine"] = "fiona"
+        write_args["schema"] = {"geometry": "LineString", "properties": col_types}
+    lines_gdf.to_file(out_vec_file, **write_args)
+
+
 def create_orthg_lines(
     vec_in_file: str,
     vec_in_lyr: str,
@@ -299,6 +349,8 @@ def create_orthg_lines(
     :param del_exist_vec: remove output file if it exists.
 
     """
+    import numpy
+
     if os.path.exists(out_vec_file):
         if del_exist_vec:
             rsgislib.vectorutils.delete_vector_file(out_vec_file)
@@ -323,108 +375,56 @@ def create_orthg_lines(
         )
     vec_spat_ref = vec_lyr_obj.GetSpatialRef()
 
-    out_vec_drv = gdal.GetDriverByName(out_format)
-    if out_vec_drv is None:
-        raise rsgislib.RSGISPyException(
-            "Driver ('{}') has not be recognised.".format(out_format)
-        )
+    # If numba is available the orthogonal lines are calculated using a
+    # compiled version of the function.
+    try:
+        import numba
 
-    out_ds_obj = out_vec_drv.Create(out_vec_file, 0, 0, 0, gdal.GDT_Unknown)
-    out_lyr_obj = out_ds_obj.CreateLayer(
-        out_vec_lyr, vec_spat_ref, geom_type=ogr.wkbLineString
-    )
-    uid_field = ogr.FieldDefn("uid", ogr.OFTInteger)
-    out_lyr_obj.CreateField(uid_field)
-    start_x_field = ogr.FieldDefn("start_x", ogr.OFTReal)
-    out_lyr_obj.CreateField(start_x_field)
-    start_y_field = ogr.FieldDefn("start_y", ogr.OFTReal)
-    out_lyr_obj.CreateField(start_y_field)
-    end_x_field = ogr.FieldDefn("end_x", ogr.OFTReal)
-    out_lyr_obj.CreateField(end_x_field)
-    end_y_field = ogr.FieldDefn("end_y", ogr.OFTReal)
-    out_lyr_obj.CreateField(end_y_field)
-    feat_defn = out_lyr_obj.GetLayerDefn()
+        calc_orthg_lines_func = numba.njit(cache=True, fastmath=True)(_calc_orthg_lines)
+    except ImportError:
+        calc_orthg_lines_func = _calc_orthg_lines
 
+    # The side of the line is constant for the whole layer so is resolved once.
+    side_sign = -1.0 if left_hand else 1.0
+
+    orthg_lines_lst = list()
     n_feats = vec_lyr_obj.GetFeatureCount(True)
     pbar = tqdm.tqdm(total=n_feats)
-    open_transaction = False
-    counter = 0
-    line_uid = 1
-    p_pt = ogr.Geometry(ogr.wkbPoint)
-    p_pt.AddPoint(0.0, 0.0)
-    c_pt = ogr.Geometry(ogr.wkbPoint)
-    c_pt.AddPoint(0.0, 0.0)
-    c_dist = 0.0
-    first_pt = True
     in_feature = vec_lyr_obj.GetNextFeature()
     while in_feature:
-        if not open_transaction:
-            out_lyr_obj.StartTransaction()
-            open_transaction = True
-
         geom = in_feature.GetGeometryRef()
-        if geom is not None:
-            pts = geom.GetPoints()
-            first_pt = True
-            c_dist = 0.0
-            for pt in pts:
-                if first_pt:
-                    p_pt.SetPoint(0, pt[0], pt[1])
-                    c_pt.SetPoint(0, pt[0], pt[1])
-                    first_pt = False
-                else:
-                    p_pt.SetPoint(0, c_pt.GetX(), c_pt.GetY())
-                    c_pt.SetPoint(0, pt[0], pt[1])
-                    n_step = 0
-                    step_c_dist = c_dist
-                    while True:
-                        if (
-                            (p_pt.Distance(c_pt) + step_c_dist) - (pt_step * n_step)
-                        ) > pt_step:
-                            pt_at_dist = ((pt_step * n_step) + pt_step) - step_c_dist
-                            ptx, pty = get_pt_on_line(p_pt, c_pt, pt_at_dist)
-                            base_pt = ogr.Geometry(ogr.wkbPoint)
-                            base_pt.AddPoint(ptx, pty)
-                            ptx_end, pty_end = find_pt_to_side(
-                                p_pt, base_pt, c_pt, line_len, left_hand
-                            )
-                            out_line = ogr.Geometry(ogr.wkbLineString)
-                            out_line.AddPoint(ptx, pty)
-                            out_line.AddPoint(ptx_end, pty_end)
-                            out_feat = ogr.Feature(feat_defn)
-                            out_feat.SetGeometry(out_line)
-                            out_feat.SetField("uid", line_uid)
-                            out_feat.SetField("start_x", ptx)
-                            out_feat.SetField("start_y", pty)
-                            out_feat.SetField("end_x", ptx_end)
-                            out_feat.SetField("end_y", pty_end)
-                            out_lyr_obj.CreateFeature(out_feat)
-                            out_feat = None
-                            line_uid = line_uid + 1
-                            n_step = n_step + 1
-                        else:
-                            if n_step == 0:
-                                c_dist = c_dist + p_pt.Distance(c_pt)
-                            else:
-                                c_dist = (p_pt.Distance(c_pt) + step_c_dist) - (
-                                    pt_step * n_step
-                                )
-                            break
-
-        if ((counter % 20000) == 0) and open_transaction:
-            out_lyr_obj.CommitTransaction()
-            open_transaction = False
+        if (geom is not None) and (geom.GetPointCount() > 1):
+            pts_xy = _line_xy(geom)
+            max_n_lines = int(geom.Length() / pt_step) + 1
+            orthg_lines = numpy.zeros((max_n_lines, 4), dtype=numpy.float64)
+            n_lines = calc_orthg_lines_func(
+                pts_xy, float(pt_step), float(line_len), side_sign, orthg_lines
+            )
+            orthg_lines_lst.append(orthg_lines[0:n_lines])
 
         in_feature = vec_lyr_obj.GetNextFeature()
-        counter = counter + 1
         pbar.update(1)
-
-    if open_transaction:
-        out_lyr_obj.CommitTransaction()
-        open_transaction = False
     pbar.close()
-    out_lyr_obj.SyncToDisk()
-    out_ds_obj = None
+
+    if len(orthg_lines_lst) > 0:
+        orthg_lines = numpy.concatenate(orthg_lines_lst)
+    else:
+        orthg_lines = numpy.zeros((0, 4), dtype=numpy.float64)
+
+    _write_lines_gdf(
+        orthg_lines,
+        {
+            "uid": numpy.arange(1, orthg_lines.shape[0] + 1, dtype=int),
+            "start_x": orthg_lines[:, 0],
+            "start_y": orthg_lines[:, 1],
+            "end_x": orthg_lines[:, 2],
+            "end_y": orthg_lines[:, 3],
+        },
+        vec_spat_ref,
+        out_vec_file,
+        out_vec_lyr,
+        out_format,
+    )
     vec_ds_obj = None
 
 
@@ -456,6 +456,8 @@ def split_lines_to_reg_pts(
     :param del_exist_vec: remove output file if it exists.
 
     """
+    import numpy
+
     if os.path.exists(out_vec_file):
         if del_exist_vec:
             rsgislib.vectorutils.delete_vector_file(out_vec_file)
@@ -501,6 +503,16 @@ def split_lines_to_reg_pts(
     dist_field = ogr.FieldDefn("dist", ogr.OFTReal)
     out_lyr_obj.CreateField(dist_field)
     feat_defn = out_lyr_obj.GetLayerDefn()
+    uid_idx = feat_defn.GetFieldIndex("uid")
+    line_id_idx = feat_defn.GetFieldIndex("line_id")
+    pt_x_idx = feat_defn.GetFieldIndex("pt_x")
+    pt_y_idx = feat_defn.GetFieldIndex("pt_y")
+    dist_idx = feat_defn.GetFieldIndex("dist")
+
+    # The point geometry and feature are reused for each output point.
+    base_pt = ogr.Geometry(ogr.wkbPoint)
+    base_pt.AddPoint_2D(0.0, 0.0)
+    out_feat = ogr.Feature(feat_defn)
 
     n_feats = vec_lyr_obj.GetFeatureCount(True)
     pbar = tqdm.tqdm(total=n_feats)
@@ -508,13 +520,8 @@ def split_lines_to_reg_pts(
     counter = 0
     pt_uid = 1
     line_id = 1
-    p_pt = ogr.Geometry(ogr.wkbPoint)
-    p_pt.AddPoint(0.0, 0.0)
-    c_pt = ogr.Geometry(ogr.wkbPoint)
-    c_pt.AddPoint(0.0, 0.0)
     c_dist = 0.0
     line_dist = 0.0
-    first_pt = True
     in_feature = vec_lyr_obj.GetNextFeature()
     while in_feature:
         if not open_transaction:
@@ -524,49 +531,35 @@ def split_lines_to_reg_pts(
         geom = in_feature.GetGeometryRef()
         if geom is not None:
             pts = geom.GetPoints()
-            first_pt = True
             c_dist = 0.0
             line_dist = 0.0
-            for pt in pts:
-                if first_pt:
-                    p_pt.SetPoint(0, pt[0], pt[1])
-                    c_pt.SetPoint(0, pt[0], pt[1])
-                    first_pt = False
-                else:
-                    p_pt.SetPoint(0, c_pt.GetX(), c_pt.GetY())
-                    c_pt.SetPoint(0, pt[0], pt[1])
-                    n_step = 0
-                    step_c_dist = c_dist
-                    while True:
-                        if (
-                            (p_pt.Distance(c_pt) + step_c_dist) - (pt_step * n_step)
-                        ) > pt_step:
-                            pt_at_dist = ((pt_step * n_step) + pt_step) - step_c_dist
-                            ptx, pty = get_pt_on_line(p_pt, c_pt, pt_at_dist)
-                            base_pt = ogr.Geometry(ogr.wkbPoint)
-                            base_pt.AddPoint(ptx, pty)
-                            out_feat = ogr.Feature(feat_defn)
-                            out_feat.SetGeometry(base_pt)
-                            out_feat.SetField("uid", pt_uid)
-                            out_feat.SetField("line_id", line_id)
-                            out_feat.SetField("pt_x", ptx)
-                            out_feat.SetField("pt_y", pty)
-                            out_feat.SetField("dist", line_dist)
-                            out_lyr_obj.CreateFeature(out_feat)
-                            out_feat = None
-                            pt_uid = pt_uid + 1
-                            n_step = n_step + 1
-                            line_dist = line_dist + pt_step
-                        else:
-                            if n_step == 0:
-                                c_dist = c_dist + p_pt.Distance(c_pt)
-                            else:
-                                c_dist = (p_pt.Distance(c_pt) + step_c_dist) - (
-                                    pt_step * n_step
-                                )
-                            break
-
-        if ((counter % 20000) == 0) and open_transaction:
+            for p_pt, c_pt in zip(pts[:-1], pts[1:]):
+                # The segment length and direction are fixed so only calculate once.
+                dx = c_pt[0] - p_pt[0]
+                dy = c_pt[1] - p_pt[1]
+                seg_len = hypot(dx, dy)
+                # The number of points along the segment, the points are
+                # pt_step apart continuing on from the previous segment.
+                n_seg_pts = max(int(ceil((seg_len + c_dist) / pt_step)) - 1, 0)
+                if n_seg_pts > 0:
+                    pts_at_dist = (pt_step * numpy.arange(1, n_seg_pts + 1)) - c_dist
+                    ptxs = p_pt[0] + (pts_at_dist * (dx / seg_len))
+                    ptys = p_pt[1] + (pts_at_dist * (dy / seg_len))
+                    for ptx, pty in zip(ptxs.tolist(), ptys.tolist()):
+                        base_pt.SetPoint_2D(0, ptx, pty)
+                        out_feat.SetFID(-1)
+                        out_feat.SetGeometry(base_pt)
+                        out_feat.SetField(uid_idx, pt_uid)
+                        out_feat.SetField(line_id_idx, line_id)
+                        out_feat.SetField(pt_x_idx, ptx)
+                        out_feat.SetField(pt_y_idx, pty)
+                        out_feat.SetField(dist_idx, line_dist)
+                        out_lyr_obj.CreateFeature(out_feat)
+                        pt_uid = pt_uid + 1
+                        line_dist = line_dist + pt_step
+                c_dist = (seg_len + c_dist) - (pt_step * n_seg_pts)
+
+        if ((counter % _TXN_SIZE) == 0) and open_transaction:
             out_lyr_obj.CommitTransaction()
             open_transaction = False
 
@@ -579,59 +572,240 @@ def split_lines_to_reg_pts(
         out_lyr_obj.CommitTransaction()
         open_transaction = False
     pbar.close()
+    out_feat = None
     out_lyr_obj.SyncToDisk()
     out_ds_obj = None
     vec_ds_obj = None
 
 
-def closest_line_intersection(
+def _require_fields(lyr_defn: ogr.FeatureDefn, req_fields: List[str]) -> List[str]:
+    """
+    An internal function which checks that the fields listed are present
+    within a vector layer definition.
+
+    :param lyr_defn: the ogr.FeatureDefn of the layer to be checked.
+    :param req_fields: list of the field names which are required.
+    :return: list of the required field names which are missing (empty if
+             all the fields are present).
+
+    """
+    lyr_fields = {
+        lyr_defn.GetFieldDefn(i).GetName() for i in range(lyr_defn.GetFieldCount())
+    }
+    return [field for field in req_fields if field not in lyr_fields]
+
+
+def _get_lyr_feat_count(vec_lyr_obj: ogr.Layer) -> Union[int, None]:
+    """
+    An internal function which gets the number of features in a vector layer
+    (e.g., to size a progress bar) without forcing the driver to scan the
+    layer if it cannot report the count directly.
+
+    :param vec_lyr_obj: the ogr.Layer.
+    :return: the number of features or None if the count is not available.
+
+    """
+    n_feats = vec_lyr_obj.GetFeatureCount(False)
+    if n_feats < 0:
+        return None
+    return n_feats
+
+
+def _line_xy(ogr_geom: ogr.Geometry):
+    """
+    An internal function which gets the vertices of an ogr geometry as a
+    numpy array. The geometry is passed to shapely as WKB so the coordinates
+    are unpacked directly into the array rather than as python tuples.
+
+    :param ogr_geom: the ogr.Geometry.
+    :return: 2D float64 numpy array (n_pts, 2) of the X and Y coordinates.
+
+    """
+    import shapely
+
+    return shapely.get_coordinates(shapely.from_wkb(bytes(ogr_geom.ExportToWkb())))
+
+
+def _get_lyr_geom_wkbs(vec_lyr_obj: ogr.Layer):
+    """
+    An internal function which reads the geometries of a vector layer as WKB.
+    Where available (GDAL >= 3.6) the geometries are read in batches using the
+    layer arrow stream interface rather than feature by feature. The attribute
+    fields are ignored while the geometries are read.
+
+    :param vec_lyr_obj: the ogr.Layer.
+    :return: a list or numpy array of the WKB geometries (None is used for
+             features without a geometry).
+
+    """
+    import numpy
+
+    if not hasattr(vec_lyr_obj, "GetArrowStreamAsNumPy"):
+        geom_wkbs = list()
+        n_feats = _get_lyr_feat_count(vec_lyr_obj)
+        pbar = tqdm.tqdm(total=n_feats, leave=True)
+        vec_lyr_obj.ResetReading()
+        in_feat = vec_lyr_obj.GetNextFeature()
+        while in_feat:
+            geom = in_feat.GetGeometryRef()
+            if geom is not None:
+                geom_wkbs.append(bytes(geom.ExportToWkb()))
+            else:
+                geom_wkbs.append(None)
+            in_feat = vec_lyr_obj.GetNextFeature()
+            pbar.update(1)
+        pbar.close()
+        return geom_wkbs
+
+    lyr_defn = vec_lyr_obj.GetLayerDefn()
+    vec_lyr_obj.SetIgnoredFields(
+        [lyr_defn.GetFieldDefn(i).GetName() for i in range(lyr_defn.GetFieldCount())]
+    )
+    geom_col = vec_lyr_obj.GetGeometryColumn()
+    if geom_col == "":
+        geom_col = "wkb_geometry"
+
+    wkb_batches = list()
+    try:
+        vec_lyr_obj.ResetReading()
+        stream = vec_lyr_obj.GetArrowStreamAsNumPy(options=["INCLUDE_FID=NO"])
+        for batch in stream:
+            wkb_batches.append(batch[geom_col])
+        stream = None
+    finally:
+        vec_lyr_obj.SetIgnoredFields([])
+
+    if len(wkb_batches) == 0:
+        return list()
+    return numpy.concatenate(wkb_batches)
+
+
+def _get_lyr_bound_lines(vec_lyr_obj: ogr.Layer):
+    """
+    An internal function which reads the boundaries (i.e., the rings) of the
+    polygons within a vector layer into an array of shapely line geometries.
+    The ring vertices are read into contiguous coordinate arrays and the lines
+    are created with a single call to shapely.linestrings.
+
+    :param vec_lyr_obj: the ogr.Layer of polygons.
+    :return: numpy array of shapely line geometries.
+
+    """
+    import shapely
+
+    geoms = shapely.from_wkb(_get_lyr_geom_wkbs(vec_lyr_obj))
+    polys = shapely.get_parts(geoms[~shapely.is_missing(geoms)])
+    rings_coords, rings_idxs = shapely.get_coordinates(
+        shapely.get_rings(polys), return_index=True
+    )
+    return shapely.linestrings(rings_coords, indices=rings_idxs)
+
+
+def _calc_line_intersect_pts(
+    lines, start_xs, start_ys, boundaries, bounds_tree, n_cores: int = 1
+):
+    """
+    An internal function used by the line intersection functions which
+    intersects an array of shapely lines with the boundaries indexed by
+    bounds_tree. The boundaries are prepared (GEOS prepared geometries) so the
+    repeated intersects tests against them are faster. The lines are split
+    into n_cores chunks which are processed
+    using a pool of threads; the shapely functions release the GIL so the
+    chunks are processed in parallel.
+
+    :param lines: numpy array of shapely line geometries.
+    :param start_xs: numpy array of the start point X coordinate for each line.
+    :param start_ys: numpy array of the start point Y coordinate for each line.
+    :param boundaries: numpy array of shapely boundary geometries.
+    :param bounds_tree: a shapely STRtree of the boundaries.
+    :param n_cores: the number of threads used to process the lines.
+    :return: numpy arrays of the line index (into lines), the intersection
+             point coordinates (n, 2) and the squared distance from the
+             start point of the line. The points are sorted by line index
+             and then distance.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy
+    import shapely
+
+    def _calc_chunk_pts(line_idxs):
+        # The candidates from the tree (bounding boxes) are filtered using the
+        # prepared boundaries, which are reused across many lines, rather than
+        # preparing each line within the tree query predicate.
+        chunk_line_idxs, bound_idxs = bounds_tree.query(lines[line_idxs])
+        inter_msk = shapely.intersects(
+            boundaries[bound_idxs], lines[line_idxs][chunk_line_idxs]
+        )
+        chunk_line_idxs = chunk_line_idxs[inter_msk]
+        bound_idxs = bound_idxs[inter_msk]
+        inter_geoms = shapely.intersection(
+            lines[line_idxs][chunk_line_idxs], boundaries[bound_idxs]
+        )
+        inter_pts, inter_idxs = shapely.get_coordinates(inter_geoms, return_index=True)
+        pt_line_idxs = line_idxs[chunk_line_idxs[inter_idxs]]
+        pt_dx = inter_pts[:, 0] - start_xs[pt_line_idxs]
+        pt_dy = inter_pts[:, 1] - start_ys[pt_line_idxs]
+        pts_dist2 = (pt_dx * pt_dx) + (pt_dy * pt_dy)
+        return pt_line_idxs, inter_pts, pts_dist2
+
+    # Prepare the boundaries before the threads are started.
+    shapely.prepare(boundaries)
+
+    n_cores = max(n_cores, 1)
+    line_chunks = numpy.array_split(numpy.arange(lines.shape[0]), n_cores)
+    with ThreadPoolExecutor(max_workers=n_cores) as executor:
+        chunk_results = list(executor.map(_calc_chunk_pts, line_chunks))
+
+    pt_line_idxs = numpy.concatenate([result[0] for result in chunk_results])
+    inter_pts = numpy.concatenate([result[1] for result in chunk_results])
+    pts_dist2 = numpy.concatenate([result[2] for result in chunk_results])
+
+    # Where polygons share an edge the same point is found for each of the
+    # boundaries so only keep one copy of each point for each line.
+    _, unq_idxs = numpy.unique(
+        numpy.column_stack((pt_line_idxs, inter_pts)), axis=0, return_index=True
+    )
+    pt_line_idxs = pt_line_idxs[unq_idxs]
+    inter_pts = inter_pts[unq_idxs]
+    pts_dist2 = pts_dist2[unq_idxs]
+
+    sort_idxs = numpy.lexsort((pts_dist2, pt_line_idxs))
+    return pt_line_idxs[sort_idxs], inter_pts[sort_idxs], pts_dist2[sort_idxs]
+
+
+def _get_line_intersect_pts(
     vec_line_file: str,
     vec_line_lyr: str,
     vec_objs_file: str,
     vec_objs_lyr: str,
-    out_vec_file: str,
-    out_vec_lyr: str = None,
-    start_x_field: str = "start_x",
-    start_y_field: str = "start_y",
-    uid_field: str = "uid",
-    out_format: str = "GPKG",
-    del_exist_vec: bool = False,
+    start_x_field: str,
+    start_y_field: str,
+    uid_field: str,
+    n_cores: int,
 ):
     """
-    A function which intersects each line within the input vector layer
-    (vec_objs_file, vec_objs_lyr) creating a new line between the start
-    point of the input layer (defined in the vector attribute table:
-    start_x_field, start_y_field) and the intersection point which is
-    closest to the start point.
+    An internal function used by the line intersection functions which reads
+    the input lines and the object polygons (subset to the extent of the lines)
+    and intersects the lines with the boundaries of the polygons.
 
     :param vec_line_file: Input lines vector file path.
     :param vec_line_lyr: Input lines vector layer name.
-    :param vec_objs_file: The vector file for the objects (expecting polygons)
-                          to be intersected with.
-    :param vec_objs_lyr: The vector layer for the objects (expecting polygons)
-                         to be intersected with.
-    :param out_vec_file: The output vector file path.
-    :param out_vec_lyr: The output vector layer name
-    :param start_x_field: The field name for the start point X coordinate for
-                          the input lines.
-    :param start_y_field: The field name for the start point Y coordinate for
-                          the input lines.
+    :param vec_objs_file: The vector file for the objects (expecting polygons).
+    :param vec_objs_lyr: The vector layer for the objects (expecting polygons).
+    :param start_x_field: The field name for the start point X coordinate.
+    :param start_y_field: The field name for the start point Y coordinate.
     :param uid_field: The field name for the Unique ID (UID) of the input lines.
-    :param out_format: The output file format of the vector file.
-    :param del_exist_vec: remove output file if it exists.
+    :param n_cores: the number of threads used to intersect the lines.
+    :return: numpy arrays of the line UIDs, start X and start Y coordinates;
+             the intersection points as returned by _calc_line_intersect_pts
+             (line index, coordinates and squared distance) and a copy of the
+             spatial reference of the object polygons layer.
 
     """
-    if os.path.exists(out_vec_file):
-        if del_exist_vec:
-            rsgislib.vectorutils.delete_vector_file(out_vec_file)
-        else:
-            raise rsgislib.RSGISPyException(
-                "The output vector file ({}) already exists, "
-                "remove it and re-run.".format(out_vec_file)
-            )
-
-    if out_vec_lyr is None:
-        out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
+    import numpy
+    import shapely
 
     vec_bbox = rsgislib.vectorutils.get_vec_layer_extent(vec_line_file, vec_line_lyr)
 
@@ -645,26 +819,19 @@ def closest_line_intersection(
             "Could not find layer '{}'".format(vec_line_lyr)
         )
 
-    x_col_exists = False
-    y_col_exists = False
-    uid_col_exists = False
     lyr_line_defn = lyr_line_vec.GetLayerDefn()
-    for i in range(lyr_line_defn.GetFieldCount()):
-        if lyr_line_defn.GetFieldDefn(i).GetName() == start_x_field:
-            x_col_exists = True
-        if lyr_line_defn.GetFieldDefn(i).GetName() == start_y_field:
-            y_col_exists = True
-        if lyr_line_defn.GetFieldDefn(i).GetName() == uid_field:
-            uid_col_exists = True
-        if x_col_exists and y_col_exists and uid_col_exists:
-            break
-
-    if (not x_col_exists) or (not y_col_exists) or (not uid_col_exists):
+    missing_fields = _require_fields(
+        lyr_line_defn, [start_x_field, start_y_field, uid_field]
+    )
+    if len(missing_fields) > 0:
         ds_line_vec = None
         raise rsgislib.RSGISPyException(
-            "The start x and y columns and/or UID column "
-            "are not present within the input file."
+            "The start x and y columns and/or UID column are not present "
+            "within the input file: {}".format(", ".join(missing_fields))
         )
+    uid_idx = lyr_line_defn.GetFieldIndex(uid_field)
+    start_x_idx = lyr_line_defn.GetFieldIndex(start_x_field)
+    start_y_idx = lyr_line_defn.GetFieldIndex(start_y_field)
 
     ds_objs_vec = gdal.OpenEx(vec_objs_file, gdal.OF_READONLY)
     if ds_objs_vec is None:
@@ -681,101 +848,152 @@ def closest_line_intersection(
     )
 
     spat_ref = lyr_objs_vec.GetSpatialRef()
+    if spat_ref is not None:
+        spat_ref = spat_ref.Clone()
 
-    out_driver = ogr.GetDriverByName(out_format)
-    out_ds_obj = out_driver.CreateDataSource(out_vec_file)
-    out_lyr_obj = out_ds_obj.CreateLayer(
-        out_vec_lyr, spat_ref, geom_type=ogr.wkbLineString
-    )
-    uid_field_obj = ogr.FieldDefn("uid", ogr.OFTInteger)
-    out_lyr_obj.CreateField(uid_field_obj)
-    length_field = ogr.FieldDefn("len", ogr.OFTReal)
-    out_lyr_obj.CreateField(length_field)
-    feat_defn = out_lyr_obj.GetLayerDefn()
-
-    geom_collect = ogr.Geometry(ogr.wkbGeometryCollection)
-    n_obj_feats = lyr_objs_sub_vec.GetFeatureCount(True)
-    geom_pbar = tqdm.tqdm(total=n_obj_feats, leave=True)
-    in_obj_feat = lyr_objs_sub_vec.GetNextFeature()
-    while in_obj_feat:
-        geom = in_obj_feat.GetGeometryRef()
-        if geom is not None:
-            boundary = geom.Boundary()
-            geom_collect.AddGeometry(boundary)
-        in_obj_feat = lyr_objs_sub_vec.GetNextFeature()
-        geom_pbar.update(1)
-    geom_pbar.close()
+    boundaries = _get_lyr_bound_lines(lyr_objs_sub_vec)
+    bounds_tree = shapely.STRtree(boundaries)
+    ds_objs_sub_vec = None
+    ds_objs_vec = None
 
+    # The feature count is the upper bound on the number of lines so the arrays
+    # are allocated up front and trimmed to the lines with a geometry.
     n_feats = lyr_line_vec.GetFeatureCount(True)
+    line_uids = numpy.empty(n_feats, dtype=numpy.int64)
+    line_start_xs = numpy.empty(n_feats, dtype=numpy.float64)
+    line_start_ys = numpy.empty(n_feats, dtype=numpy.float64)
+    line_wkbs = [None] * n_feats
+    n_lines = 0
     pbar = tqdm.tqdm(total=n_feats, leave=True)
-    open_transaction = False
-    counter = 0
     in_feature = lyr_line_vec.GetNextFeature()
-    while in_feature:
+    while in_feature and (n_lines < n_feats):
+        line_geom = in_feature.GetGeometryRef()
+        if line_geom is not None:
+            line_uids[n_lines] = in_feature.GetFieldAsInteger64(uid_idx)
+            line_start_xs[n_lines] = in_feature.GetFieldAsDouble(start_x_idx)
+            line_start_ys[n_lines] = in_feature.GetFieldAsDouble(start_y_idx)
+            line_wkbs[n_lines] = bytes(line_geom.ExportToWkb())
+            n_lines = n_lines + 1
+        in_feature = lyr_line_vec.GetNextFeature()
         pbar.update(1)
-        if not open_transaction:
-            out_lyr_obj.StartTransaction()
-            open_transaction = True
+    pbar.close()
+    ds_line_vec = None
+
+    line_uids = line_uids[0:n_lines]
+    line_start_xs = line_start_xs[0:n_lines]
+    line_start_ys = line_start_ys[0:n_lines]
+    line_wkbs = line_wkbs[0:n_lines]
+
+    pt_line_idxs, inter_pts, pts_dist2 = _calc_line_intersect_pts(
+        shapely.from_wkb(line_wkbs),
+        line_start_xs,
+        line_start_ys,
+        boundaries,
+        bounds_tree,
+        n_cores,
+    )
+    return (
+        line_uids,
+        line_start_xs,
+        line_start_ys,
+        pt_line_idxs,
+        inter_pts,
+        pts_dist2,
+        spat_ref,
+    )
+
+
+def closest_line_intersection(
+    vec_line_file: str,
+    vec_line_lyr: str,
+    vec_objs_file: str,
+    vec_objs_lyr: str,
+    out_vec_file: str,
+    out_vec_lyr: str = None,
+    start_x_field: str = "start_x",
+    start_y_field: str = "start_y",
+    uid_field: str = "uid",
+    out_format: str = "GPKG",
+    del_exist_vec: bool = False,
+    n_cores: int = -1,
+):
+    """
+    A function which intersects each line within the input vector layer
+    (vec_objs_file, vec_objs_lyr) creating a new line between the start
+    point of the input layer (defined in the vector attribute table:
+    start_x_field, start_y_field) and the intersection point which is
+    closest to the start point.
+
+    :param vec_line_file: Input lines vector file path.
+    :param vec_line_lyr: Input lines vector layer name.
+    :param vec_objs_file: The vector file for the objects (expecting polygons)
+                          to be intersected with.
+    :param vec_objs_lyr: The vector layer for the objects (expecting polygons)
+                         to be intersected with.
+    :param out_vec_file: The output vector file path.
+    :param out_vec_lyr: The output vector layer name
+    :param start_x_field: The field name for the start point X coordinate for
+                          the input lines.
+    :param start_y_field: The field name for the start point Y coordinate for
+                          the input lines.
+    :param uid_field: The field name for the Unique ID (UID) of the input lines.
+    :param out_format: The output file format of the vector file.
+    :param del_exist_vec: remove output file if it exists.
+    :param n_cores: the number of threads used to intersect the lines. If -1
+                    all available cores will be used. (Default: -1)
+
+    """
+    import numpy
 
-        line_geom = in_feature.GetGeometryRef()
-        if line_geom is not None:
-            uid_str = in_feature.GetField(uid_field)
-            start_pt_x = in_feature.GetField(start_x_field)
-            start_pt_y = in_feature.GetField(start_y_field)
-            start_pt = ogr.Geometry(ogr.wkbPoint)
-            start_pt.AddPoint(start_pt_x, start_pt_y)
-
-            inter_geom = geom_collect.Intersection(line_geom)
-
-            if (inter_geom is not None) and (inter_geom.GetGeometryCount() > 0):
-                min_dist_pt_x = 0.0
-                min_dist_pt_y = 0.0
-                min_dist = 0.0
-                c_pt = ogr.Geometry(ogr.wkbPoint)
-                c_pt.AddPoint(0.0, 0.0)
-                first_dist = True
-                for i in range(inter_geom.GetGeometryCount()):
-                    c_geom = inter_geom.GetGeometryRef(i)
-                    pts = c_geom.GetPoints()
-                    for pt in pts:
-                        c_pt.SetPoint(0, pt[0], pt[1])
-                        if first_dist:
-                            min_dist = start_pt.Distance(c_pt)
-                            min_dist_pt_x = pt[0]
-                            min_dist_pt_y = pt[1]
-                            first_dist = False
-                        else:
-                            pt_dist = start_pt.Distance(c_pt)
-                            if pt_dist < min_dist:
-                                min_dist = pt_dist
-                                min_dist_pt_x = pt[0]
-                                min_dist_pt_y = pt[1]
-                out_line = ogr.Geometry(ogr.wkbLineString)
-                out_line.AddPoint(start_pt_x, start_pt_y)
-                out_line.AddPoint(min_dist_pt_x, min_dist_pt_y)
-                out_feat = ogr.Feature(feat_defn)
-                out_feat.SetGeometry(out_line)
-                out_feat.SetField("uid", uid_str)
-                out_feat.SetField("len", min_dist)
-                out_lyr_obj.CreateFeature(out_feat)
-                out_feat = None
-
-        if ((counter % 20000) == 0) and open_transaction:
-            out_lyr_obj.CommitTransaction()
-            open_transaction = False
+    import rsgislib.tools.utils
 
-        in_feature = lyr_line_vec.GetNextFeature()
-        counter = counter + 1
+    if os.path.exists(out_vec_file):
+        if del_exist_vec:
+            rsgislib.vectorutils.delete_vector_file(out_vec_file)
+        else:
+            raise rsgislib.RSGISPyException(
+                "The output vector file ({}) already exists, "
+                "remove it and re-run.".format(out_vec_file)
+            )
 
-    if open_transaction:
-        out_lyr_obj.CommitTransaction()
-        open_transaction = False
-    pbar.close()
-    out_lyr_obj.SyncToDisk()
-    out_ds_obj = None
-    ds_line_vec = None
-    ds_objs_vec = None
-    ds_objs_sub_vec = None
+    if out_vec_lyr is None:
+        out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
+
+    if n_cores <= 0:
+        n_cores = rsgislib.tools.utils.num_process_cores()
+
+    (
+        line_uids,
+        line_start_xs,
+        line_start_ys,
+        pt_line_idxs,
+        inter_pts,
+        pts_dist2,
+        spat_ref,
+    ) = _get_line_intersect_pts(
+        vec_line_file,
+        vec_line_lyr,
+        vec_objs_file,
+        vec_objs_lyr,
+        start_x_field,
+        start_y_field,
+        uid_field,
+        n_cores,
+    )
+
+    # The points are sorted by distance so the first for each line is the closest.
+    line_idxs, min_idxs = numpy.unique(pt_line_idxs, return_index=True)
+
+    _write_lines_gdf(
+        numpy.column_stack(
+            (line_start_xs[line_idxs], line_start_ys[line_idxs], inter_pts[min_idxs])
+        ),
+        {"uid": line_uids[line_idxs], "len": numpy.sqrt(pts_dist2[min_idxs])},
+        spat_ref,
+        out_vec_file,
+        out_vec_lyr,
+        out_format,
+    )
 
 
 def line_intersection_range(
@@ -790,6 +1008,7 @@ def line_intersection_range(
     uid_field: str = "uid",
     out_format: str = "GPKG",
     del_exist_vec: bool = False,
+    n_cores: int = -1,
 ):
     """
     A function which intersects each line within the input vector layer
@@ -813,8 +1032,14 @@ def line_intersection_range(
     :param uid_field: The field name for the Unique ID (UID) of the input lines.
     :param out_format: The output file format of the vector file.
     :param del_exist_vec: remove output file if it exists.
+    :param n_cores: the number of threads used to intersect the lines. If -1
+                    all available cores will be used. (Default: -1)
 
     """
+    import numpy
+
+    import rsgislib.tools.utils
+
     if os.path.exists(out_vec_file):
         if del_exist_vec:
             rsgislib.vectorutils.delete_vector_file(out_vec_file)
@@ -827,162 +1052,48 @@ def line_intersection_range(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    vec_bbox = rsgislib.vectorutils.get_vec_layer_extent(vec_line_file, vec_line_lyr)
-
-    ds_line_vec = gdal.OpenEx(vec_line_file, gdal.OF_READONLY)
-    if ds_line_vec is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_line_file))
-
-    lyr_line_vec = ds_line_vec.GetLayerByName(vec_line_lyr)
-    if lyr_line_vec is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_line_lyr)
-        )
-
-    x_col_exists = False
-    y_col_exists = False
-    uid_col_exists = False
-    lyr_line_defn = lyr_line_vec.GetLayerDefn()
-    for i in range(lyr_line_defn.GetFieldCount()):
-        if lyr_line_defn.GetFieldDefn(i).GetName() == start_x_field:
-            x_col_exists = True
-        if lyr_line_defn.GetFieldDefn(i).GetName() == start_y_field:
-            y_col_exists = True
-        if lyr_line_defn.GetFieldDefn(i).GetName() == uid_field:
-            uid_col_exists = True
-        if x_col_exists and y_col_exists and uid_col_exists:
-            break
-
-    if (not x_col_exists) or (not y_col_exists) or (not uid_col_exists):
-        ds_line_vec = None
-        raise rsgislib.RSGISPyException(
-            "The start x and y columns and/or UID column "
-            "are not present within the input file."
-        )
-
-    ds_objs_vec = gdal.OpenEx(vec_objs_file, gdal.OF_READONLY)
-    if ds_objs_vec is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_objs_file))
-
-    lyr_objs_vec = ds_objs_vec.GetLayerByName(vec_objs_lyr)
-    if lyr_objs_vec is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_objs_lyr)
-        )
-
-    ds_objs_sub_vec, lyr_objs_sub_vec = rsgislib.vectorutils.subset_envs_vec_lyr_obj(
-        lyr_objs_vec, vec_bbox
+    if n_cores <= 0:
+        n_cores = rsgislib.tools.utils.num_process_cores()
+
+    (
+        line_uids,
+        line_start_xs,
+        line_start_ys,
+        pt_line_idxs,
+        inter_pts,
+        pts_dist2,
+        spat_ref,
+    ) = _get_line_intersect_pts(
+        vec_line_file,
+        vec_line_lyr,
+        vec_objs_file,
+        vec_objs_lyr,
+        start_x_field,
+        start_y_field,
+        uid_field,
+        n_cores,
     )
 
-    spat_ref = lyr_objs_vec.GetSpatialRef()
-
-    out_driver = ogr.GetDriverByName(out_format)
-    out_ds_obj = out_driver.CreateDataSource(out_vec_file)
-    out_lyr_obj = out_ds_obj.CreateLayer(
-        out_vec_lyr, spat_ref, geom_type=ogr.wkbLineString
+    # The points are sorted by distance so the first for each line is the
+    # closest and the last is the furthest.
+    line_idxs, min_idxs = numpy.unique(pt_line_idxs, return_index=True)
+    max_idxs = numpy.append(min_idxs[1:], pt_line_idxs.shape[0]) - 1
+
+    out_lines_xy = numpy.column_stack((inter_pts[min_idxs], inter_pts[max_idxs]))
+    _write_lines_gdf(
+        out_lines_xy,
+        {
+            "uid": line_uids[line_idxs],
+            "len": numpy.hypot(
+                out_lines_xy[:, 2] - out_lines_xy[:, 0],
+                out_lines_xy[:, 3] - out_lines_xy[:, 1],
+            ),
+        },
+        spat_ref,
+        out_vec_file,
+        out_vec_lyr,
+        out_format,
     )
-    uid_field_obj = ogr.FieldDefn("uid", ogr.OFTInteger)
-    out_lyr_obj.CreateField(uid_field_obj)
-    length_field = ogr.FieldDefn("len", ogr.OFTReal)
-    out_lyr_obj.CreateField(length_field)
-    feat_defn = out_lyr_obj.GetLayerDefn()
-
-    geom_collect = ogr.Geometry(ogr.wkbGeometryCollection)
-    n_obj_feats = lyr_objs_sub_vec.GetFeatureCount(True)
-    geom_pbar = tqdm.tqdm(total=n_obj_feats, leave=True)
-    in_obj_feat = lyr_objs_sub_vec.GetNextFeature()
-    while in_obj_feat:
-        geom = in_obj_feat.GetGeometryRef()
-        if geom is not None:
-            boundary = geom.Boundary()
-            geom_collect.AddGeometry(boundary)
-        in_obj_feat = lyr_objs_sub_vec.GetNextFeature()
-        geom_pbar.update(1)
-    geom_pbar.close()
-
-    n_feats = lyr_line_vec.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats, leave=True)
-    open_transaction = False
-    counter = 0
-    in_feature = lyr_line_vec.GetNextFeature()
-    while in_feature:
-        if not open_transaction:
-            out_lyr_obj.StartTransaction()
-            open_transaction = True
-
-        line_geom = in_feature.GetGeometryRef()
-        if line_geom is not None:
-            uid_str = in_feature.GetField(uid_field)
-            start_pt_x = in_feature.GetField(start_x_field)
-            start_pt_y = in_feature.GetField(start_y_field)
-            start_pt = ogr.Geometry(ogr.wkbPoint)
-            start_pt.AddPoint(start_pt_x, start_pt_y)
-
-            inter_geom = geom_collect.Intersection(line_geom)
-
-            if (inter_geom is not None) and (inter_geom.GetGeometryCount() > 0):
-                min_dist_pt_x = 0.0
-                min_dist_pt_y = 0.0
-                min_dist = 0.0
-                max_dist_pt_x = 0.0
-                max_dist_pt_y = 0.0
-                max_dist = 0.0
-                c_pt = ogr.Geometry(ogr.wkbPoint)
-                c_pt.AddPoint(0.0, 0.0)
-                first_dist = True
-                for i in range(inter_geom.GetGeometryCount()):
-                    c_geom = inter_geom.GetGeometryRef(i)
-                    pts = c_geom.GetPoints()
-                    for pt in pts:
-                        c_pt.SetPoint(0, pt[0], pt[1])
-                        if first_dist:
-                            min_dist = start_pt.Distance(c_pt)
-                            min_dist_pt_x = pt[0]
-                            min_dist_pt_y = pt[1]
-                            max_dist = min_dist
-                            max_dist_pt_x = min_dist_pt_x
-                            max_dist_pt_y = min_dist_pt_y
-                            first_dist = False
-                        else:
-                            pt_dist = start_pt.Distance(c_pt)
-                            if pt_dist < min_dist:
-                                min_dist = pt_dist
-                                min_dist_pt_x = pt[0]
-                                min_dist_pt_y = pt[1]
-                            if pt_dist > max_dist:
-                                max_dist = pt_dist
-                                max_dist_pt_x = pt[0]
-                                max_dist_pt_y = pt[1]
-                out_line = ogr.Geometry(ogr.wkbLineString)
-                out_line.AddPoint(min_dist_pt_x, min_dist_pt_y)
-                out_line.AddPoint(max_dist_pt_x, max_dist_pt_y)
-                out_feat = ogr.Feature(feat_defn)
-                out_feat.SetGeometry(out_line)
-                out_feat.SetField("uid", uid_str)
-                start_pt.SetPoint(0, min_dist_pt_x, min_dist_pt_y)
-                c_pt.SetPoint(0, max_dist_pt_x, max_dist_pt_y)
-                dist = start_pt.Distance(c_pt)
-                out_feat.SetField("len", dist)
-                out_lyr_obj.CreateFeature(out_feat)
-                out_feat = None
-
-        if ((counter % 20000) == 0) and open_transaction:
-            out_lyr_obj.CommitTransaction()
-            open_transaction = False
-
-        in_feature = lyr_line_vec.GetNextFeature()
-        counter = counter + 1
-        pbar.update(1)
-
-    if open_transaction:
-        out_lyr_obj.CommitTransaction()
-        open_transaction = False
-    pbar.close()
-    out_lyr_obj.SyncToDisk()
-    out_ds_obj = None
-    ds_line_vec = None
-    ds_objs_vec = None
-    ds_objs_sub_vec = None
 
 
 def scnd_line_intersection_range(
@@ -997,6 +1108,7 @@ def scnd_line_intersection_range(
     uid_field: str = "uid",
     out_format: str = "GPKG",
     del_exist_vec: bool = False,
+    n_cores: int = -1,
 ):
     """
     A function which intersects a line with a set of polygons outputting the
@@ -1019,8 +1131,14 @@ def scnd_line_intersection_range(
     :param uid_field: The field name for the Unique ID (UID) of the input lines.
     :param out_format: The output file format of the vector file.
     :param del_exist_vec: remove output file if it exists.
+    :param n_cores: the number of threads used to intersect the lines. If -1
+                    all available cores will be used. (Default: -1)
 
     """
+    import numpy
+
+    import rsgislib.tools.utils
+
     if os.path.exists(out_vec_file):
         if del_exist_vec:
             rsgislib.vectorutils.delete_vector_file(out_vec_file)
@@ -1033,196 +1151,63 @@ def scnd_line_intersection_range(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    vec_bbox = rsgislib.vectorutils.get_vec_layer_extent(vec_line_file, vec_line_lyr)
-
-    ds_line_vec = gdal.OpenEx(vec_line_file, gdal.OF_READONLY)
-    if ds_line_vec is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_line_file))
-
-    lyr_line_vec = ds_line_vec.GetLayerByName(vec_line_lyr)
-    if lyr_line_vec is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_line_lyr)
-        )
-
-    x_col_exists = False
-    y_col_exists = False
-    uid_col_exists = False
-    lyr_line_defn = lyr_line_vec.GetLayerDefn()
-    for i in range(lyr_line_defn.GetFieldCount()):
-        if lyr_line_defn.GetFieldDefn(i).GetName() == start_x_field:
-            x_col_exists = True
-        if lyr_line_defn.GetFieldDefn(i).GetName() == start_y_field:
-            y_col_exists = True
-        if lyr_line_defn.GetFieldDefn(i).GetName() == uid_field:
-            uid_col_exists = True
-        if x_col_exists and y_col_exists and uid_col_exists:
-            break
-
-    if (not x_col_exists) or (not y_col_exists) or (not uid_col_exists):
-        ds_line_vec = None
-        raise rsgislib.RSGISPyException(
-            "The start x and y columns and/or UID column are "
-            "not present within the input file."
-        )
-
-    ds_objs_vec = gdal.OpenEx(vec_objs_file, gdal.OF_READONLY)
-    if ds_objs_vec is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_objs_file))
-
-    lyr_objs_vec = ds_objs_vec.GetLayerByName(vec_objs_lyr)
-    if lyr_objs_vec is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_objs_lyr)
-        )
-
-    ds_objs_sub_vec, lyr_objs_sub_vec = rsgislib.vectorutils.subset_envs_vec_lyr_obj(
-        lyr_objs_vec, vec_bbox
+    if n_cores <= 0:
+        n_cores = rsgislib.tools.utils.num_process_cores()
+
+    (
+        line_uids,
+        line_start_xs,
+        line_start_ys,
+        pt_line_idxs,
+        inter_pts,
+        pts_dist2,
+        spat_ref,
+    ) = _get_line_intersect_pts(
+        vec_line_file,
+        vec_line_lyr,
+        vec_objs_file,
+        vec_objs_lyr,
+        start_x_field,
+        start_y_field,
+        uid_field,
+        n_cores,
     )
 
-    spat_ref = lyr_objs_vec.GetSpatialRef()
-
-    out_driver = ogr.GetDriverByName(out_format)
-    out_ds_obj = out_driver.CreateDataSource(out_vec_file)
-    out_lyr_obj = out_ds_obj.CreateLayer(
-        out_vec_lyr, spat_ref, geom_type=ogr.wkbLineString
+    # The points are sorted by distance so the second for each line is the
+    # second closest. Lines with a single intersection are not outputted.
+    line_idxs, min_idxs, n_line_pts = numpy.unique(
+        pt_line_idxs, return_index=True, return_counts=True
     )
-    uid_field_out_obj = ogr.FieldDefn("uid", ogr.OFTInteger)
-    out_lyr_obj.CreateField(uid_field_out_obj)
-    start_x_out_field = ogr.FieldDefn("start_x", ogr.OFTReal)
-    out_lyr_obj.CreateField(start_x_out_field)
-    start_y_out_field = ogr.FieldDefn("start_y", ogr.OFTReal)
-    out_lyr_obj.CreateField(start_y_out_field)
-    end_x_out_field = ogr.FieldDefn("end_x", ogr.OFTReal)
-    out_lyr_obj.CreateField(end_x_out_field)
-    end_y_out_field = ogr.FieldDefn("end_y", ogr.OFTReal)
-    out_lyr_obj.CreateField(end_y_out_field)
-    length_field = ogr.FieldDefn("len", ogr.OFTReal)
-    out_lyr_obj.CreateField(length_field)
-    feat_defn = out_lyr_obj.GetLayerDefn()
-
-    geom_collect = ogr.Geometry(ogr.wkbGeometryCollection)
-    n_obj_feats = lyr_objs_sub_vec.GetFeatureCount(True)
-    geom_pbar = tqdm.tqdm(total=n_obj_feats, leave=True)
-    in_obj_feat = lyr_objs_sub_vec.GetNextFeature()
-    while in_obj_feat:
-        geom = in_obj_feat.GetGeometryRef()
-        if geom is not None:
-            boundary = geom.Boundary()
-            geom_collect.AddGeometry(boundary)
-        in_obj_feat = lyr_objs_sub_vec.GetNextFeature()
-        geom_pbar.update(1)
-    geom_pbar.close()
-
-    n_feats = lyr_line_vec.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats, leave=True)
-    open_transaction = False
-    counter = 0
-    in_feature = lyr_line_vec.GetNextFeature()
-    while in_feature:
-        if not open_transaction:
-            out_lyr_obj.StartTransaction()
-            open_transaction = True
-
-        line_geom = in_feature.GetGeometryRef()
-        if line_geom is not None:
-            uid_str = in_feature.GetField(uid_field)
-            start_pt_x = in_feature.GetField(start_x_field)
-            start_pt_y = in_feature.GetField(start_y_field)
-            start_pt = ogr.Geometry(ogr.wkbPoint)
-            start_pt.AddPoint(start_pt_x, start_pt_y)
-
-            inter_geom = geom_collect.Intersection(line_geom)
-
-            if (inter_geom is not None) and (inter_geom.GetGeometryCount() > 0):
-                min_dist_pt_x = 0.0
-                min_dist_pt_y = 0.0
-                min_dist = 0.0
-                sec_dist_pt_x = 0.0
-                sec_dist_pt_y = 0.0
-                sec_dist = 0.0
-                c_pt = ogr.Geometry(ogr.wkbPoint)
-                c_pt.AddPoint(0.0, 0.0)
-                first_dist = True
-                first_sec = True
-                for i in range(inter_geom.GetGeometryCount()):
-                    c_geom = inter_geom.GetGeometryRef(i)
-                    pts = c_geom.GetPoints()
-                    for pt in pts:
-                        c_pt.SetPoint(0, pt[0], pt[1])
-                        if first_dist:
-                            min_dist = start_pt.Distance(c_pt)
-                            min_dist_pt_x = pt[0]
-                            min_dist_pt_y = pt[1]
-                            first_dist = False
-                        elif first_sec:
-                            pt_dist = start_pt.Distance(c_pt)
-                            if pt_dist < min_dist:
-                                sec_dist = min_dist
-                                sec_dist_pt_x = min_dist_pt_x
-                                sec_dist_pt_y = min_dist_pt_y
-                                min_dist = pt_dist
-                                min_dist_pt_x = pt[0]
-                                min_dist_pt_y = pt[1]
-                            else:
-                                sec_dist = pt_dist
-                                sec_dist_pt_x = pt[0]
-                                sec_dist_pt_y = pt[1]
-                            first_sec = False
-                        else:
-                            pt_dist = start_pt.Distance(c_pt)
-                            if pt_dist < min_dist:
-                                sec_dist = min_dist
-                                sec_dist_pt_x = min_dist_pt_x
-                                sec_dist_pt_y = min_dist_pt_y
-                                min_dist = pt_dist
-                                min_dist_pt_x = pt[0]
-                                min_dist_pt_y = pt[1]
-                            elif pt_dist < sec_dist:
-                                sec_dist = pt_dist
-                                sec_dist_pt_x = pt[0]
-                                sec_dist_pt_y = pt[1]
-
-                out_line = ogr.Geometry(ogr.wkbLineString)
-                out_line.AddPoint(start_pt_x, start_pt_y)
-                out_line.AddPoint(sec_dist_pt_x, sec_dist_pt_y)
-                out_feat = ogr.Feature(feat_defn)
-                out_feat.SetGeometry(out_line)
-                out_feat.SetField("uid", uid_str)
-                c_pt.SetPoint(0, sec_dist_pt_x, sec_dist_pt_y)
-                dist = start_pt.Distance(c_pt)
-                out_feat.SetField("len", dist)
-                out_feat.SetField("start_x", start_pt_x)
-                out_feat.SetField("start_y", start_pt_y)
-                out_feat.SetField("end_x", sec_dist_pt_x)
-                out_feat.SetField("end_y", sec_dist_pt_y)
-                out_lyr_obj.CreateFeature(out_feat)
-                out_feat = None
-
-        if ((counter % 20000) == 0) and open_transaction:
-            out_lyr_obj.CommitTransaction()
-            open_transaction = False
-
-        in_feature = lyr_line_vec.GetNextFeature()
-        counter = counter + 1
-        pbar.update(1)
+    line_idxs = line_idxs[n_line_pts > 1]
+    sec_idxs = min_idxs[n_line_pts > 1] + 1
 
-    if open_transaction:
-        out_lyr_obj.CommitTransaction()
-        open_transaction = False
-    pbar.close()
-    out_lyr_obj.SyncToDisk()
-    out_ds_obj = None
-    ds_line_vec = None
-    ds_objs_vec = None
-    ds_objs_sub_vec = None
+    out_lines_xy = numpy.column_stack(
+        (line_start_xs[line_idxs], line_start_ys[line_idxs], inter_pts[sec_idxs])
+    )
+    _write_lines_gdf(
+        out_lines_xy,
+        {
+            "uid": line_uids[line_idxs],
+            "start_x": out_lines_xy[:, 0],
+            "start_y": out_lines_xy[:, 1],
+            "end_x": out_lines_xy[:, 2],
+            "end_y": out_lines_xy[:, 3],
+            "len": numpy.sqrt(pts_dist2[sec_idxs]),
+        },
+        spat_ref,
+        out_vec_file,
+        out_vec_lyr,
+        out_format,
+    )
 
 
 def calc_poly_centroids(
     vec_file: str, vec_lyr: str, out_format: str, out_vec_file: str, out_vec_lyr: str
 ):
     """
-    Create a vector layer of the polygon centroids.
+    Create a vector layer of the polygon centroids. The centroids are
+    calculated for all the polygons at once using shapely and the output
+    written using geopandas.
 
     :param vec_file: input vector file
     :param vec_lyr: input vector layer within the input file.
@@ -1231,62 +1216,85 @@ def calc_poly_centroids(
     :param out_vec_lyr: output vector layer name.
 
     """
-    vecDS = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
-    if vecDS is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_file))
+    import geopandas
+    import shapely
 
-    vec_lyr_obj = vecDS.GetLayerByName(vec_lyr)
-    if vec_lyr_obj is None:
-        raise rsgislib.RSGISPyException("Could not open layer '{}'".format(vec_lyr))
-    lyr_spat_ref = vec_lyr_obj.GetSpatialRef()
+    data_gdf = _read_vec_lyr_gdf(vec_file, vec_lyr)
+    centroids_gdf = geopandas.GeoDataFrame(
+        geometry=shapely.centroid(data_gdf.geometry.dropna().values),
+        crs=data_gdf.crs,
+    )
+    if out_format == "GPKG":
+        centroids_gdf.to_file(out_vec_file, layer=out_vec_lyr, driver=out_format)
+    else:
+        centroids_gdf.to_file(out_vec_file, driver=out_format)
 
-    out_driver = ogr.GetDriverByName(out_format)
-    result_ds = out_driver.CreateDataSource(out_vec_file)
-    if result_ds is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(out_vec_file))
 
-    result_lyr = result_ds.CreateLayer(
-        out_vec_lyr, lyr_spat_ref, geom_type=ogr.wkbPoint
-    )
-    if result_lyr is None:
-        raise rsgislib.RSGISPyException("Could not open layer '{}'".format(out_vec_lyr))
+def _read_vec_lyr_gdf(vec_file: str, vec_lyr: str):
+    """
+    An internal function which reads a vector layer into a geopandas
+    GeoDataFrame. If pyogrio is available the layer is read with it (using
+    arrow if pyarrow is also available) rather than feature by feature
+    through fiona.
 
-    featDefn = result_lyr.GetLayerDefn()
+    :param vec_file: Input vector file path.
+    :param vec_lyr: Input vector layer name.
+    :return: geopandas.GeoDataFrame
 
-    openTransaction = False
-    vec_lyr_obj.ResetReading()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
-    print(n_feats)
-    counter = 0
-    pbar = tqdm.tqdm(total=n_feats)
-    vec_lyr_obj.ResetReading()
-    feat = vec_lyr_obj.GetNextFeature()
-    while feat is not None:
-        if not openTransaction:
-            result_lyr.StartTransaction()
-            openTransaction = True
+    """
+    import importlib.util
 
-        pt = feat.GetGeometryRef().Centroid()
-        outFeat = ogr.Feature(featDefn)
-        outFeat.SetGeometry(pt)
-        result_lyr.CreateFeature(outFeat)
+    import geopandas
 
-        if ((counter % 20000) == 0) and openTransaction:
-            result_lyr.CommitTransaction()
-            openTransaction = False
+    if importlib.util.find_spec("pyogrio") is None:
+        return geopandas.read_file(vec_file, layer=vec_lyr)
 
-        feat = vec_lyr_obj.GetNextFeature()
-        counter = counter + 1
-        pbar.update(1)
+    import pyogrio
 
-    if openTransaction:
-        result_lyr.CommitTransaction()
-        openTransaction = False
-    result_lyr.SyncToDisk()
-    pbar.close()
+    use_arrow = importlib.util.find_spec("pyarrow") is not None
+    return pyogrio.read_dataframe(vec_file, layer=vec_lyr, use_arrow=use_arrow)
 
-    vecDS = None
-    result_ds = None
+
+@functools.lru_cache(maxsize=4)
+def _read_vec_lyr_gdf_lru(vec_file: str, vec_lyr: str, mtime_ns: int, size: int):
+    """
+    An internal function which caches the layers read by _read_vec_lyr_gdf.
+    The modification time and size of the file are part of the cache key so
+    a file which has been changed is read again.
+
+    :param vec_file: Input vector file path (absolute).
+    :param vec_lyr: Input vector layer name.
+    :param mtime_ns: The modification time of the file (os.stat st_mtime_ns).
+    :param size: The size of the file (os.stat st_size).
+    :return: geopandas.GeoDataFrame
+
+    """
+    return _read_vec_lyr_gdf(vec_file, vec_lyr)
+
+
+def _read_vec_lyr_gdf_cached(vec_file: str, vec_lyr: str):
+    """
+    An internal function which reads a vector layer into a geopandas
+    GeoDataFrame, reusing the GeoDataFrame if the same layer has recently
+    been read (e.g., when the same overlay layer is used for a series of
+    vec_lyr_*_gp calls). A copy is returned so the cached layer is not
+    modified by the caller. Paths which are not local files (e.g., GDAL
+    virtual file systems) are not cached.
+
+    :param vec_file: Input vector file path.
+    :param vec_lyr: Input vector layer name.
+    :return: geopandas.GeoDataFrame
+
+    """
+    if not os.path.isfile(vec_file):
+        return _read_vec_lyr_gdf(vec_file, vec_lyr)
+    vec_file_stat = os.stat(vec_file)
+    return _read_vec_lyr_gdf_lru(
+        os.path.abspath(vec_file),
+        vec_lyr,
+        vec_file_stat.st_mtime_ns,
+        vec_file_stat.st_size,
+    ).copy()
 
 
 def vec_lyr_intersection_gp(
@@ -1326,8 +1334,8 @@ def vec_lyr_intersection_gp(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    data_gdf = geopandas.read_file(vec_file, layer=vec_lyr)
-    over_data_gdf = geopandas.read_file(vec_over_file, layer=vec_over_lyr)
+    data_gdf = _read_vec_lyr_gdf(vec_file, vec_lyr)
+    over_data_gdf = _read_vec_lyr_gdf_cached(vec_over_file, vec_over_lyr)
     # Perform Intersection
     data_inter_gdf = geopandas.overlay(data_gdf, over_data_gdf, how="intersection")
 
@@ -1378,8 +1386,8 @@ def vec_lyr_difference_gp(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    data_gdf = geopandas.read_file(vec_file, layer=vec_lyr)
-    over_data_gdf = geopandas.read_file(vec_over_file, layer=vec_over_lyr)
+    data_gdf = _read_vec_lyr_gdf(vec_file, vec_lyr)
+    over_data_gdf = _read_vec_lyr_gdf_cached(vec_over_file, vec_over_lyr)
     # Perform Difference
     data_inter_gdf = geopandas.overlay(data_gdf, over_data_gdf, how="difference")
 
@@ -1430,8 +1438,8 @@ def vec_lyr_sym_difference_gp(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    data_gdf = geopandas.read_file(vec_file, layer=vec_lyr)
-    over_data_gdf = geopandas.read_file(vec_over_file, layer=vec_over_lyr)
+    data_gdf = _read_vec_lyr_gdf(vec_file, vec_lyr)
+    over_data_gdf = _read_vec_lyr_gdf_cached(vec_over_file, vec_over_lyr)
     # Perform symmetric difference
     data_inter_gdf = geopandas.overlay(
         data_gdf, over_data_gdf, how="symmetric_difference"
@@ -1487,8 +1495,8 @@ def vec_lyr_identity_gp(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    data_gdf = geopandas.read_file(vec_file, layer=vec_lyr)
-    over_data_gdf = geopandas.read_file(vec_over_file, layer=vec_over_lyr)
+    data_gdf = _read_vec_lyr_gdf(vec_file, vec_lyr)
+    over_data_gdf = _read_vec_lyr_gdf_cached(vec_over_file, vec_over_lyr)
     # Perform identity
     data_inter_gdf = geopandas.overlay(data_gdf, over_data_gdf, how="identity")
 
@@ -1539,8 +1547,8 @@ def vec_lyr_union_gp(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    data_gdf = geopandas.read_file(vec_file, layer=vec_lyr)
-    over_data_gdf = geopandas.read_file(vec_over_file, layer=vec_over_lyr)
+    data_gdf = _read_vec_lyr_gdf(vec_file, vec_lyr)
+    over_data_gdf = _read_vec_lyr_gdf_cached(vec_over_file, vec_over_lyr)
     # Perform union
     data_inter_gdf = geopandas.overlay(data_gdf, over_data_gdf, how="union")
 
@@ -1554,34 +1562,29 @@ def vec_lyr_union_gp(
         data_inter_gdf.to_file(out_vec_file, driver=out_format)
 
 
-def get_vec_lyr_as_pts(vec_file: str, vec_lyr: str) -> List:
+def get_vec_lyr_as_pts(vec_file: str, vec_lyr: str):
     """
-    Get a list of points from the vectors within an input file.
+    Get an array of the points (i.e., vertices) of the vectors within an input file.
 
     :param vec_file: Input vector file
     :param vec_lyr: Input vector layer name
-    :return: returns a list of points.
+    :return: returns a 2D numpy array (n_pts, 2) of the X and Y coordinates.
 
     """
-    import tqdm
+    import shapely
 
     vec_ds_obj = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
+    if vec_ds_obj is None:
+        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_file))
     vec_lyr_obj = vec_ds_obj.GetLayer(vec_lyr)
+    if vec_lyr_obj is None:
+        raise rsgislib.RSGISPyException("Could not open layer '{}'".format(vec_lyr))
 
-    pts_lst = list()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    counter = 0
-    in_feature = vec_lyr_obj.GetNextFeature()
-    while in_feature:
-        geom = in_feature.GetGeometryRef()
-        if geom is not None:
-            get_geom_pts(geom, pts_lst)
-        in_feature = vec_lyr_obj.GetNextFeature()
-        counter = counter + 1
-        pbar.update(1)
-    pbar.close()
-    return pts_lst
+    geom_wkbs = _get_lyr_geom_wkbs(vec_lyr_obj)
+    vec_lyr_obj = None
+    vec_ds_obj = None
+
+    return shapely.get_coordinates(shapely.from_wkb(geom_wkbs))
 
 
 def create_alpha_shape(
@@ -1630,6 +1633,7 @@ def create_alpha_shape(
 
     """
     import alphashape
+    import shapely
 
     if os.path.exists(out_vec_file):
         if del_exist_vec:
@@ -1640,44 +1644,11 @@ def create_alpha_shape(
                 "remove it and re-run.".format(out_vec_file)
             )
 
-    def _rescale_polygon(in_poly, min_x, min_y, ran_x, ran_y):
-        ext_ring = ogr.Geometry(ogr.wkbLinearRing)
-        for pt in in_poly.exterior.coords:
-            ext_ring.AddPoint(((pt[0] * ran_x) + min_x), ((pt[1] * ran_y) + min_y))
-        n_poly = ogr.Geometry(ogr.wkbPolygon)
-        n_poly.AddGeometry(ext_ring)
-
-        for int_ring in in_poly.interiors:
-            n_int_ring = ogr.Geometry(ogr.wkbLinearRing)
-            for pt in int_ring.coords:
-                n_int_ring.AddPoint(
-                    ((pt[0] * ran_x) + min_x), ((pt[1] * ran_y) + min_y)
-                )
-            n_poly.AddGeometry(n_int_ring)
-        return n_poly
-
     pts = get_vec_lyr_as_pts(vec_file, vec_lyr)
-    min_x = 0.0
-    min_y = 0.0
-    max_x = 0.0
-    max_y = 0.0
-    first = True
-    for pt in pts:
-        if first:
-            min_x = pt[0]
-            min_y = pt[1]
-            max_x = pt[0]
-            max_y = pt[1]
-            first = False
-        else:
-            if pt[0] < min_x:
-                min_x = pt[0]
-            if pt[1] < min_y:
-                min_y = pt[1]
-            if pt[0] > max_x:
-                max_x = pt[0]
-            if pt[1] > max_y:
-                max_y = pt[1]
+    if pts.shape[0] == 0:
+        raise rsgislib.RSGISPyException("The input vector layer has no points.")
+    min_x, min_y = pts.min(axis=0)
+    max_x, max_y = pts.max(axis=0)
 
     print("Min: {}, {}".format(min_x, min_y))
     print("Max: {}, {}".format(max_x, max_y))
@@ -1686,11 +1657,7 @@ def create_alpha_shape(
     ran_y = max_y - min_y
     print("Range: {}, {}".format(ran_x, ran_y))
 
-    norm_pts = list()
-    for pt in pts:
-        norm_x = (pt[0] - min_x) / ran_x
-        norm_y = (pt[1] - min_y) / ran_y
-        norm_pts.append((norm_x, norm_y))
+    norm_pts = (pts - (min_x, min_y)) / (ran_x, ran_y)
 
     if alpha_vals is not None:
         for alpha_test_val in alpha_vals:
@@ -1711,16 +1678,15 @@ def create_alpha_shape(
         alpha_shape = alphashape.alphashape(norm_pts, alpha=alpha_val)
 
     ogr_geom_type = ogr.wkbPolygon
-    if alpha_shape.geom_type == "MultiPolygon":
-        ogr_geom_type = ogr.wkbMultiPolygon
-        out_alpha_shape = ogr.Geometry(ogr.wkbMultiPolygon)
-        for poly in alpha_shape:
-            out_alpha_shape.AddGeometry(
-                _rescale_polygon(poly, min_x, min_y, ran_x, ran_y)
-            )
-    elif alpha_shape.geom_type == "Polygon":
-        ogr_geom_type = ogr.wkbPolygon
-        out_alpha_shape = _rescale_polygon(alpha_shape, min_x, min_y, ran_x, ran_y)
+    if alpha_shape.geom_type in ["MultiPolygon", "Polygon"]:
+        if alpha_shape.geom_type == "MultiPolygon":
+            ogr_geom_type = ogr.wkbMultiPolygon
+        # Rescale all the coordinates of the alpha shape (i.e., all the rings of
+        # all the polygons) back to the input coordinate system in one operation.
+        alpha_shape = shapely.transform(
+            alpha_shape, lambda coords: (coords * (ran_x, ran_y)) + (min_x, min_y)
+        )
+        out_alpha_shape = ogr.CreateGeometryFromWkb(shapely.to_wkb(alpha_shape))
     else:
         out_alpha_shape = None
         print("No output, did not create an output polygon or multipolygon...")
@@ -1816,7 +1782,6 @@ def explode_vec_files(
                         be a dot within the extension. e.g., gpkg, shp, geojson.
 
     """
-    import tqdm
 
     import rsgislib.tools.filetools
 
@@ -1848,7 +1813,6 @@ def convert_multi_geoms_to_single(
     :param del_exist_vec: remove output file if it exists.
 
     """
-    import tqdm
 
     if os.path.exists(out_vec_file):
         if del_exist_vec:
@@ -1888,11 +1852,26 @@ def convert_multi_geoms_to_single(
         raise rsgislib.RSGISPyException("Could not open layer '{}'".format(out_vec_lyr))
 
     featDefn = result_lyr.GetLayerDefn()
+    # The (flattened, i.e., 2D) geometry types which are split into parts.
+    multi_geom_types = {
+        ogr.wkbMultiPolygon,
+        ogr.wkbMultiLineString,
+        ogr.wkbMultiPoint,
+        ogr.wkbGeometryCollection,
+    }
+    # A single output feature is reused for every geometry written and the
+    # methods called for each geometry are bound once before the loop.
+    outFeat = ogr.Feature(featDefn)
+    set_out_fid = outFeat.SetFID
+    set_out_geom = outFeat.SetGeometry
+    create_feature = result_lyr.CreateFeature
 
     openTransaction = False
     vec_lyr_obj.ResetReading()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
-    counter = 0
+    n_feats = _get_lyr_feat_count(vec_lyr_obj)
+    # The transactions are sized by the number of features written rather than
+    # read so a feature with many parts does not create one huge transaction.
+    n_txn_feats = 0
     pbar = tqdm.tqdm(total=n_feats)
     vec_lyr_obj.ResetReading()
     feat = vec_lyr_obj.GetNextFeature()
@@ -1902,47 +1881,36 @@ def convert_multi_geoms_to_single(
             openTransaction = True
 
         geom_ref = feat.GetGeometryRef()
-
-        if geom_ref.GetGeometryName().lower() == "multipolygon":
-            for i in range(0, geom_ref.GetGeometryCount()):
-                g = geom_ref.GetGeometryRef(i)
-                outFeat = ogr.Feature(featDefn)
-                outFeat.SetGeometry(g)
-                result_lyr.CreateFeature(outFeat)
-        elif geom_ref.GetGeometryName().lower() == "multilinestring":
-            for i in range(0, geom_ref.GetGeometryCount()):
-                g = geom_ref.GetGeometryRef(i)
-                outFeat = ogr.Feature(featDefn)
-                outFeat.SetGeometry(g)
-                result_lyr.CreateFeature(outFeat)
-        elif geom_ref.GetGeometryName().lower() == "multipoint":
-            for i in range(0, geom_ref.GetGeometryCount()):
-                g = geom_ref.GetGeometryRef(i)
-                outFeat = ogr.Feature(featDefn)
-                outFeat.SetGeometry(g)
-                result_lyr.CreateFeature(outFeat)
-        elif geom_ref.GetGeometryName().lower() == "geometrycollection":
-            for i in range(0, geom_ref.GetGeometryCount()):
-                g = geom_ref.GetGeometryRef(i)
-                outFeat = ogr.Feature(featDefn)
-                outFeat.SetGeometry(g)
-                result_lyr.CreateFeature(outFeat)
-        else:
-            outFeat = ogr.Feature(featDefn)
-            outFeat.SetGeometry(geom_ref)
-            result_lyr.CreateFeature(outFeat)
-
-        if ((counter % 20000) == 0) and openTransaction:
-            result_lyr.CommitTransaction()
-            openTransaction = False
-
+        if geom_ref is not None:
+            if ogr.GT_Flatten(geom_ref.GetGeometryType()) in multi_geom_types:
+                out_geoms = (
+                    geom_ref.GetGeometryRef(i)
+                    for i in range(geom_ref.GetGeometryCount())
+                )
+            else:
+                out_geoms = (geom_ref,)
+            for out_geom in out_geoms:
+                set_out_fid(-1)
+                set_out_geom(out_geom)
+                create_feature(outFeat)
+                n_txn_feats += 1
+                if n_txn_feats == _TXN_SIZE:
+                    result_lyr.CommitTransaction()
+                    result_lyr.StartTransaction()
+                    n_txn_feats = 0
+            out_geoms = None
+            out_geom = None
+
+        # Release the geometry and feature before the next feature is read.
+        geom_ref = None
+        feat = None
         feat = vec_lyr_obj.GetNextFeature()
-        counter += 1
         pbar.update(1)
 
     if openTransaction:
         result_lyr.CommitTransaction()
         openTransaction = False
+    outFeat = None
     result_lyr.SyncToDisk()
     pbar.close()
 
@@ -1958,6 +1926,8 @@ def simplify_geometries(
     out_vec_file: str,
     out_vec_lyr: str,
     del_exist_vec: bool = False,
+    n_cores: int = -1,
+    preserve_topology: bool = False,
 ):
     """
     Create a simplified version of the input
@@ -1970,8 +1940,20 @@ def simplify_geometries(
     :param out_vec_file: output file path for the vector.
     :param out_vec_lyr: output vector layer name.
     :param del_exist_vec: remove output file if it exists.
+    :param n_cores: the number of threads used to simplify the geometries. If -1
+                    all available cores will be used. (Default: -1)
+    :param preserve_topology: If True then the topology preserving simplification
+                              is used, which avoids creating invalid geometries
+                              (e.g., self-intersecting polygons) but is slower.
+                              If False (Default) then the Douglas-Peucker
+                              algorithm is used.
     """
-    import tqdm
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy
+    import shapely
+
+    import rsgislib.tools.utils
 
     if os.path.exists(out_vec_file):
         if del_exist_vec:
@@ -1982,6 +1964,9 @@ def simplify_geometries(
                 "remove it and re-run.".format(out_vec_file)
             )
 
+    if n_cores <= 0:
+        n_cores = rsgislib.tools.utils.num_process_cores()
+
     vecDS = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
     if vecDS is None:
         raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_file))
@@ -1992,6 +1977,24 @@ def simplify_geometries(
     lyr_spat_ref = vec_lyr_obj.GetSpatialRef()
     geom_type = vec_lyr_obj.GetGeomType()
 
+    geoms = shapely.from_wkb(_get_lyr_geom_wkbs(vec_lyr_obj))
+    geoms = geoms[~shapely.is_missing(geoms)]
+
+    def _simplify_chunk(geoms_chunk):
+        return shapely.to_wkb(
+            shapely.simplify(
+                geoms_chunk, tolerance, preserve_topology=preserve_topology
+            )
+        )
+
+    # The geometries are independent so are simplified in chunks across
+    # threads, GEOS releases the GIL while simplifying.
+    with ThreadPoolExecutor(max_workers=n_cores) as executor:
+        simp_wkbs = list(
+            executor.map(_simplify_chunk, numpy.array_split(geoms, n_cores))
+        )
+    simp_wkbs = numpy.concatenate(simp_wkbs)
+
     out_driver = ogr.GetDriverByName(out_format)
     result_ds = out_driver.CreateDataSource(out_vec_file)
     if result_ds is None:
@@ -2002,35 +2005,37 @@ def simplify_geometries(
         raise rsgislib.RSGISPyException("Could not open layer '{}'".format(out_vec_lyr))
 
     featDefn = result_lyr.GetLayerDefn()
+    # A single output feature is reused for every geometry written and the
+    # methods called for each geometry are bound once before the loop.
+    outFeat = ogr.Feature(featDefn)
+    set_out_fid = outFeat.SetFID
+    set_out_geom = outFeat.SetGeometryDirectly
+    create_feature = result_lyr.CreateFeature
+    geom_from_wkb = ogr.CreateGeometryFromWkb
 
     openTransaction = False
-    vec_lyr_obj.ResetReading()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
     counter = 0
-    pbar = tqdm.tqdm(total=n_feats)
-    vec_lyr_obj.ResetReading()
-    feat = vec_lyr_obj.GetNextFeature()
-    while feat is not None:
+    pbar = tqdm.tqdm(total=simp_wkbs.shape[0])
+    for simp_wkb in simp_wkbs:
         if not openTransaction:
             result_lyr.StartTransaction()
             openTransaction = True
 
-        geom = feat.GetGeometryRef().Simplify(tolerance)
-        outFeat = ogr.Feature(featDefn)
-        outFeat.SetGeometry(geom)
-        result_lyr.CreateFeature(outFeat)
+        set_out_fid(-1)
+        set_out_geom(geom_from_wkb(simp_wkb))
+        create_feature(outFeat)
 
-        if ((counter % 20000) == 0) and openTransaction:
+        if ((counter % _TXN_SIZE) == 0) and openTransaction:
             result_lyr.CommitTransaction()
             openTransaction = False
 
-        feat = vec_lyr_obj.GetNextFeature()
         counter = counter + 1
         pbar.update(1)
 
     if openTransaction:
         result_lyr.CommitTransaction()
         openTransaction = False
+    outFeat = None
     result_lyr.SyncToDisk()
     pbar.close()
 
@@ -2060,7 +2065,6 @@ def delete_polygon_holes(
                        threshold is None then all holes are removed.
     :param del_exist_vec: remove output file if it exists.
     """
-    import tqdm
 
     if os.path.exists(out_vec_file):
         if del_exist_vec:
@@ -2072,30 +2076,24 @@ def delete_polygon_holes(
             )
 
     def _remove_holes_polygon(polygon, area_thres=None):
-        if polygon.GetGeometryName().lower() != "polygon":
+        if ogr.GT_Flatten(polygon.GetGeometryType()) != ogr.wkbPolygon:
             raise rsgislib.RSGISPyException(
                 "Can only remove holes from polygon geometry."
             )
-        if polygon.GetGeometryCount() == 1:
+        n_rings = polygon.GetGeometryCount()
+        if n_rings == 1:
             return polygon
 
-        if area_thres is None:
-            outer_ring = polygon.GetGeometryRef(0)
-            poly = ogr.Geometry(ogr.wkbPolygon)
-            poly.AddGeometry(outer_ring)
-            return poly
-        else:
-            outer_ring = polygon.GetGeometryRef(0)
-            poly = ogr.Geometry(ogr.wkbPolygon)
-            poly.AddGeometry(outer_ring)
-            for i in range(polygon.GetGeometryCount()):
-                if i > 0:
-                    c_ring = polygon.GetGeometryRef(i)
-                    tmp_poly = ogr.Geometry(ogr.wkbPolygon)
-                    tmp_poly.AddGeometry(c_ring)
-                    if tmp_poly.Area() > area_thres:
-                        poly.AddGeometry(c_ring)
-            return poly
+        poly = ogr.Geometry(ogr.wkbPolygon)
+        poly.AddGeometry(polygon.GetGeometryRef(0))
+        if area_thres is not None:
+            # The area of a closed ring is calculated directly, without
+            # wrapping the ring in a temporary polygon.
+            for i in range(1, n_rings):
+                c_ring = polygon.GetGeometryRef(i)
+                if c_ring.Area() > area_thres:
+                    poly.AddGeometry(c_ring)
+        return poly
 
     vecDS = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
     if vecDS is None:
@@ -2117,10 +2115,11 @@ def delete_polygon_holes(
         raise rsgislib.RSGISPyException("Could not open layer '{}'".format(out_vec_lyr))
 
     featDefn = result_lyr.GetLayerDefn()
+    outFeat = ogr.Feature(featDefn)
 
     openTransaction = False
     vec_lyr_obj.ResetReading()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
+    n_feats = _get_lyr_feat_count(vec_lyr_obj)
     counter = 0
     pbar = tqdm.tqdm(total=n_feats)
     vec_lyr_obj.ResetReading()
@@ -2131,20 +2130,23 @@ def delete_polygon_holes(
             openTransaction = True
 
         geom_ref = feat.GetGeometryRef()
-        if geom_ref.GetGeometryName().lower() == "multipolygon":
-            out_geom = ogr.Geometry(ogr.wkbMultiPolygon)
-            for i in range(0, geom_ref.GetGeometryCount()):
-                g = geom_ref.GetGeometryRef(i)
-                out_geom.AddGeometry(_remove_holes_polygon(g, area_thres))
-        elif geom_ref.GetGeometryName().lower() == "polygon":
-            out_geom = _remove_holes_polygon(geom_ref, area_thres)
+        out_geom = None
+        if geom_ref is not None:
+            geom_ref_type = ogr.GT_Flatten(geom_ref.GetGeometryType())
+            if geom_ref_type == ogr.wkbMultiPolygon:
+                out_geom = ogr.Geometry(ogr.wkbMultiPolygon)
+                for i in range(0, geom_ref.GetGeometryCount()):
+                    g = geom_ref.GetGeometryRef(i)
+                    out_geom.AddGeometry(_remove_holes_polygon(g, area_thres))
+            elif geom_ref_type == ogr.wkbPolygon:
+                out_geom = _remove_holes_polygon(geom_ref, area_thres)
 
         if out_geom is not None:
-            outFeat = ogr.Feature(featDefn)
+            outFeat.SetFID(-1)
             outFeat.SetGeometry(out_geom)
             result_lyr.CreateFeature(outFeat)
 
-        if ((counter % 20000) == 0) and openTransaction:
+        if ((counter % _TXN_SIZE) == 0) and openTransaction:
             result_lyr.CommitTransaction()
             openTransaction = False
 
@@ -2155,6 +2157,7 @@ def delete_polygon_holes(
     if openTransaction:
         result_lyr.CommitTransaction()
         openTransaction = False
+    outFeat = None
     result_lyr.SyncToDisk()
     pbar.close()
 
@@ -2171,24 +2174,28 @@ def get_poly_hole_area(vec_file: str, vec_lyr: str):
     :returns: A list of areas.
 
     """
-    import tqdm
+    import numpy
 
     def _calc_hole_area(polygon):
-        if polygon.GetGeometryName().lower() != "polygon":
+        if ogr.GT_Flatten(polygon.GetGeometryType()) != ogr.wkbPolygon:
             raise rsgislib.RSGISPyException(
                 "Can only remove holes from polygon geometry."
             )
-        if polygon.GetGeometryCount() == 1:
-            return []
-        else:
-            areas = []
-            for i in range(polygon.GetGeometryCount()):
-                if i > 0:
-                    c_ring = polygon.GetGeometryRef(i)
-                    tmp_poly = ogr.Geometry(ogr.wkbPolygon)
-                    tmp_poly.AddGeometry(c_ring)
-                    areas.append(tmp_poly.Area())
-            return areas
+        n_rings = polygon.GetGeometryCount()
+        areas = numpy.zeros(max(n_rings - 1, 0), dtype=numpy.float64)
+        for i in range(1, n_rings):
+            # Shoelace formula on the (closed) ring coordinates, which are
+            # offset to the first vertex to limit the floating point error.
+            ring_pts = polygon.GetGeometryRef(i).GetPoints(2)
+            if ring_pts is not None and len(ring_pts) > 3:
+                ring_pts = numpy.asarray(ring_pts, dtype=numpy.float64)
+                ring_pts -= ring_pts[0]
+                x = ring_pts[:, 0]
+                y = ring_pts[:, 1]
+                areas[i - 1] = 0.5 * abs(
+                    numpy.dot(x[:-1], y[1:]) - numpy.dot(x[1:], y[:-1])
+                )
+        return areas
 
     vecDS = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
     if vecDS is None:
@@ -2199,31 +2206,49 @@ def get_poly_hole_area(vec_file: str, vec_lyr: str):
         raise rsgislib.RSGISPyException("Could not open layer '{}'".format(vec_lyr))
 
     vec_lyr_obj.ResetReading()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
+    n_feats = _get_lyr_feat_count(vec_lyr_obj)
     pbar = tqdm.tqdm(total=n_feats)
     vec_lyr_obj.ResetReading()
     feat = vec_lyr_obj.GetNextFeature()
-    hole_areas = []
+    # The areas are accumulated as packed doubles rather than python floats.
+    hole_areas = array.array("d")
     while feat is not None:
         geom_ref = feat.GetGeometryRef()
-        if geom_ref.GetGeometryName().lower() == "multipolygon":
-            out_geom = ogr.Geometry(ogr.wkbMultiPolygon)
-            for i in range(0, geom_ref.GetGeometryCount()):
-                g = geom_ref.GetGeometryRef(i)
-                areas = _calc_hole_area(g)
-                if len(areas) > 0:
-                    hole_areas += areas
-        elif geom_ref.GetGeometryName().lower() == "polygon":
-            areas = _calc_hole_area(geom_ref)
-            if len(areas) > 0:
-                hole_areas += areas
+        if geom_ref is not None:
+            geom_ref_type = ogr.GT_Flatten(geom_ref.GetGeometryType())
+            if geom_ref_type == ogr.wkbMultiPolygon:
+                for i in range(0, geom_ref.GetGeometryCount()):
+                    g = geom_ref.GetGeometryRef(i)
+                    hole_areas.frombytes(_calc_hole_area(g).tobytes())
+            elif geom_ref_type == ogr.wkbPolygon:
+                hole_areas.frombytes(_calc_hole_area(geom_ref).tobytes())
 
         feat = vec_lyr_obj.GetNextFeature()
         pbar.update(1)
 
     pbar.close()
     vecDS = None
-    return hole_areas
+    return hole_areas.tolist()
+
+
+def _get_compat_geom_types(geom_type: int) -> set:
+    """
+    An internal function which gets the (flattened, i.e., 2D) geometry types
+    which can be written to a layer of the geometry type specified. For
+    example, polygons and multi-polygons can be written to a polygon layer.
+
+    :param geom_type: the ogr geometry type of the layer (e.g., ogr.wkbPolygon)
+    :return: set of ogr geometry types.
+
+    """
+    geom_type = ogr.GT_Flatten(geom_type)
+    if geom_type in (ogr.wkbPolygon, ogr.wkbMultiPolygon):
+        return {ogr.wkbPolygon, ogr.wkbMultiPolygon}
+    elif geom_type in (ogr.wkbLineString, ogr.wkbMultiLineString):
+        return {ogr.wkbLineString, ogr.wkbMultiLineString}
+    elif geom_type in (ogr.wkbPoint, ogr.wkbMultiPoint):
+        return {ogr.wkbPoint, ogr.wkbMultiPoint}
+    return set()
 
 
 def vec_lyr_intersection(
@@ -2250,7 +2275,7 @@ def vec_lyr_intersection(
     :param del_exist_vec: remove output file if it exists.
 
     """
-    import tqdm
+    import shapely
 
     if os.path.exists(out_vec_file):
         if del_exist_vec:
@@ -2288,21 +2313,19 @@ def vec_lyr_intersection(
     out_ds_obj = out_driver.CreateDataSource(out_vec_file)
     out_lyr_obj = out_ds_obj.CreateLayer(out_vec_lyr, spat_ref, geom_type=geom_type)
     feat_defn = out_lyr_obj.GetLayerDefn()
-
-    geom_collect = ogr.Geometry(ogr.wkbGeometryCollection)
-    n_obj_feats = lyr_over_vec.GetFeatureCount(True)
-    geom_pbar = tqdm.tqdm(total=n_obj_feats, leave=True)
-    lyr_over_vec.ResetReading()
-    in_obj_feat = lyr_over_vec.GetNextFeature()
-    while in_obj_feat:
-        geom = in_obj_feat.GetGeometryRef()
-        if geom is not None:
-            geom_collect.AddGeometry(geom)
-        in_obj_feat = lyr_over_vec.GetNextFeature()
-        geom_pbar.update(1)
-    geom_pbar.close()
-
-    n_feats = lyr_in_vec.GetFeatureCount(True)
+    out_feat = ogr.Feature(feat_defn)
+    out_geom_types = _get_compat_geom_types(geom_type)
+
+    # Index the overlain geometries so each feature is only intersected with
+    # the union of the overlain geometries which it intersects.
+    over_geoms = shapely.from_wkb(_get_lyr_geom_wkbs(lyr_over_vec))
+    over_geoms = over_geoms[~shapely.is_missing(over_geoms)]
+    over_tree = shapely.STRtree(over_geoms)
+    # The overlain geometries are tested against many features so are prepared
+    # once and the intersects predicate is evaluated with the prepared geometry.
+    shapely.prepare(over_geoms)
+
+    n_feats = _get_lyr_feat_count(lyr_in_vec)
     pbar = tqdm.tqdm(total=n_feats, leave=True)
     open_transaction = False
     counter = 0
@@ -2316,46 +2339,24 @@ def vec_lyr_intersection(
 
         in_geom = in_feature.GetGeometryRef()
         if in_geom is not None:
-            op_out_geom = geom_collect.Intersection(in_geom)
-
-            if (op_out_geom is not None) and (op_out_geom.GetGeometryCount() > 0):
-                for i in range(op_out_geom.GetGeometryCount()):
-                    c_geom = op_out_geom.GetGeometryRef(i)
-
-                    if (
-                        (c_geom.GetGeometryName().upper() == "POLYGON")
-                        or (c_geom.GetGeometryName().upper() == "MULTIPOLYGON")
-                    ) and (
-                        (geom_type == ogr.wkbMultiPolygon)
-                        or (geom_type == ogr.wkbPolygon)
-                    ):
-                        out_feat = ogr.Feature(feat_defn)
-                        out_feat.SetGeometry(c_geom)
-                        out_lyr_obj.CreateFeature(out_feat)
-                        out_feat = None
-                    elif (
-                        (c_geom.GetGeometryName().upper() == "LINESTRING")
-                        or (c_geom.GetGeometryName().upper() == "MULTILINESTRING")
-                    ) and (
-                        (geom_type == ogr.wkbMultiLineString)
-                        or (geom_type == ogr.wkbLineString)
-                    ):
-                        out_feat = ogr.Feature(feat_defn)
-                        out_feat.SetGeometry(c_geom)
-                        out_lyr_obj.CreateFeature(out_feat)
-                        out_feat = None
-                    elif (
-                        (c_geom.GetGeometryName().upper() == "POINT")
-                        or (c_geom.GetGeometryName().upper() == "MULTIPOINT")
-                    ) and (
-                        (geom_type == ogr.wkbMultiPoint) or (geom_type == ogr.wkbPoint)
-                    ):
-                        out_feat = ogr.Feature(feat_defn)
-                        out_feat.SetGeometry(c_geom)
+            in_shp_geom = shapely.from_wkb(bytes(in_geom.ExportToWkb()))
+            over_idxs = over_tree.query(in_shp_geom)
+            over_idxs = over_idxs[
+                shapely.intersects(over_geoms[over_idxs], in_shp_geom)
+            ]
+            if len(over_idxs) > 0:
+                op_out_geom = shapely.intersection(
+                    shapely.union_all(over_geoms[over_idxs]), in_shp_geom
+                )
+                # Multi-part geometries and collections are written as their parts.
+                for c_shp_geom in shapely.get_parts(op_out_geom):
+                    c_geom = ogr.CreateGeometryFromWkb(shapely.to_wkb(c_shp_geom))
+                    if ogr.GT_Flatten(c_geom.GetGeometryType()) in out_geom_types:
+                        out_feat.SetFID(-1)
+                        out_feat.SetGeometryDirectly(c_geom)
                         out_lyr_obj.CreateFeature(out_feat)
-                        out_feat = None
 
-        if ((counter % 20000) == 0) and open_transaction:
+        if ((counter % _TXN_SIZE) == 0) and open_transaction:
             out_lyr_obj.CommitTransaction()
             open_transaction = False
 
@@ -2366,6 +2367,7 @@ def vec_lyr_intersection(
         out_lyr_obj.CommitTransaction()
         open_transaction = False
     pbar.close()
+    out_feat = None
     out_lyr_obj.SyncToDisk()
     out_ds_obj = None
     ds_in_vec = None
@@ -2397,7 +2399,8 @@ def vec_lyr_difference(
     :param del_exist_vec: remove output file if it exists.
 
     """
-    import tqdm
+    import numpy
+    import shapely
 
     if os.path.exists(out_vec_file):
         if del_exist_vec:
@@ -2435,21 +2438,19 @@ def vec_lyr_difference(
     out_ds_obj = out_driver.CreateDataSource(out_vec_file)
     out_lyr_obj = out_ds_obj.CreateLayer(out_vec_lyr, spat_ref, geom_type=geom_type)
     feat_defn = out_lyr_obj.GetLayerDefn()
-
-    geoms_lst = list()
-    n_obj_feats = lyr_over_vec.GetFeatureCount(True)
-    geom_pbar = tqdm.tqdm(total=n_obj_feats, leave=True)
-    lyr_over_vec.ResetReading()
-    in_obj_feat = lyr_over_vec.GetNextFeature()
-    while in_obj_feat:
-        geom = in_obj_feat.GetGeometryRef()
-        if geom is not None:
-            geoms_lst.append(geom.Clone())
-        in_obj_feat = lyr_over_vec.GetNextFeature()
-        geom_pbar.update(1)
-    geom_pbar.close()
-
-    n_feats = lyr_in_vec.GetFeatureCount(True)
+    out_feat = ogr.Feature(feat_defn)
+    out_geom_types = _get_compat_geom_types(geom_type)
+
+    # Index the overlain geometries so each feature is only differenced with
+    # the overlain geometries which it intersects.
+    over_geoms = shapely.from_wkb(_get_lyr_geom_wkbs(lyr_over_vec))
+    over_geoms = over_geoms[~shapely.is_missing(over_geoms)]
+    over_tree = shapely.STRtree(over_geoms)
+    # The overlain geometries are tested against many features so are prepared
+    # once and the intersects predicate is evaluated with the prepared geometry.
+    shapely.prepare(over_geoms)
+
+    n_feats = _get_lyr_feat_count(lyr_in_vec)
     pbar = tqdm.tqdm(total=n_feats, leave=True)
     open_transaction = False
     counter = 0
@@ -2463,55 +2464,27 @@ def vec_lyr_difference(
 
         in_geom = in_feature.GetGeometryRef()
         if in_geom is not None:
-            for over_geom in geoms_lst:
-                if in_geom.Intersect(over_geom):
-                    if symmetric:
-                        op_out_geom = in_geom.SymmetricDifference(over_geom)
-                    else:
-                        op_out_geom = in_geom.Difference(over_geom)
-                    if (op_out_geom is not None) and (
-                        op_out_geom.GetGeometryCount() > 0
-                    ):
-                        for i in range(op_out_geom.GetGeometryCount()):
-                            c_geom = op_out_geom.GetGeometryRef(i)
-                            if (
-                                (c_geom.GetGeometryName().upper() == "POLYGON")
-                                or (c_geom.GetGeometryName().upper() == "MULTIPOLYGON")
-                            ) and (
-                                (geom_type == ogr.wkbMultiPolygon)
-                                or (geom_type == ogr.wkbPolygon)
-                            ):
-                                out_feat = ogr.Feature(feat_defn)
-                                out_feat.SetGeometry(c_geom)
-                                out_lyr_obj.CreateFeature(out_feat)
-                                out_feat = None
-                            elif (
-                                (c_geom.GetGeometryName().upper() == "LINESTRING")
-                                or (
-                                    c_geom.GetGeometryName().upper()
-                                    == "MULTILINESTRING"
-                                )
-                            ) and (
-                                (geom_type == ogr.wkbMultiLineString)
-                                or (geom_type == ogr.wkbLineString)
-                            ):
-                                out_feat = ogr.Feature(feat_defn)
-                                out_feat.SetGeometry(c_geom)
-                                out_lyr_obj.CreateFeature(out_feat)
-                                out_feat = None
-                            elif (
-                                (c_geom.GetGeometryName().upper() == "POINT")
-                                or (c_geom.GetGeometryName().upper() == "MULTIPOINT")
-                            ) and (
-                                (geom_type == ogr.wkbMultiPoint)
-                                or (geom_type == ogr.wkbPoint)
-                            ):
-                                out_feat = ogr.Feature(feat_defn)
-                                out_feat.SetGeometry(c_geom)
-                                out_lyr_obj.CreateFeature(out_feat)
-                                out_feat = None
-
-        if ((counter % 20000) == 0) and open_transaction:
+            in_shp_geom = shapely.from_wkb(bytes(in_geom.ExportToWkb()))
+            over_idxs = numpy.sort(over_tree.query(in_shp_geom))
+            over_idxs = over_idxs[
+                shapely.intersects(over_geoms[over_idxs], in_shp_geom)
+            ]
+            for over_idx in over_idxs:
+                if symmetric:
+                    op_out_geom = shapely.symmetric_difference(
+                        in_shp_geom, over_geoms[over_idx]
+                    )
+                else:
+                    op_out_geom = shapely.difference(in_shp_geom, over_geoms[over_idx])
+                # Multi-part geometries and collections are written as their parts.
+                for c_shp_geom in shapely.get_parts(op_out_geom):
+                    c_geom = ogr.CreateGeometryFromWkb(shapely.to_wkb(c_shp_geom))
+                    if ogr.GT_Flatten(c_geom.GetGeometryType()) in out_geom_types:
+                        out_feat.SetFID(-1)
+                        out_feat.SetGeometryDirectly(c_geom)
+                        out_lyr_obj.CreateFeature(out_feat)
+
+        if ((counter % _TXN_SIZE) == 0) and open_transaction:
             out_lyr_obj.CommitTransaction()
             open_transaction = False
 
@@ -2522,6 +2495,7 @@ def vec_lyr_difference(
         out_lyr_obj.CommitTransaction()
         open_transaction = False
     pbar.close()
+    out_feat = None
     out_lyr_obj.SyncToDisk()
     out_ds_obj = None
     ds_in_vec = None
@@ -2640,7 +2614,7 @@ def clip_and_merge_with_roi(
 
 def get_geom_pts(geom: ogr.Geometry, pts_lst: List = None) -> List:
     """
-    Recursive function which extracts all the points within the an OGR geometry.
+    Function which extracts all the points within the an OGR geometry.
 
     :param geom: The geometry from with the points are extracted.
     :param pts_lst: The list for the points, if None a list will be created.
@@ -2654,37 +2628,97 @@ def get_geom_pts(geom: ogr.Geometry, pts_lst: List = None) -> List:
         if geom.GetGeometryType() == ogr.wkbPoint:
             pts_lst.append(geom)
         else:
-            n_geoms = geom.GetGeometryCount()
-            for n in range(0, n_geoms):
-                c_geom = geom.GetGeometryRef(n)
-                n_pts = c_geom.GetPointCount()
-                if n_pts == 0:
-                    get_geom_pts(c_geom, pts_lst)
+            # Walk the sub-geometries with a stack rather than recursing, the
+            # children are pushed in reverse so they are visited in order.
+            geoms_stack = collections.deque(
+                geom.GetGeometryRef(n) for n in reversed(range(geom.GetGeometryCount()))
+            )
+            while geoms_stack:
+                c_geom = geoms_stack.pop()
+                if c_geom.GetPointCount() == 0:
+                    geoms_stack.extend(
+                        c_geom.GetGeometryRef(n)
+                        for n in reversed(range(c_geom.GetGeometryCount()))
+                    )
                 else:
-                    for i in range(0, n_pts):
-                        pt = c_geom.GetPoint(i)
-                        pts_lst.append(pt)
+                    # Get all the (x, y, z) points in one call rather than
+                    # calling GetPoint for each vertex.
+                    pts_lst.extend(c_geom.GetPoints(3))
     return pts_lst
 
 
-def vec_intersects_vec(
-    vec_base_file: str, vec_base_lyr: str, vec_comp_file: str, vec_comp_lyr: str
-) -> bool:
+def get_geom_pts_arr(geom: ogr.Geometry):
     """
-    Function to test whether the comparison vector layer intersects with the
-    base vector layer.
+    Function which extracts all the points within an OGR geometry as a
+    numpy array rather than a list of tuples.
+
+    :param geom: The geometry from with the points are extracted.
+    :return: a numpy float64 array with shape (n_pts, 3) with the x, y and z
+             coordinates of the points.
+
+    """
+    import numpy
 
-    Note. This function iterates through the geometries of both files performing
-    a comparison and therefore can be very slow to execute for large vector files.
+    pts_arrs = list()
+    if geom is not None:
+        geoms_stack = collections.deque([geom])
+        while geoms_stack:
+            c_geom = geoms_stack.pop()
+            if c_geom.GetPointCount() == 0:
+                geoms_stack.extend(
+                    c_geom.GetGeometryRef(n)
+                    for n in reversed(range(c_geom.GetGeometryCount()))
+                )
+            else:
+                pts_arrs.append(numpy.asarray(c_geom.GetPoints(3), dtype=numpy.float64))
+    if len(pts_arrs) == 0:
+        return numpy.empty((0, 3), dtype=numpy.float64)
+    return numpy.concatenate(pts_arrs, axis=0)
+
+
+def _vec_lyr_predicate(
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    predicate: str,
+    all_comp_geoms: bool = False,
+    n_cores: int = -1,
+) -> bool:
+    """
+    An internal function which tests a spatial predicate between the geometries
+    of a base vector layer and a comparison vector layer. The base geometries are
+    indexed (using an STRtree) so the predicate is only tested for the pairs of
+    geometries where the bounding boxes intersect. The predicate is evaluated
+    with shapely for blocks of candidate pairs at a time and the base geometries
+    are prepared as each is tested against many comparison geometries.
 
     :param vec_base_file: vector layer file used as the base layer
     :param vec_base_lyr: vector layer used as the base layer
     :param vec_comp_file: vector layer file used as the comparison layer
     :param vec_comp_lyr: vector layer used as the comparison layer
+    :param predicate: the name of the shapely predicate function which is called
+                      with the base geometry and the comparison geometry
+                      (e.g., intersects, contains).
+    :param all_comp_geoms: If False then True is returned if the predicate is
+                           True for any pair of geometries. If True then True is
+                           only returned if the predicate is True for every
+                           comparison geometry with at least one base geometry.
+    :param n_cores: the number of threads used to test the comparison geometries.
+                    If -1 all available cores will be used.
     :return: boolean
 
     """
-    import tqdm
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy
+    import shapely
+
+    import rsgislib.tools.utils
+
+    if n_cores <= 0:
+        n_cores = rsgislib.tools.utils.num_process_cores()
 
     dsVecBaseObj = gdal.OpenEx(vec_base_file, gdal.OF_READONLY)
     if dsVecBaseObj is None:
@@ -2706,377 +2740,268 @@ def vec_intersects_vec(
             "Could not find layer '{}'".format(vec_comp_lyr)
         )
 
-    n_feats = lyrVecBaseObj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    does_intersect = False
-    lyrVecBaseObj.ResetReading()
-    base_feat = lyrVecBaseObj.GetNextFeature()
-    while base_feat is not None:
-        base_geom = base_feat.GetGeometryRef()
-        if base_geom is not None:
-            lyrVecCompObj.ResetReading()
-            comp_feat = lyrVecCompObj.GetNextFeature()
-            while comp_feat is not None:
-                comp_geom = comp_feat.GetGeometryRef()
-                if comp_geom is not None:
-                    if base_geom.Intersects(comp_geom):
-                        does_intersect = True
-                        break
-                comp_feat = lyrVecCompObj.GetNextFeature()
-        if does_intersect:
-            break
-        pbar.update(1)
-        base_feat = lyrVecBaseObj.GetNextFeature()
+    base_geoms = shapely.from_wkb(_get_lyr_geom_wkbs(lyrVecBaseObj))
+    base_geoms = base_geoms[~shapely.is_missing(base_geoms)]
+    base_tree = shapely.STRtree(base_geoms)
+    shapely.prepare(base_geoms)
+
+    comp_geoms = shapely.from_wkb(_get_lyr_geom_wkbs(lyrVecCompObj))
 
     dsVecBaseObj = None
     dsVecCompObj = None
 
-    return does_intersect
+    pred_func = getattr(shapely, predicate)
+    blk_size = 1024
+
+    # A base geometry can only contain a comparison geometry where the bbox
+    # of the base geometry contains the bbox of the comparison geometry so
+    # the other candidate pairs are dropped before calling the predicate.
+    env_contains = predicate == "contains"
+    if env_contains:
+        base_bounds = shapely.bounds(base_geoms)
+
+    def _test_comp_chunk(comp_geoms_chunk):
+        # Returns the result if it has been decided by this chunk, otherwise
+        # None. The other threads are stopped once a result has been decided.
+        for blk_start in range(0, comp_geoms_chunk.shape[0], blk_size):
+            if pred_decided.is_set():
+                return None
+            blk_geoms = comp_geoms_chunk[blk_start : blk_start + blk_size]
+            if all_comp_geoms and numpy.any(shapely.is_missing(blk_geoms)):
+                pred_decided.set()
+                return False
+            comp_idxs, base_idxs = base_tree.query(blk_geoms)
+            if env_contains:
+                blk_bounds = shapely.bounds(blk_geoms)[comp_idxs]
+                cand_bounds = base_bounds[base_idxs]
+                env_msk = numpy.all(cand_bounds[:, :2] <= blk_bounds[:, :2], axis=1)
+                env_msk &= numpy.all(cand_bounds[:, 2:] >= blk_bounds[:, 2:], axis=1)
+                comp_idxs = comp_idxs[env_msk]
+                base_idxs = base_idxs[env_msk]
+            pred_hits = pred_func(base_geoms[base_idxs], blk_geoms[comp_idxs])
+            if all_comp_geoms:
+                if numpy.unique(comp_idxs[pred_hits]).shape[0] < blk_geoms.shape[0]:
+                    pred_decided.set()
+                    return False
+            elif numpy.any(pred_hits):
+                pred_decided.set()
+                return True
+        return None
+
+    # The comparison geometries are tested in chunks across threads, shapely
+    # releases the GIL while the predicates are evaluated by GEOS.
+    pred_decided = threading.Event()
+    with ThreadPoolExecutor(max_workers=n_cores) as executor:
+        chunk_results = list(
+            executor.map(_test_comp_chunk, numpy.array_split(comp_geoms, n_cores))
+        )
 
+    pred_result = all_comp_geoms
+    if (not all_comp_geoms) in chunk_results:
+        pred_result = not all_comp_geoms
+    return pred_result
 
-def vec_overlaps_vec(
-    vec_base_file: str, vec_base_lyr: str, vec_comp_file: str, vec_comp_lyr: str
+
+def vec_intersects_vec(
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    n_cores: int = -1,
 ) -> bool:
     """
-    Function to test whether the comparison vector layer overlaps with the
+    Function to test whether the comparison vector layer intersects with the
     base vector layer.
 
-    Note. This function iterates through the geometries of both files performing
-    a comparison and therefore can be very slow to execute for large vector files.
+    Note. The geometries of the base layer are indexed by their bounding boxes
+    so the geometries are only compared where their bounding boxes intersect.
 
     :param vec_base_file: vector layer file used as the base layer
     :param vec_base_lyr: vector layer used as the base layer
     :param vec_comp_file: vector layer file used as the comparison layer
     :param vec_comp_lyr: vector layer used as the comparison layer
+    :param n_cores: the number of threads used to compare the geometries. If -1
+                    all available cores will be used. (Default: -1)
     :return: boolean
 
     """
-    import tqdm
-
-    dsVecBaseObj = gdal.OpenEx(vec_base_file, gdal.OF_READONLY)
-    if dsVecBaseObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_base_file))
-
-    lyrVecBaseObj = dsVecBaseObj.GetLayerByName(vec_base_lyr)
-    if lyrVecBaseObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_base_lyr)
-        )
+    return _vec_lyr_predicate(
+        vec_base_file,
+        vec_base_lyr,
+        vec_comp_file,
+        vec_comp_lyr,
+        "intersects",
+        n_cores=n_cores,
+    )
 
-    dsVecCompObj = gdal.OpenEx(vec_comp_file, gdal.OF_READONLY)
-    if dsVecCompObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_comp_file))
 
-    lyrVecCompObj = dsVecCompObj.GetLayerByName(vec_comp_lyr)
-    if lyrVecCompObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_comp_lyr)
-        )
+def vec_overlaps_vec(
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    n_cores: int = -1,
+) -> bool:
+    """
+    Function to test whether the comparison vector layer overlaps with the
+    base vector layer.
 
-    n_feats = lyrVecBaseObj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    does_overlap = False
-    lyrVecBaseObj.ResetReading()
-    base_feat = lyrVecBaseObj.GetNextFeature()
-    while base_feat is not None:
-        base_geom = base_feat.GetGeometryRef()
-        if base_geom is not None:
-            lyrVecCompObj.ResetReading()
-            comp_feat = lyrVecCompObj.GetNextFeature()
-            while comp_feat is not None:
-                comp_geom = comp_feat.GetGeometryRef()
-                if comp_geom is not None:
-                    if comp_geom.Overlaps(base_geom):
-                        does_overlap = True
-                        break
-                comp_feat = lyrVecCompObj.GetNextFeature()
-        if does_overlap:
-            break
-        pbar.update(1)
-        base_feat = lyrVecBaseObj.GetNextFeature()
+    Note. The geometries of the base layer are indexed by their bounding boxes
+    so the geometries are only compared where their bounding boxes intersect.
 
-    dsVecBaseObj = None
-    dsVecCompObj = None
+    :param vec_base_file: vector layer file used as the base layer
+    :param vec_base_lyr: vector layer used as the base layer
+    :param vec_comp_file: vector layer file used as the comparison layer
+    :param vec_comp_lyr: vector layer used as the comparison layer
+    :param n_cores: the number of threads used to compare the geometries. If -1
+                    all available cores will be used. (Default: -1)
+    :return: boolean
 
-    return does_overlap
+    """
+    return _vec_lyr_predicate(
+        vec_base_file,
+        vec_base_lyr,
+        vec_comp_file,
+        vec_comp_lyr,
+        "overlaps",
+        n_cores=n_cores,
+    )
 
 
 def vec_within_vec(
-    vec_base_file: str, vec_base_lyr: str, vec_comp_file: str, vec_comp_lyr: str
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    n_cores: int = -1,
 ) -> bool:
     """
     Function to test whether the comparison vector layer within with the
     base vector layer.
 
-    Note. This function iterates through the geometries of both files performing
-    a comparison and therefore can be very slow to execute for large vector files.
+    Note. The geometries of the base layer are indexed by their bounding boxes
+    so the geometries are only compared where their bounding boxes intersect.
 
     :param vec_base_file: vector layer file used as the base layer
     :param vec_base_lyr: vector layer used as the base layer
     :param vec_comp_file: vector layer file used as the comparison layer
     :param vec_comp_lyr: vector layer used as the comparison layer
+    :param n_cores: the number of threads used to compare the geometries. If -1
+                    all available cores will be used. (Default: -1)
     :return: boolean
 
     """
-    import tqdm
-
-    dsVecBaseObj = gdal.OpenEx(vec_base_file, gdal.OF_READONLY)
-    if dsVecBaseObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_base_file))
-
-    lyrVecBaseObj = dsVecBaseObj.GetLayerByName(vec_base_lyr)
-    if lyrVecBaseObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_base_lyr)
-        )
-
-    dsVecCompObj = gdal.OpenEx(vec_comp_file, gdal.OF_READONLY)
-    if dsVecCompObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_comp_file))
-
-    lyrVecCompObj = dsVecCompObj.GetLayerByName(vec_comp_lyr)
-    if lyrVecCompObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_comp_lyr)
-        )
-
-    n_feats = lyrVecCompObj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    is_within = True
-
-    lyrVecCompObj.ResetReading()
-    comp_feat = lyrVecCompObj.GetNextFeature()
-    while comp_feat is not None:
-        comp_geom = comp_feat.GetGeometryRef()
-        comp_feat_within = False
-        if comp_geom is not None:
-            lyrVecBaseObj.ResetReading()
-            base_feat = lyrVecBaseObj.GetNextFeature()
-            while base_feat is not None:
-                base_geom = base_feat.GetGeometryRef()
-                if base_geom is not None:
-                    if comp_geom.Within(base_geom):
-                        comp_feat_within = True
-                        break
-                base_feat = lyrVecBaseObj.GetNextFeature()
-
-        if not comp_feat_within:
-            is_within = False
-            break
-        pbar.update(1)
-        comp_feat = lyrVecCompObj.GetNextFeature()
-
-    dsVecBaseObj = None
-    dsVecCompObj = None
-
-    return is_within
+    # The comparison geometry is within the base geometry where the base
+    # geometry contains it.
+    return _vec_lyr_predicate(
+        vec_base_file,
+        vec_base_lyr,
+        vec_comp_file,
+        vec_comp_lyr,
+        "contains",
+        all_comp_geoms=True,
+        n_cores=n_cores,
+    )
 
 
 def vec_contains_vec(
-    vec_base_file: str, vec_base_lyr: str, vec_comp_file: str, vec_comp_lyr: str
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    n_cores: int = -1,
 ) -> bool:
     """
     Function to test whether the base vector layer contains with the
     comparison vector layer.
 
-    Note. This function iterates through the geometries of both files performing
-    a comparison and therefore can be very slow to execute for large vector files.
+    Note. The geometries of the base layer are indexed by their bounding boxes
+    so the geometries are only compared where their bounding boxes intersect.
 
     :param vec_base_file: vector layer file used as the base layer
     :param vec_base_lyr: vector layer used as the base layer
     :param vec_comp_file: vector layer file used as the comparison layer
     :param vec_comp_lyr: vector layer used as the comparison layer
+    :param n_cores: the number of threads used to compare the geometries. If -1
+                    all available cores will be used. (Default: -1)
     :return: boolean
 
     """
-    import tqdm
-
-    dsVecBaseObj = gdal.OpenEx(vec_base_file, gdal.OF_READONLY)
-    if dsVecBaseObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_base_file))
-
-    lyrVecBaseObj = dsVecBaseObj.GetLayerByName(vec_base_lyr)
-    if lyrVecBaseObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_base_lyr)
-        )
-
-    dsVecCompObj = gdal.OpenEx(vec_comp_file, gdal.OF_READONLY)
-    if dsVecCompObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_comp_file))
-
-    lyrVecCompObj = dsVecCompObj.GetLayerByName(vec_comp_lyr)
-    if lyrVecCompObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_comp_lyr)
-        )
-
-    n_feats = lyrVecCompObj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    does_contain = True
-
-    lyrVecCompObj.ResetReading()
-    comp_feat = lyrVecCompObj.GetNextFeature()
-    while comp_feat is not None:
-        comp_geom = comp_feat.GetGeometryRef()
-        comp_feat_contained = False
-        if comp_geom is not None:
-            lyrVecBaseObj.ResetReading()
-            base_feat = lyrVecBaseObj.GetNextFeature()
-            while base_feat is not None:
-                base_geom = base_feat.GetGeometryRef()
-                if base_geom is not None:
-                    if base_geom.Contains(comp_geom):
-                        comp_feat_contained = True
-                        break
-                base_feat = lyrVecBaseObj.GetNextFeature()
-
-        if not comp_feat_contained:
-            does_contain = False
-            break
-        pbar.update(1)
-        comp_feat = lyrVecCompObj.GetNextFeature()
-
-    dsVecBaseObj = None
-    dsVecCompObj = None
-
-    return does_contain
+    return _vec_lyr_predicate(
+        vec_base_file,
+        vec_base_lyr,
+        vec_comp_file,
+        vec_comp_lyr,
+        "contains",
+        all_comp_geoms=True,
+        n_cores=n_cores,
+    )
 
 
 def vec_touches_vec(
-    vec_base_file: str, vec_base_lyr: str, vec_comp_file: str, vec_comp_lyr: str
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    n_cores: int = -1,
 ) -> bool:
     """
     Function to test whether the comparison vector layer touches the
     base vector layer.
 
-    Note. This function iterates through the geometries of both files performing
-    a comparison and therefore can be very slow to execute for large vector files.
+    Note. The geometries of the base layer are indexed by their bounding boxes
+    so the geometries are only compared where their bounding boxes intersect.
 
     :param vec_base_file: vector layer file used as the base layer
     :param vec_base_lyr: vector layer used as the base layer
     :param vec_comp_file: vector layer file used as the comparison layer
     :param vec_comp_lyr: vector layer used as the comparison layer
+    :param n_cores: the number of threads used to compare the geometries. If -1
+                    all available cores will be used. (Default: -1)
     :return: boolean
 
     """
-    import tqdm
-
-    dsVecBaseObj = gdal.OpenEx(vec_base_file, gdal.OF_READONLY)
-    if dsVecBaseObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_base_file))
-
-    lyrVecBaseObj = dsVecBaseObj.GetLayerByName(vec_base_lyr)
-    if lyrVecBaseObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_base_lyr)
-        )
-
-    dsVecCompObj = gdal.OpenEx(vec_comp_file, gdal.OF_READONLY)
-    if dsVecCompObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_comp_file))
-
-    lyrVecCompObj = dsVecCompObj.GetLayerByName(vec_comp_lyr)
-    if lyrVecCompObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_comp_lyr)
-        )
-
-    n_feats = lyrVecBaseObj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    does_touch = False
-
-    lyrVecBaseObj.ResetReading()
-    base_feat = lyrVecBaseObj.GetNextFeature()
-    while base_feat is not None:
-        base_geom = base_feat.GetGeometryRef()
-        if base_geom is not None:
-            lyrVecCompObj.ResetReading()
-            comp_feat = lyrVecCompObj.GetNextFeature()
-            while comp_feat is not None:
-                comp_geom = comp_feat.GetGeometryRef()
-                if comp_geom is not None:
-                    if comp_geom.Touches(base_geom):
-                        does_touch = True
-                        break
-                comp_feat = lyrVecCompObj.GetNextFeature()
-        if does_touch:
-            break
-        pbar.update(1)
-        base_feat = lyrVecBaseObj.GetNextFeature()
-
-    dsVecBaseObj = None
-    dsVecCompObj = None
-
-    return does_touch
+    return _vec_lyr_predicate(
+        vec_base_file,
+        vec_base_lyr,
+        vec_comp_file,
+        vec_comp_lyr,
+        "touches",
+        n_cores=n_cores,
+    )
 
 
 def vec_crosses_vec(
-    vec_base_file: str, vec_base_lyr: str, vec_comp_file: str, vec_comp_lyr: str
+    vec_base_file: str,
+    vec_base_lyr: str,
+    vec_comp_file: str,
+    vec_comp_lyr: str,
+    n_cores: int = -1,
 ) -> bool:
     """
     Function to test whether the comparison vector layer touches the
     base vector layer.
 
-    Note. This function iterates through the geometries of both files performing
-    a comparison and therefore can be very slow to execute for large vector files.
+    Note. The geometries of the base layer are indexed by their bounding boxes
+    so the geometries are only compared where their bounding boxes intersect.
 
     :param vec_base_file: vector layer file used as the base layer
     :param vec_base_lyr: vector layer used as the base layer
     :param vec_comp_file: vector layer file used as the comparison layer
     :param vec_comp_lyr: vector layer used as the comparison layer
+    :param n_cores: the number of threads used to compare the geometries. If -1
+                    all available cores will be used. (Default: -1)
     :return: boolean
 
     """
-    import tqdm
-
-    dsVecBaseObj = gdal.OpenEx(vec_base_file, gdal.OF_READONLY)
-    if dsVecBaseObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_base_file))
-
-    lyrVecBaseObj = dsVecBaseObj.GetLayerByName(vec_base_lyr)
-    if lyrVecBaseObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_base_lyr)
-        )
-
-    dsVecCompObj = gdal.OpenEx(vec_comp_file, gdal.OF_READONLY)
-    if dsVecCompObj is None:
-        raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_comp_file))
-
-    lyrVecCompObj = dsVecCompObj.GetLayerByName(vec_comp_lyr)
-    if lyrVecCompObj is None:
-        raise rsgislib.RSGISPyException(
-            "Could not find layer '{}'".format(vec_comp_lyr)
-        )
-
-    n_feats = lyrVecBaseObj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    does_cross = False
-
-    lyrVecBaseObj.ResetReading()
-    base_feat = lyrVecBaseObj.GetNextFeature()
-    while base_feat is not None:
-        base_geom = base_feat.GetGeometryRef()
-        if base_geom is not None:
-            lyrVecCompObj.ResetReading()
-            comp_feat = lyrVecCompObj.GetNextFeature()
-            while comp_feat is not None:
-                comp_geom = comp_feat.GetGeometryRef()
-                if comp_geom is not None:
-                    if comp_geom.Crosses(base_geom):
-                        does_cross = True
-                        break
-                comp_feat = lyrVecCompObj.GetNextFeature()
-        if does_cross:
-            break
-        pbar.update(1)
-        base_feat = lyrVecBaseObj.GetNextFeature()
-
-    dsVecBaseObj = None
-    dsVecCompObj = None
-
-    return does_cross
+    return _vec_lyr_predicate(
+        vec_base_file,
+        vec_base_lyr,
+        vec_comp_file,
+        vec_comp_lyr,
+        "crosses",
+        n_cores=n_cores,
+    )
 
 
 def get_geoms_as_bboxs(
@@ -3200,12 +3125,20 @@ def create_rtree_index(vec_file: str, vec_lyr: str):
     A function which creates a spatial index using the rtree package for the
     inputted vector file/layer.
 
+    The geometries are returned as a list of WKB (bytes) rather than OGR
+    geometry objects, which uses much less memory for large layers. The
+    geometries are recreated (ogr.CreateGeometryFromWkb) by bbox_intersects_index
+    only when they are needed.
+
     :param vec_file: Input vector file to be processed.
     :param vec_lyr: The layer within the vector file for which the index is to be built.
+    :return: (idx_obj, geom_lst) - the rtree index and the list of WKB geometries
+             where the index id is the position in the list.
 
     """
+    import numpy
     import rtree
-    import tqdm
+    import shapely
 
     vec_file_obj = gdal.OpenEx(vec_file, gdal.OF_READONLY)
     if vec_file_obj is None:
@@ -3215,24 +3148,34 @@ def create_rtree_index(vec_file: str, vec_lyr: str):
     if vec_lyr_obj is None:
         raise rsgislib.RSGISPyException("Could not find layer '{}'".format(vec_lyr))
 
-    idx_obj = rtree.index.Index(interleaved=False)
-    geom_lst = list()
-
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
-    n_geom = 0
-    pbar = tqdm.tqdm(total=n_feats)
-    vec_lyr_obj.ResetReading()
-    feat = vec_lyr_obj.GetNextFeature()
-    while feat is not None:
-        geom_obj = feat.GetGeometryRef()
-        if geom_obj is not None:
-            xmin, xmax, ymin, ymax = geom_obj.GetEnvelope()
-            geom_lst.append(geom_obj.Clone())
-            idx_obj.insert(n_geom, (xmin, xmax, ymin, ymax))
-            n_geom = n_geom + 1
-        pbar.update(1)
-        feat = vec_lyr_obj.GetNextFeature()
+    # Read the geometries in batches and get all the envelopes as a single
+    # (n_geoms, 4) array rather than a tuple per feature.
+    geom_wkbs = numpy.asarray(_get_lyr_geom_wkbs(vec_lyr_obj), dtype=object)
     vec_file_obj = None
+    geoms = shapely.from_wkb(geom_wkbs)
+    has_geom = ~shapely.is_missing(geoms)
+    geom_lst = geom_wkbs[has_geom].tolist()
+    # Reorder to (xmin, xmax, ymin, ymax) for the index, empty geometries have
+    # NaN bounds so are given a zero envelope as by ogr.
+    geom_envs = numpy.nan_to_num(shapely.bounds(geoms[has_geom])[:, [0, 2, 1, 3]])
+
+    if len(geom_lst) > 0:
+        # Bulk load the index from a stream of the envelopes rather than
+        # inserting them one at a time, which also gives a better packed tree.
+        # The index is not updated after it is built so the nodes are filled
+        # further than the default, giving fewer nodes to visit per query.
+        idx_props = rtree.index.Property()
+        idx_props.fill_factor = 0.9
+        idx_obj = rtree.index.Index(
+            (
+                (n_geom, tuple(geom_env), None)
+                for n_geom, geom_env in enumerate(geom_envs.tolist())
+            ),
+            interleaved=False,
+            properties=idx_props,
+        )
+    else:
+        idx_obj = rtree.index.Index(interleaved=False)
     return idx_obj, geom_lst
 
 
@@ -3246,7 +3189,8 @@ def bbox_intersects_index(
     :param rt_idx: the rtree spatial index object (created using the
                    create_rtree_index function)
     :param geom_lst: the list of geometries as referenced in the index (created
-                     using the create_rtree_index function)
+                     using the create_rtree_index function). The geometries can
+                     be WKB (bytes) or OGR geometry objects.
     :param bbox: the bounding box (xMin, xMax, yMin, yMax). Same projection as
                   geometries in the index.
     :return: True there is an intersection. False there is not an intersection.
@@ -3264,10 +3208,20 @@ def bbox_intersects_index(
 
     bbox_intersects = False
 
-    for geom_idx in list(rt_idx.intersection(bbox)):
-        print(geom_idx)
+    for geom_idx in rt_idx.intersection(bbox):
         geom_obj = geom_lst[geom_idx]
-        if poly_bbox.Intersects(geom_obj):
+        if isinstance(geom_obj, (bytes, bytearray)):
+            geom_obj = ogr.CreateGeometryFromWkb(geom_obj)
+        # If the envelope of the geometry is within the bbox then the geometry
+        # must intersect so the full intersection test is not needed.
+        geom_env = geom_obj.GetEnvelope()
+        if (
+            (not geom_obj.IsEmpty())
+            and (geom_env[0] >= bbox[0])
+            and (geom_env[1] <= bbox[1])
+            and (geom_env[2] >= bbox[2])
+            and (geom_env[3] <= bbox[3])
+        ) or poly_bbox.Intersects(geom_obj):
             bbox_intersects = True
             break
     return bbox_intersects
@@ -3496,9 +3450,9 @@ def create_angle_lines_from_points(
         pt = row["geometry"]
 
         for line_angle in line_angles:
-            line_angle_rad = math.radians(line_angle)
-            end_x = pt.x + (line_len * math.cos(line_angle_rad))
-            end_y = pt.y + (line_len * math.sin(line_angle_rad))
+            line_angle_rad = radians(line_angle)
+            end_x = pt.x + (line_len * cos(line_angle_rad))
+            end_y = pt.y + (line_len * sin(line_angle_rad))
             shp_line = shapely.geometry.LineString(
                 [pt, shapely.geometry.Point(end_x, end_y)]
             )
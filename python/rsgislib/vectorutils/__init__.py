@@ -2460,9 +2460,6 @@ def reproj_wgs84_vec_to_utm(
     """
     import os
 
-    import tqdm
-    from osgeo import gdal
-
     import rsgislib.tools.projection
     import rsgislib.tools.utm
     import rsgislib.vectorgeoms
@@ -2479,32 +2476,10 @@ def reproj_wgs84_vec_to_utm(
     if out_vec_lyr is None:
         out_vec_lyr = os.path.splitext(os.path.basename(out_vec_file))[0]
 
-    vec_ds_obj = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
-    vec_lyr_obj = vec_ds_obj.GetLayer(vec_lyr)
-
-    pts_lst = list()
-    n_feats = vec_lyr_obj.GetFeatureCount(True)
-    pbar = tqdm.tqdm(total=n_feats)
-    counter = 0
-    in_feature = vec_lyr_obj.GetNextFeature()
-    while in_feature:
-        geom = in_feature.GetGeometryRef()
-        if geom is not None:
-            rsgislib.vectorgeoms.get_geom_pts(geom, pts_lst)
-        in_feature = vec_lyr_obj.GetNextFeature()
-        counter = counter + 1
-        pbar.update(1)
-    pbar.close()
-    vec_ds_obj = None
-    lon = 0.0
-    lat = 0.0
-    for pt in pts_lst:
-        lon += pt[0]
-        lat += pt[1]
-    n_pts = len(pts_lst)
-
-    lon = lon / n_pts
-    lat = lat / n_pts
+    pts = rsgislib.vectorgeoms.get_vec_lyr_as_pts(vec_file, vec_lyr)
+    if pts.shape[0] == 0:
+        raise rsgislib.RSGISPyException("The input vector layer has no points.")
+    lon, lat = pts.mean(axis=0)
 
     print("{}, {}".format(lat, lon))
 
@@ -23,6 +23,7 @@ def rasterise_vec_lyr(
     use_vec_extent: bool = False,
     thematic: bool = True,
     no_data_val: float = 0,
+    calc_stats: bool = True,
 ):
     """
     A utility to rasterise a vector layer to an image covering the same region and at
@@ -50,6 +51,10 @@ def rasterise_vec_lyr(
                      an thematic dataset so a colour table will be populated.
     :param no_data_val: is a float specifying the no data value associated with a
                         continuous output image.
+    :param calc_stats: is a boolean specifying whether image stats and pyramids
+                       should be calculated (Default True). Set to False where the
+                       output is an intermediate image only read for its pixel
+                       values.
 
     .. code:: python
 
@@ -70,6 +75,14 @@ def rasterise_vec_lyr(
     import rsgislib.imageutils
 
     try:
+        vec_ds = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
+        if vec_ds is None:
+            raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_file))
+
+        vec_lyr_obj = vec_ds.GetLayerByName(vec_lyr)
+        if vec_lyr_obj is None:
+            raise rsgislib.RSGISPyException("Could not find layer '{}'".format(vec_lyr))
+
         if use_vec_extent:
             xRes, yRes = rsgislib.imageutils.get_img_res(input_img)
             if yRes < -1:
@@ -85,23 +98,35 @@ def rasterise_vec_lyr(
             print("Assuming output image is already created so just using.")
         else:
             print("Creating output image using input image")
-            rsgislib.imageutils.create_copy_img(
-                input_img, output_img, 1, 0, gdalformat, datatype
+            # Only the header of the input image is needed and the new band is
+            # zero on creation so there is no need to read the input or write
+            # out a full raster of zeros which RasterizeLayer then overwrites.
+            in_img_ds = gdal.Open(input_img, gdal.GA_ReadOnly)
+            if in_img_ds is None:
+                raise rsgislib.RSGISPyException(f"Could not open '{input_img}'")
+            gdal_driver = gdal.GetDriverByName(gdalformat)
+            out_img_ds = gdal_driver.Create(
+                output_img,
+                in_img_ds.RasterXSize,
+                in_img_ds.RasterYSize,
+                1,
+                rsgislib.get_gdal_datatype(datatype),
+                options=rsgislib.imageutils.get_rios_img_creation_opts(gdalformat),
             )
-
+            if out_img_ds is None:
+                raise rsgislib.RSGISPyException(f"Could not create '{output_img}'")
+            out_img_ds.SetGeoTransform(in_img_ds.GetGeoTransform())
+            out_img_ds.SetProjection(in_img_ds.GetProjection())
+            out_img_ds = None
+            in_img_ds = None
+
+        # RasterizeLayer reprojects the features on the fly where the layer
+        # and image projections differ.
         print("Running Rasterise now...")
         out_img_ds = gdal.Open(output_img, gdal.GA_Update)
         if out_img_ds is None:
             raise rsgislib.RSGISPyException(f"Could not open '{output_img}'")
 
-        vec_ds = gdal.OpenEx(vec_file, gdal.OF_VECTOR)
-        if vec_ds is None:
-            raise rsgislib.RSGISPyException("Could not open '{}'".format(vec_file))
-
-        vec_lyr_obj = vec_ds.GetLayerByName(vec_lyr)
-        if vec_lyr_obj is None:
-            raise rsgislib.RSGISPyException("Could not find layer '{}'".format(vec_lyr))
-
         # Run the algorithm.
         err = 0
         if att_column is None:
@@ -118,17 +143,18 @@ def rasterise_vec_lyr(
         out_img_ds = None
         vec_ds = None
 
-        if thematic and (gdalformat == "KEA"):
-            import rsgislib.rastergis
+        if calc_stats:
+            if thematic and (gdalformat == "KEA"):
+                import rsgislib.rastergis
 
-            rsgislib.rastergis.pop_rat_img_stats(
-                clumps_img=output_img,
-                add_clr_tab=True,
-                calc_pyramids=True,
-                ignore_zero=True,
-            )
-        else:
-            rsgislib.imageutils.pop_img_stats(output_img, True, no_data_val, True)
+                rsgislib.rastergis.pop_rat_img_stats(
+                    clumps_img=output_img,
+                    add_clr_tab=True,
+                    calc_pyramids=True,
+                    ignore_zero=True,
+                )
+            else:
+                rsgislib.imageutils.pop_img_stats(output_img, True, no_data_val, True)
     except Exception as e:
         raise e
 
@@ -434,6 +460,7 @@ def create_dist_zones_to_vec_layer(
         gdalformat,
         burn_val=1,
         datatype=rsgislib.TYPE_8UINT,
+        calc_stats=False,
     )
 
     rsgislib.imagecalc.calc_dist_to_img_vals(
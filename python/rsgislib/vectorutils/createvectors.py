@@ -857,26 +857,30 @@ def write_pts_to_vec(
 
         # Get the output Layer's Feature Definition
         featureDefn = outLayer.GetLayerDefn()
+        if addAtts:
+            att_idxs = [
+                featureDefn.GetFieldIndex(att_name) for att_name in att_types["names"]
+            ]
+
+        # A single point and feature are reused for all the points, the
+        # feature is given a copy of the point each time it is written.
+        pt = ogr.Geometry(ogr.wkbPoint)
+        pt.AddPoint(0.0, 0.0)
+        outFeature = ogr.Feature(featureDefn)
 
         openTransaction = False
         for n in range(nPts):
             if not openTransaction:
                 outLayer.StartTransaction()
                 openTransaction = True
-            # Create Point
-            pt = ogr.Geometry(ogr.wkbPoint)
-            pt.AddPoint(float(pts_x[n]), float(pts_y[n]))
-            # Add to output shapefile.
-            outFeature = ogr.Feature(featureDefn)
+            pt.SetPoint(0, float(pts_x[n]), float(pts_y[n]))
+            outFeature.SetFID(-1)
             outFeature.SetGeometry(pt)
             if addAtts:
                 # Add Attributes
                 for i in range(nAtts):
-                    outFeature.SetField(
-                        att_types["names"][i], atts[att_types["names"][i]][n]
-                    )
+                    outFeature.SetField(att_idxs[i], atts[att_types["names"][i]][n])
             outLayer.CreateFeature(outFeature)
-            outFeature = None
             if ((n % 20000) == 0) and openTransaction:
                 outLayer.CommitTransaction()
                 openTransaction = False
@@ -884,6 +888,7 @@ def write_pts_to_vec(
         if openTransaction:
             outLayer.CommitTransaction()
             openTransaction = False
+        outFeature = None
         vecDS = None
     except Exception as e:
         raise e
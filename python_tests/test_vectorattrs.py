@@ -2,6 +2,8 @@ import os
 import pytest
 from shutil import copy2
 
+from osgeo import ogr
+
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 VECTORATTRS_DATA_DIR = os.path.join(DATA_DIR, "vectorattrs")
 VECTORUTILS_DATA_DIR = os.path.join(DATA_DIR, "vectorutils")
@@ -39,12 +41,7 @@ def test_read_vec_column_IntCol():
     vec_lyr = "sen2_20210527_aber_att_vals"
     vals = rsgislib.vectorattrs.read_vec_column(vec_file, vec_lyr, "IntCol")
     ref_vals = [1, 2, 3, 4, 5, 6]
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
+    assert vals == ref_vals
 
 
 def test_read_vec_column_FloatCol():
@@ -54,12 +51,7 @@ def test_read_vec_column_FloatCol():
     vec_lyr = "sen2_20210527_aber_att_vals"
     vals = rsgislib.vectorattrs.read_vec_column(vec_file, vec_lyr, "FloatCol")
     ref_vals = [1.1, 2.2, 3.3, 4.4, 5.5, 6.6]
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
+    assert vals == pytest.approx(ref_vals)
 
 
 def test_read_vec_column_StrCol():
@@ -69,12 +61,7 @@ def test_read_vec_column_StrCol():
     vec_lyr = "sen2_20210527_aber_att_vals"
     vals = rsgislib.vectorattrs.read_vec_column(vec_file, vec_lyr, "StrCol")
     ref_vals = ["One", "Two", "Three", "Four", "Five", "Six"]
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
+    assert vals == ref_vals
 
 
 def test_read_vec_columns():
@@ -88,236 +75,66 @@ def test_read_vec_columns():
     ref_int_vals = [1, 2, 3, 4, 5, 6]
     ref_flt_vals = [1.1, 2.2, 3.3, 4.4, 5.5, 6.6]
     ref_str_vals = ["One", "Two", "Three", "Four", "Five", "Six"]
-    vals_eq = True
-    for i in range(len(vals)):
-        if (
-            (vals[i]["IntCol"] != ref_int_vals[i])
-            and (vals[i]["FloatCol"] != ref_flt_vals[i])
-            and (vals[i]["StrCol"] != ref_str_vals[i])
-        ):
-            vals_eq = False
-            break
-
-    assert vals_eq
-
-
-def test_write_vec_column_Int(tmp_path):
-    import rsgislib.vectorutils
-    import rsgislib.vectorattrs
-    from osgeo import ogr
-
-    vec_file = os.path.join(VECTORATTRS_DATA_DIR, "sen2_20210527_aber_att_vals.geojson")
-    vec_lyr = "sen2_20210527_aber_att_vals"
-
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorutils.create_copy_vector_lyr(
-        vec_file,
-        vec_lyr,
-        out_vec_file,
-        out_vec_lyr,
-        "GEOJSON",
-        replace=True,
-        in_memory=True,
-    )
-
-    ref_vals = [1, 2, 3, 4, 5, 6]
-    rsgislib.vectorattrs.write_vec_column(
-        out_vec_file, out_vec_lyr, "testcol", ogr.OFTInteger, ref_vals
-    )
-
-    vals = rsgislib.vectorattrs.read_vec_column(out_vec_file, out_vec_lyr, "testcol")
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
+    assert [val["IntCol"] for val in vals] == ref_int_vals
+    assert [val["FloatCol"] for val in vals] == pytest.approx(ref_flt_vals)
+    assert [val["StrCol"] for val in vals] == ref_str_vals
 
 
-def test_write_vec_column_Float(tmp_path):
-    import rsgislib.vectorutils
-    import rsgislib.vectorattrs
-    from osgeo import ogr
-
-    vec_file = os.path.join(VECTORATTRS_DATA_DIR, "sen2_20210527_aber_att_vals.geojson")
-    vec_lyr = "sen2_20210527_aber_att_vals"
+WRITE_COL_CASES = [
+    (ogr.OFTInteger, [1, 2, 3, 4, 5, 6]),
+    (ogr.OFTReal, [1.1, 2.2, 3.3, 4.4, 5.5, 6.6]),
+    (ogr.OFTString, ["One", "Two", "Three", "Four", "Five", "Six"]),
+]
 
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorutils.create_copy_vector_lyr(
-        vec_file,
-        vec_lyr,
-        out_vec_file,
-        out_vec_lyr,
-        "GEOJSON",
-        replace=True,
-        in_memory=True,
-    )
 
-    ref_vals = [1.1, 2.2, 3.3, 4.4, 5.5, 6.6]
-    rsgislib.vectorattrs.write_vec_column(
-        out_vec_file, out_vec_lyr, "testcol", ogr.OFTReal, ref_vals
-    )
-
-    vals = rsgislib.vectorattrs.read_vec_column(out_vec_file, out_vec_lyr, "testcol")
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
-
-
-def test_write_vec_column_String(tmp_path):
-    import rsgislib.vectorutils
+@pytest.mark.parametrize("ogr_type, ref_vals", WRITE_COL_CASES)
+def test_write_vec_column(tmp_path, ogr_type, ref_vals):
     import rsgislib.vectorattrs
-    from osgeo import ogr
 
     vec_file = os.path.join(VECTORATTRS_DATA_DIR, "sen2_20210527_aber_att_vals.geojson")
     vec_lyr = "sen2_20210527_aber_att_vals"
 
     out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorutils.create_copy_vector_lyr(
-        vec_file,
-        vec_lyr,
-        out_vec_file,
-        out_vec_lyr,
-        "GEOJSON",
-        replace=True,
-        in_memory=True,
-    )
+    out_vec_lyr = vec_lyr
+    copy2(vec_file, out_vec_file)
 
-    ref_vals = ["One", "Two", "Three", "Four", "Five", "Six"]
     rsgislib.vectorattrs.write_vec_column(
-        out_vec_file, out_vec_lyr, "testcol", ogr.OFTString, ref_vals
-    )
-
-    vals = rsgislib.vectorattrs.read_vec_column(out_vec_file, out_vec_lyr, "testcol")
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
-
-
-def test_write_vec_column_to_layer_Int(tmp_path):
-    import rsgislib.vectorutils
-    import rsgislib.vectorattrs
-    from osgeo import ogr
-
-    vec_file = os.path.join(VECTORATTRS_DATA_DIR, "sen2_20210527_aber_att_vals.geojson")
-    vec_lyr = "sen2_20210527_aber_att_vals"
-
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorutils.create_copy_vector_lyr(
-        vec_file,
-        vec_lyr,
-        out_vec_file,
-        out_vec_lyr,
-        "GEOJSON",
-        replace=True,
-        in_memory=True,
-    )
-
-    vec_obj_ds, vec_lyr_obj = rsgislib.vectorutils.open_gdal_vec_lyr(
-        out_vec_file, out_vec_lyr, readonly=False
-    )
-
-    ref_vals = [1, 2, 3, 4, 5, 6]
-    rsgislib.vectorattrs.write_vec_column_to_layer(
-        vec_lyr_obj, "testcol", ogr.OFTInteger, ref_vals
+        out_vec_file, out_vec_lyr, "testcol", ogr_type, ref_vals
     )
-    vec_obj_ds = None
 
     vals = rsgislib.vectorattrs.read_vec_column(out_vec_file, out_vec_lyr, "testcol")
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
+    if ogr_type == ogr.OFTReal:
+        assert vals == pytest.approx(ref_vals)
+    else:
+        assert vals == ref_vals
 
 
-def test_write_vec_column_to_layer_Float(tmp_path):
+@pytest.mark.parametrize("ogr_type, ref_vals", WRITE_COL_CASES)
+def test_write_vec_column_to_layer(tmp_path, ogr_type, ref_vals):
     import rsgislib.vectorutils
     import rsgislib.vectorattrs
-    from osgeo import ogr
 
     vec_file = os.path.join(VECTORATTRS_DATA_DIR, "sen2_20210527_aber_att_vals.geojson")
     vec_lyr = "sen2_20210527_aber_att_vals"
 
     out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorutils.create_copy_vector_lyr(
-        vec_file,
-        vec_lyr,
-        out_vec_file,
-        out_vec_lyr,
-        "GEOJSON",
-        replace=True,
-        in_memory=True,
-    )
+    out_vec_lyr = vec_lyr
+    copy2(vec_file, out_vec_file)
 
     vec_obj_ds, vec_lyr_obj = rsgislib.vectorutils.open_gdal_vec_lyr(
         out_vec_file, out_vec_lyr, readonly=False
     )
 
-    ref_vals = [1.1, 2.2, 3.3, 4.4, 5.5, 6.6]
     rsgislib.vectorattrs.write_vec_column_to_layer(
-        vec_lyr_obj, "testcol", ogr.OFTReal, ref_vals
+        vec_lyr_obj, "testcol", ogr_type, ref_vals
     )
     vec_obj_ds = None
 
     vals = rsgislib.vectorattrs.read_vec_column(out_vec_file, out_vec_lyr, "testcol")
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
-
-
-def test_write_vec_column_to_layer_String(tmp_path):
-    import rsgislib.vectorutils
-    import rsgislib.vectorattrs
-    from osgeo import ogr
-
-    vec_file = os.path.join(VECTORATTRS_DATA_DIR, "sen2_20210527_aber_att_vals.geojson")
-    vec_lyr = "sen2_20210527_aber_att_vals"
-
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorutils.create_copy_vector_lyr(
-        vec_file,
-        vec_lyr,
-        out_vec_file,
-        out_vec_lyr,
-        "GEOJSON",
-        replace=True,
-        in_memory=True,
-    )
-
-    vec_obj_ds, vec_lyr_obj = rsgislib.vectorutils.open_gdal_vec_lyr(
-        out_vec_file, out_vec_lyr, readonly=False
-    )
-
-    ref_vals = ["One", "Two", "Three", "Four", "Five", "Six"]
-    rsgislib.vectorattrs.write_vec_column_to_layer(
-        vec_lyr_obj, "testcol", ogr.OFTString, ref_vals
-    )
-    vec_obj_ds = None
-
-    vals = rsgislib.vectorattrs.read_vec_column(out_vec_file, out_vec_lyr, "testcol")
-    vals_eq = True
-    for val, ref_val in zip(vals, ref_vals):
-        if val != ref_val:
-            vals_eq = False
-            break
-    assert vals_eq
+    if ogr_type == ogr.OFTReal:
+        assert vals == pytest.approx(ref_vals)
+    else:
+        assert vals == ref_vals
 
 
 def test_pop_bbox_cols(tmp_path):
@@ -396,7 +213,7 @@ def test_add_unq_numeric_col(tmp_path):
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
     vec_lyr = "degree_grid_named"
 
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
     out_vec_lyr = "out_vec"
     rsgislib.vectorattrs.add_unq_numeric_col(
         vec_file,
@@ -405,7 +222,7 @@ def test_add_unq_numeric_col(tmp_path):
         "unq_id",
         out_vec_file,
         out_vec_lyr,
-        out_format="GeoJSON",
+        out_format="GPKG",
     )
     assert os.path.exists(out_vec_file)
 
@@ -440,29 +257,8 @@ def test_add_numeric_col_lut(tmp_path):
 
 
 @pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
-def test_add_numeric_col_float(tmp_path):
-    import rsgislib.vectorattrs
-
-    vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
-    vec_lyr = "degree_grid_named"
-
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
-    out_vec_lyr = "out_vec"
-    rsgislib.vectorattrs.add_numeric_col(
-        vec_file,
-        vec_lyr,
-        "new_col",
-        out_vec_file,
-        out_vec_lyr,
-        out_val=101,
-        out_format="GeoJSON",
-        out_col_int=False,
-    )
-    assert os.path.exists(out_vec_file)
-
-
-@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
-def test_add_numeric_col_float(tmp_path):
+@pytest.mark.parametrize("out_col_int", [False, True])
+def test_add_numeric_col(tmp_path, out_col_int):
     import rsgislib.vectorattrs
 
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
@@ -478,7 +274,7 @@ def test_add_numeric_col_float(tmp_path):
         out_vec_lyr,
         out_val=101,
         out_format="GeoJSON",
-        out_col_int=True,
+        out_col_int=out_col_int,
     )
     assert os.path.exists(out_vec_file)
 
@@ -521,60 +317,24 @@ def test_add_fid_col(tmp_path):
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
     vec_lyr = "degree_grid_named"
 
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
     out_vec_lyr = "out_vec"
     rsgislib.vectorattrs.add_fid_col(
         vec_file,
         vec_lyr,
         out_vec_file,
         out_vec_lyr,
-        out_format="GeoJSON",
+        out_format="GPKG",
         out_col="new_fid",
     )
     assert os.path.exists(out_vec_file)
 
 
 @pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
-def test_get_vec_cols_as_array():
-    import rsgislib.vectorattrs
-
-    vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
-    vec_lyr = "degree_grid_named"
-
-    cols = ["xmin", "xmax", "ymin", "ymax"]
-    rsgislib.vectorattrs.get_vec_cols_as_array(
-        vec_file, vec_lyr, cols, lower_limit=None, upper_limit=None
-    )
-
-
-@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
-def test_get_vec_cols_as_array_lower_limit():
-    import rsgislib.vectorattrs
-
-    vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
-    vec_lyr = "degree_grid_named"
-
-    cols = ["xmin", "xmax", "ymin", "ymax"]
-    rsgislib.vectorattrs.get_vec_cols_as_array(
-        vec_file, vec_lyr, cols, lower_limit=50, upper_limit=None
-    )
-
-
-@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
-def test_get_vec_cols_as_array_upper_limit():
-    import rsgislib.vectorattrs
-
-    vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
-    vec_lyr = "degree_grid_named"
-
-    cols = ["xmin", "xmax", "ymin", "ymax"]
-    rsgislib.vectorattrs.get_vec_cols_as_array(
-        vec_file, vec_lyr, cols, lower_limit=None, upper_limit=100
-    )
-
-
-@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
-def test_get_vec_cols_as_array_limits():
+@pytest.mark.parametrize(
+    "lower_limit, upper_limit", [(None, None), (50, None), (None, 100), (50, 100)]
+)
+def test_get_vec_cols_as_array(lower_limit, upper_limit):
     import rsgislib.vectorattrs
 
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
@@ -582,7 +342,7 @@ def test_get_vec_cols_as_array_limits():
 
     cols = ["xmin", "xmax", "ymin", "ymax"]
     rsgislib.vectorattrs.get_vec_cols_as_array(
-        vec_file, vec_lyr, cols, lower_limit=50, upper_limit=100
+        vec_file, vec_lyr, cols, lower_limit=lower_limit, upper_limit=upper_limit
     )
 
 
@@ -593,7 +353,7 @@ def test_sort_vec_lyr(tmp_path):
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
     vec_lyr = "degree_grid_named"
 
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
     out_vec_lyr = "out_vec"
 
     rsgislib.vectorattrs.sort_vec_lyr(
@@ -603,7 +363,7 @@ def test_sort_vec_lyr(tmp_path):
         out_vec_lyr,
         sort_by="names",
         ascending=True,
-        out_format="GeoJSON",
+        out_format="GPKG",
     )
     assert os.path.exists(out_vec_file)
 
@@ -615,7 +375,7 @@ def test_sort_vec_lyr_multi_var(tmp_path):
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
     vec_lyr = "degree_grid_named"
 
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
     out_vec_lyr = "out_vec"
 
     rsgislib.vectorattrs.sort_vec_lyr(
@@ -625,7 +385,7 @@ def test_sort_vec_lyr_multi_var(tmp_path):
         out_vec_lyr,
         sort_by=["xmin", "ymin"],
         ascending=[True, True],
-        out_format="GeoJSON",
+        out_format="GPKG",
     )
 
     assert os.path.exists(out_vec_file)
@@ -638,7 +398,7 @@ def test_find_replace_str_vec_lyr(tmp_path):
     vec_file = os.path.join(DATA_DIR, "degree_grid_named.geojson")
     vec_lyr = "degree_grid_named"
 
-    out_vec_file = os.path.join(tmp_path, "out_vec.geojson")
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
     out_vec_lyr = "out_vec"
 
     rsgislib.vectorattrs.find_replace_str_vec_lyr(
@@ -648,7 +408,7 @@ def test_find_replace_str_vec_lyr(tmp_path):
         out_vec_lyr,
         cols=["names"],
         find_replace={"hello": "goodbye", "world": ""},
-        out_format="GeoJSON",
+        out_format="GPKG",
     )
 
     assert os.path.exists(out_vec_file)
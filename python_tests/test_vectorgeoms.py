@@ -26,6 +26,7 @@ VECTORUTILS_DATA_DIR = os.path.join(DATA_DIR, "vectorutils")
 VECTORGEOMS_DATA_DIR = os.path.join(DATA_DIR, "vectorgeoms")
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_convert_polygon_to_polyline(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -107,6 +108,18 @@ def test_get_pt_on_line():
     assert (abs(new_pt_x - 376.7767) < 1) and (abs(new_pt_y - 676.7767) < 1)
 
 
+def test_get_pt_on_line_vec():
+    import numpy
+    import rsgislib.vectorgeoms
+
+    new_pt_xs, new_pt_ys = rsgislib.vectorgeoms.get_pt_on_line_vec(
+        200, 500, 1200, 1500, numpy.array([0, 250])
+    )
+
+    assert (abs(new_pt_xs[0] - 200.0) < 1) and (abs(new_pt_ys[0] - 500.0) < 1)
+    assert (abs(new_pt_xs[1] - 376.7767) < 1) and (abs(new_pt_ys[1] - 676.7767) < 1)
+
+
 def test_find_pt_to_side_right():
     import rsgislib.vectorgeoms
     from osgeo import ogr
@@ -147,6 +160,7 @@ def test_find_pt_to_side_left():
     assert (abs(new_pt_x - 200.0000) < 1) and (abs(new_pt_y - 853.5534) < 1)
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_create_orthg_lines_right(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -171,6 +185,7 @@ def test_create_orthg_lines_right(tmp_path):
     assert os.path.exists(out_vec_file)
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_create_orthg_lines_left(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -195,6 +210,7 @@ def test_create_orthg_lines_left(tmp_path):
     assert os.path.exists(out_vec_file)
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_closest_line_intersection(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -226,6 +242,7 @@ def test_closest_line_intersection(tmp_path):
     assert os.path.exists(out_vec_file)
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_line_intersection_range(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -257,6 +274,7 @@ def test_line_intersection_range(tmp_path):
     assert os.path.exists(out_vec_file)
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_scnd_line_intersection_range(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -288,6 +306,109 @@ def test_scnd_line_intersection_range(tmp_path):
     assert os.path.exists(out_vec_file)
 
 
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
+def test_scnd_line_intersection_range_adjacent_polys(tmp_path):
+    import rsgislib.vectorgeoms
+
+    # Two polygons sharing the edge at x=1 so the line crosses the shared
+    # edge once and leaves the second polygon at x=2.
+    vec_objs_file = os.path.join(tmp_path, "adj_polys.geojson")
+    vec_objs_lyr = "adj_polys"
+    geopandas.GeoDataFrame(
+        {"id": [1, 2]},
+        geometry=geopandas.GeoSeries.from_wkt(
+            [
+                "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))",
+                "POLYGON ((1 0, 2 0, 2 1, 1 1, 1 0))",
+            ]
+        ),
+        crs="EPSG:27700",
+    ).to_file(vec_objs_file, driver="GeoJSON")
+
+    vec_line_file = os.path.join(tmp_path, "lines.geojson")
+    vec_line_lyr = "lines"
+    geopandas.GeoDataFrame(
+        {"uid": [1], "start_x": [0.5], "start_y": [0.5]},
+        geometry=geopandas.GeoSeries.from_wkt(["LINESTRING (0.5 0.5, 3 0.5)"]),
+        crs="EPSG:27700",
+    ).to_file(vec_line_file, driver="GeoJSON")
+
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
+    out_vec_lyr = "out_vec"
+
+    rsgislib.vectorgeoms.scnd_line_intersection_range(
+        vec_line_file,
+        vec_line_lyr,
+        vec_objs_file,
+        vec_objs_lyr,
+        out_vec_file,
+        out_vec_lyr,
+        out_format="GPKG",
+        n_cores=1,
+    )
+
+    out_gdf = geopandas.read_file(out_vec_file, layer=out_vec_lyr)
+    assert len(out_gdf) == 1
+    assert out_gdf["end_x"].iloc[0] == pytest.approx(2.0)
+    assert out_gdf["len"].iloc[0] == pytest.approx(1.5)
+
+
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
+def test_line_intersection_range_values(tmp_path):
+    from osgeo import ogr
+
+    import rsgislib.vectorgeoms
+
+    vec_objs_file = os.path.join(tmp_path, "polys.geojson")
+    vec_objs_lyr = "polys"
+    geopandas.GeoDataFrame(
+        {"id": [1]},
+        geometry=geopandas.GeoSeries.from_wkt(["POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))"]),
+        crs="EPSG:27700",
+    ).to_file(vec_objs_file, driver="GeoJSON")
+
+    # The first line crosses the polygon at x=0 and x=2, the second misses it.
+    vec_line_file = os.path.join(tmp_path, "lines.geojson")
+    vec_line_lyr = "lines"
+    geopandas.GeoDataFrame(
+        {"uid": [7, 9], "start_x": [-1.0, -1.0], "start_y": [1.0, 5.0]},
+        geometry=geopandas.GeoSeries.from_wkt(
+            ["LINESTRING (-1 1, 3 1)", "LINESTRING (-1 5, 3 5)"]
+        ),
+        crs="EPSG:27700",
+    ).to_file(vec_line_file, driver="GeoJSON")
+
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
+    out_vec_lyr = "out_vec"
+
+    rsgislib.vectorgeoms.line_intersection_range(
+        vec_line_file,
+        vec_line_lyr,
+        vec_objs_file,
+        vec_objs_lyr,
+        out_vec_file,
+        out_vec_lyr,
+        out_format="GPKG",
+        n_cores=1,
+    )
+
+    out_gdf = geopandas.read_file(out_vec_file, layer=out_vec_lyr)
+    assert list(out_gdf["uid"]) == [7]
+    assert out_gdf["len"].iloc[0] == pytest.approx(2.0)
+    assert list(out_gdf.geometry.iloc[0].coords) == [(0.0, 1.0), (2.0, 1.0)]
+
+    # Check the layer schema matches the one previously created through OGR.
+    vec_ds = ogr.Open(out_vec_file)
+    vec_lyr_defn = vec_ds.GetLayerByName(out_vec_lyr).GetLayerDefn()
+    assert vec_lyr_defn.GetGeomType() == ogr.wkbLineString
+    uid_fld_defn = vec_lyr_defn.GetFieldDefn(vec_lyr_defn.GetFieldIndex("uid"))
+    assert uid_fld_defn.GetType() == ogr.OFTInteger
+    len_fld_defn = vec_lyr_defn.GetFieldDefn(vec_lyr_defn.GetFieldIndex("len"))
+    assert len_fld_defn.GetType() == ogr.OFTReal
+    vec_ds = None
+
+
+@pytest.mark.skipif(GEOPANDAS_NOT_AVAIL, reason="geopandas dependency not available")
 def test_calc_poly_centroids(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -448,6 +569,7 @@ def test_get_vec_lyr_as_pts():
     pts = rsgislib.vectorgeoms.get_vec_lyr_as_pts(vec_file, vec_lyr)
 
     assert len(pts) == 41
+    assert pts.shape == (41, 2)
 
 
 @pytest.mark.skipif(ALPHASHAPE_NOT_AVAIL, reason="alphashape dependency not available")
@@ -536,6 +658,29 @@ def test_simplify_geometries(tmp_path):
     assert os.path.exists(out_vec_file)
 
 
+def test_simplify_geometries_topo(tmp_path):
+    import rsgislib.vectorgeoms
+
+    vec_file = os.path.join(DATA_DIR, "aber_osgb_single_poly.geojson")
+    vec_lyr = "aber_osgb_single_poly"
+
+    out_vec_file = os.path.join(tmp_path, "out_vec.gpkg")
+    out_vec_lyr = "out_vec"
+
+    rsgislib.vectorgeoms.simplify_geometries(
+        vec_file,
+        vec_lyr,
+        20,
+        "GPKG",
+        out_vec_file,
+        out_vec_lyr,
+        del_exist_vec=False,
+        preserve_topology=True,
+    )
+
+    assert os.path.exists(out_vec_file)
+
+
 def test_delete_polygon_holes(tmp_path):
     import rsgislib.vectorgeoms
 
@@ -742,6 +887,28 @@ def test_get_geom_pts():
     assert len(pts) == 6
 
 
+def test_get_geom_pts_arr():
+    import rsgislib.vectorgeoms
+    from osgeo import ogr
+
+    # Create ring
+    ring = ogr.Geometry(ogr.wkbLinearRing)
+    ring.AddPoint(1179091.1646903288, 712782.8838459781)
+    ring.AddPoint(1161053.0218226474, 667456.2684348812)
+    ring.AddPoint(1214704.933941905, 641092.8288590391)
+    ring.AddPoint(1228580.428455506, 682719.3123998424)
+    ring.AddPoint(1218405.0658121984, 721108.1805541387)
+    ring.AddPoint(1179091.1646903288, 712782.8838459781)
+
+    # Create polygon
+    poly = ogr.Geometry(ogr.wkbPolygon)
+    poly.AddGeometry(ring)
+
+    pts = rsgislib.vectorgeoms.get_geom_pts_arr(poly)
+
+    assert pts.shape == (6, 3)
+
+
 def test_vec_intersects_vec():
     import rsgislib.vectorgeoms
 